@@ -1,13 +1,22 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
 # source: chupacabra_client/protos/chupacabra.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'chupacabra_client/protos/chupacabra.proto'
+)
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -16,633 +25,33 @@ _sym_db = _symbol_database.Default()
 from chupacabra_client.protos import game_structs_pb2 as chupacabra__client_dot_protos_dot_game__structs__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='chupacabra_client/protos/chupacabra.proto',
-  package='chupacabra',
-  syntax='proto3',
-  serialized_pb=_b('\n)chupacabra_client/protos/chupacabra.proto\x12\nchupacabra\x1a+chupacabra_client/protos/game_structs.proto\"R\n\x0bUserRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t\x12\x10\n\x08nickname\x18\x04 \x01(\t\"0\n\x0cUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"4\n\x0eSessionRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"G\n\x0fSessionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\"F\n\x0bGameRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tgame_type\x18\x02 \x01(\t\x12\x10\n\x08username\x18\x03 \x01(\t\"`\n\x11GameRequestStatus\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tgame_type\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\t\x12\x10\n\x08username\x18\x04 \x01(\t\"o\n\x16\x41vailableGamesResponse\x12\x33\n\x0c\x64\x65scriptions\x18\x01 \x03(\x0b\x32\x1d.game_structs.GameDescription\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\"Z\n\x0ePlayerGameInfo\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tgame_type\x18\x02 \x01(\t\x12\x0f\n\x07game_id\x18\x03 \x01(\t\x12\x10\n\x08username\x18\x04 \x01(\t\"^\n\x0bMoveRequest\x12-\n\tgame_info\x18\x01 \x01(\x0b\x32\x1a.chupacabra.PlayerGameInfo\x12 \n\x04move\x18\x02 \x01(\x0b\x32\x12.game_structs.Move\"A\n\x10GameStateRequest\x12-\n\tgame_info\x18\x01 \x01(\x0b\x32\x1a.chupacabra.PlayerGameInfo2\xe0\x05\n\x10\x43hupacabraServer\x12\x43\n\x0cRegisterUser\x12\x17.chupacabra.UserRequest\x1a\x18.chupacabra.UserResponse\"\x00\x12I\n\x0c\x42\x65ginSession\x12\x1a.chupacabra.SessionRequest\x1a\x1b.chupacabra.SessionResponse\"\x00\x12V\n\x12ListAvailableGames\x12\x1a.chupacabra.PlayerGameInfo\x1a\".chupacabra.AvailableGamesResponse\"\x00\x12K\n\x0bRequestGame\x12\x17.chupacabra.GameRequest\x1a!.game_structs.GameRequestResponse\"\x00\x12\\\n\x10\x43heckGameRequest\x12\x1d.chupacabra.GameRequestStatus\x1a\'.game_structs.GameRequestStatusResponse\"\x00\x12N\n\x0cGetGameState\x12\x1a.chupacabra.PlayerGameInfo\x1a .game_structs.GameStatusResponse\"\x00\x12Q\n\x0f\x43heckLegalMoves\x12\x1a.chupacabra.PlayerGameInfo\x1a .game_structs.LegalMovesResponse\"\x00\x12G\n\x08MakeMove\x12\x17.chupacabra.MoveRequest\x1a .game_structs.GameStatusResponse\"\x00\x12M\n\x0b\x46orfeitGame\x12\x1a.chupacabra.PlayerGameInfo\x1a .game_structs.GameStatusResponse\"\x00\x62\x06proto3')
-  ,
-  dependencies=[chupacabra__client_dot_protos_dot_game__structs__pb2.DESCRIPTOR,])
-
-
-
-
-_USERREQUEST = _descriptor.Descriptor(
-  name='UserRequest',
-  full_name='chupacabra.UserRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='username', full_name='chupacabra.UserRequest.username', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='email', full_name='chupacabra.UserRequest.email', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='password', full_name='chupacabra.UserRequest.password', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='nickname', full_name='chupacabra.UserRequest.nickname', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=102,
-  serialized_end=184,
-)
-
-
-_USERRESPONSE = _descriptor.Descriptor(
-  name='UserResponse',
-  full_name='chupacabra.UserResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='success', full_name='chupacabra.UserResponse.success', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='chupacabra.UserResponse.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=186,
-  serialized_end=234,
-)
-
-
-_SESSIONREQUEST = _descriptor.Descriptor(
-  name='SessionRequest',
-  full_name='chupacabra.SessionRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='username', full_name='chupacabra.SessionRequest.username', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='password', full_name='chupacabra.SessionRequest.password', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=236,
-  serialized_end=288,
-)
-
-
-_SESSIONRESPONSE = _descriptor.Descriptor(
-  name='SessionResponse',
-  full_name='chupacabra.SessionResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='success', full_name='chupacabra.SessionResponse.success', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='chupacabra.SessionResponse.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='chupacabra.SessionResponse.session_id', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=290,
-  serialized_end=361,
-)
-
-
-_GAMEREQUEST = _descriptor.Descriptor(
-  name='GameRequest',
-  full_name='chupacabra.GameRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='chupacabra.GameRequest.session_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_type', full_name='chupacabra.GameRequest.game_type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='username', full_name='chupacabra.GameRequest.username', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=363,
-  serialized_end=433,
-)
-
-
-_GAMEREQUESTSTATUS = _descriptor.Descriptor(
-  name='GameRequestStatus',
-  full_name='chupacabra.GameRequestStatus',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='chupacabra.GameRequestStatus.session_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_type', full_name='chupacabra.GameRequestStatus.game_type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='request_id', full_name='chupacabra.GameRequestStatus.request_id', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='username', full_name='chupacabra.GameRequestStatus.username', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=435,
-  serialized_end=531,
-)
-
-
-_AVAILABLEGAMESRESPONSE = _descriptor.Descriptor(
-  name='AvailableGamesResponse',
-  full_name='chupacabra.AvailableGamesResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='descriptions', full_name='chupacabra.AvailableGamesResponse.descriptions', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='success', full_name='chupacabra.AvailableGamesResponse.success', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='chupacabra.AvailableGamesResponse.message', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=533,
-  serialized_end=644,
-)
-
-
-_PLAYERGAMEINFO = _descriptor.Descriptor(
-  name='PlayerGameInfo',
-  full_name='chupacabra.PlayerGameInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='chupacabra.PlayerGameInfo.session_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_type', full_name='chupacabra.PlayerGameInfo.game_type', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_id', full_name='chupacabra.PlayerGameInfo.game_id', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='username', full_name='chupacabra.PlayerGameInfo.username', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=646,
-  serialized_end=736,
-)
-
-
-_MOVEREQUEST = _descriptor.Descriptor(
-  name='MoveRequest',
-  full_name='chupacabra.MoveRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='game_info', full_name='chupacabra.MoveRequest.game_info', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='move', full_name='chupacabra.MoveRequest.move', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=738,
-  serialized_end=832,
-)
-
-
-_GAMESTATEREQUEST = _descriptor.Descriptor(
-  name='GameStateRequest',
-  full_name='chupacabra.GameStateRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='game_info', full_name='chupacabra.GameStateRequest.game_info', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=834,
-  serialized_end=899,
-)
-
-_AVAILABLEGAMESRESPONSE.fields_by_name['descriptions'].message_type = chupacabra__client_dot_protos_dot_game__structs__pb2._GAMEDESCRIPTION
-_MOVEREQUEST.fields_by_name['game_info'].message_type = _PLAYERGAMEINFO
-_MOVEREQUEST.fields_by_name['move'].message_type = chupacabra__client_dot_protos_dot_game__structs__pb2._MOVE
-_GAMESTATEREQUEST.fields_by_name['game_info'].message_type = _PLAYERGAMEINFO
-DESCRIPTOR.message_types_by_name['UserRequest'] = _USERREQUEST
-DESCRIPTOR.message_types_by_name['UserResponse'] = _USERRESPONSE
-DESCRIPTOR.message_types_by_name['SessionRequest'] = _SESSIONREQUEST
-DESCRIPTOR.message_types_by_name['SessionResponse'] = _SESSIONRESPONSE
-DESCRIPTOR.message_types_by_name['GameRequest'] = _GAMEREQUEST
-DESCRIPTOR.message_types_by_name['GameRequestStatus'] = _GAMEREQUESTSTATUS
-DESCRIPTOR.message_types_by_name['AvailableGamesResponse'] = _AVAILABLEGAMESRESPONSE
-DESCRIPTOR.message_types_by_name['PlayerGameInfo'] = _PLAYERGAMEINFO
-DESCRIPTOR.message_types_by_name['MoveRequest'] = _MOVEREQUEST
-DESCRIPTOR.message_types_by_name['GameStateRequest'] = _GAMESTATEREQUEST
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-UserRequest = _reflection.GeneratedProtocolMessageType('UserRequest', (_message.Message,), dict(
-  DESCRIPTOR = _USERREQUEST,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.UserRequest)
-  ))
-_sym_db.RegisterMessage(UserRequest)
-
-UserResponse = _reflection.GeneratedProtocolMessageType('UserResponse', (_message.Message,), dict(
-  DESCRIPTOR = _USERRESPONSE,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.UserResponse)
-  ))
-_sym_db.RegisterMessage(UserResponse)
-
-SessionRequest = _reflection.GeneratedProtocolMessageType('SessionRequest', (_message.Message,), dict(
-  DESCRIPTOR = _SESSIONREQUEST,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.SessionRequest)
-  ))
-_sym_db.RegisterMessage(SessionRequest)
-
-SessionResponse = _reflection.GeneratedProtocolMessageType('SessionResponse', (_message.Message,), dict(
-  DESCRIPTOR = _SESSIONRESPONSE,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.SessionResponse)
-  ))
-_sym_db.RegisterMessage(SessionResponse)
-
-GameRequest = _reflection.GeneratedProtocolMessageType('GameRequest', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEREQUEST,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.GameRequest)
-  ))
-_sym_db.RegisterMessage(GameRequest)
-
-GameRequestStatus = _reflection.GeneratedProtocolMessageType('GameRequestStatus', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEREQUESTSTATUS,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.GameRequestStatus)
-  ))
-_sym_db.RegisterMessage(GameRequestStatus)
-
-AvailableGamesResponse = _reflection.GeneratedProtocolMessageType('AvailableGamesResponse', (_message.Message,), dict(
-  DESCRIPTOR = _AVAILABLEGAMESRESPONSE,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.AvailableGamesResponse)
-  ))
-_sym_db.RegisterMessage(AvailableGamesResponse)
-
-PlayerGameInfo = _reflection.GeneratedProtocolMessageType('PlayerGameInfo', (_message.Message,), dict(
-  DESCRIPTOR = _PLAYERGAMEINFO,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.PlayerGameInfo)
-  ))
-_sym_db.RegisterMessage(PlayerGameInfo)
-
-MoveRequest = _reflection.GeneratedProtocolMessageType('MoveRequest', (_message.Message,), dict(
-  DESCRIPTOR = _MOVEREQUEST,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.MoveRequest)
-  ))
-_sym_db.RegisterMessage(MoveRequest)
-
-GameStateRequest = _reflection.GeneratedProtocolMessageType('GameStateRequest', (_message.Message,), dict(
-  DESCRIPTOR = _GAMESTATEREQUEST,
-  __module__ = 'chupacabra_client.protos.chupacabra_pb2'
-  # @@protoc_insertion_point(class_scope:chupacabra.GameStateRequest)
-  ))
-_sym_db.RegisterMessage(GameStateRequest)
-
-
-
-_CHUPACABRASERVER = _descriptor.ServiceDescriptor(
-  name='ChupacabraServer',
-  full_name='chupacabra.ChupacabraServer',
-  file=DESCRIPTOR,
-  index=0,
-  options=None,
-  serialized_start=902,
-  serialized_end=1638,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='RegisterUser',
-    full_name='chupacabra.ChupacabraServer.RegisterUser',
-    index=0,
-    containing_service=None,
-    input_type=_USERREQUEST,
-    output_type=_USERRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='BeginSession',
-    full_name='chupacabra.ChupacabraServer.BeginSession',
-    index=1,
-    containing_service=None,
-    input_type=_SESSIONREQUEST,
-    output_type=_SESSIONRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='ListAvailableGames',
-    full_name='chupacabra.ChupacabraServer.ListAvailableGames',
-    index=2,
-    containing_service=None,
-    input_type=_PLAYERGAMEINFO,
-    output_type=_AVAILABLEGAMESRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='RequestGame',
-    full_name='chupacabra.ChupacabraServer.RequestGame',
-    index=3,
-    containing_service=None,
-    input_type=_GAMEREQUEST,
-    output_type=chupacabra__client_dot_protos_dot_game__structs__pb2._GAMEREQUESTRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='CheckGameRequest',
-    full_name='chupacabra.ChupacabraServer.CheckGameRequest',
-    index=4,
-    containing_service=None,
-    input_type=_GAMEREQUESTSTATUS,
-    output_type=chupacabra__client_dot_protos_dot_game__structs__pb2._GAMEREQUESTSTATUSRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='GetGameState',
-    full_name='chupacabra.ChupacabraServer.GetGameState',
-    index=5,
-    containing_service=None,
-    input_type=_PLAYERGAMEINFO,
-    output_type=chupacabra__client_dot_protos_dot_game__structs__pb2._GAMESTATUSRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='CheckLegalMoves',
-    full_name='chupacabra.ChupacabraServer.CheckLegalMoves',
-    index=6,
-    containing_service=None,
-    input_type=_PLAYERGAMEINFO,
-    output_type=chupacabra__client_dot_protos_dot_game__structs__pb2._LEGALMOVESRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='MakeMove',
-    full_name='chupacabra.ChupacabraServer.MakeMove',
-    index=7,
-    containing_service=None,
-    input_type=_MOVEREQUEST,
-    output_type=chupacabra__client_dot_protos_dot_game__structs__pb2._GAMESTATUSRESPONSE,
-    options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='ForfeitGame',
-    full_name='chupacabra.ChupacabraServer.ForfeitGame',
-    index=8,
-    containing_service=None,
-    input_type=_PLAYERGAMEINFO,
-    output_type=chupacabra__client_dot_protos_dot_game__structs__pb2._GAMESTATUSRESPONSE,
-    options=None,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_CHUPACABRASERVER)
-
-DESCRIPTOR.services_by_name['ChupacabraServer'] = _CHUPACABRASERVER
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)chupacabra_client/protos/chupacabra.proto\x12\nchupacabra\x1a+chupacabra_client/protos/game_structs.proto\"R\n\x0bUserRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t\x12\x10\n\x08nickname\x18\x04 \x01(\t\"0\n\x0cUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"4\n\x0eSessionRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"G\n\x0fSessionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\"F\n\x0bGameRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tgame_type\x18\x02 \x01(\t\x12\x10\n\x08username\x18\x03 \x01(\t\"`\n\x11GameRequestStatus\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tgame_type\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\t\x12\x10\n\x08username\x18\x04 \x01(\t\"o\n\x16\x41vailableGamesResponse\x12\x33\n\x0c\x64\x65scriptions\x18\x01 \x03(\x0b\x32\x1d.game_structs.GameDescription\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\"Z\n\x0ePlayerGameInfo\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tgame_type\x18\x02 \x01(\t\x12\x0f\n\x07game_id\x18\x03 \x01(\t\x12\x10\n\x08username\x18\x04 \x01(\t\"^\n\x0bMoveRequest\x12-\n\tgame_info\x18\x01 \x01(\x0b\x32\x1a.chupacabra.PlayerGameInfo\x12 \n\x04move\x18\x02 \x01(\x0b\x32\x12.game_structs.Move\"A\n\x10GameStateRequest\x12-\n\tgame_info\x18\x01 \x01(\x0b\x32\x1a.chupacabra.PlayerGameInfo2\xe6\x07\n\x10\x43hupacabraServer\x12\x43\n\x0cRegisterUser\x12\x17.chupacabra.UserRequest\x1a\x18.chupacabra.UserResponse\"\x00\x12I\n\x0c\x42\x65ginSession\x12\x1a.chupacabra.SessionRequest\x1a\x1b.chupacabra.SessionResponse\"\x00\x12V\n\x12ListAvailableGames\x12\x1a.chupacabra.PlayerGameInfo\x1a\".chupacabra.AvailableGamesResponse\"\x00\x12K\n\x0bRequestGame\x12\x17.chupacabra.GameRequest\x1a!.game_structs.GameRequestResponse\"\x00\x12\\\n\x10\x43heckGameRequest\x12\x1d.chupacabra.GameRequestStatus\x1a\'.game_structs.GameRequestStatusResponse\"\x00\x12Y\n\x0bWaitForGame\x12\x1d.chupacabra.GameRequestStatus\x1a\'.game_structs.GameRequestStatusResponse\"\x00\x30\x01\x12N\n\x0cGetGameState\x12\x1a.chupacabra.PlayerGameInfo\x1a .game_structs.GameStatusResponse\"\x00\x12M\n\tWatchGame\x12\x1a.chupacabra.PlayerGameInfo\x1a .game_structs.GameStatusResponse\"\x00\x30\x01\x12Q\n\x0f\x43heckLegalMoves\x12\x1a.chupacabra.PlayerGameInfo\x1a .game_structs.LegalMovesResponse\"\x00\x12G\n\x08MakeMove\x12\x17.chupacabra.MoveRequest\x1a .game_structs.GameStatusResponse\"\x00\x12M\n\x0b\x46orfeitGame\x12\x1a.chupacabra.PlayerGameInfo\x1a .game_structs.GameStatusResponse\"\x00\x12Z\n\x13ListPendingRequests\x12\x1a.chupacabra.PlayerGameInfo\x1a%.game_structs.PendingRequestsResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chupacabra_client.protos.chupacabra_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_USERREQUEST']._serialized_start=102
+  _globals['_USERREQUEST']._serialized_end=184
+  _globals['_USERRESPONSE']._serialized_start=186
+  _globals['_USERRESPONSE']._serialized_end=234
+  _globals['_SESSIONREQUEST']._serialized_start=236
+  _globals['_SESSIONREQUEST']._serialized_end=288
+  _globals['_SESSIONRESPONSE']._serialized_start=290
+  _globals['_SESSIONRESPONSE']._serialized_end=361
+  _globals['_GAMEREQUEST']._serialized_start=363
+  _globals['_GAMEREQUEST']._serialized_end=433
+  _globals['_GAMEREQUESTSTATUS']._serialized_start=435
+  _globals['_GAMEREQUESTSTATUS']._serialized_end=531
+  _globals['_AVAILABLEGAMESRESPONSE']._serialized_start=533
+  _globals['_AVAILABLEGAMESRESPONSE']._serialized_end=644
+  _globals['_PLAYERGAMEINFO']._serialized_start=646
+  _globals['_PLAYERGAMEINFO']._serialized_end=736
+  _globals['_MOVEREQUEST']._serialized_start=738
+  _globals['_MOVEREQUEST']._serialized_end=832
+  _globals['_GAMESTATEREQUEST']._serialized_start=834
+  _globals['_GAMESTATEREQUEST']._serialized_end=899
+  _globals['_CHUPACABRASERVER']._serialized_start=902
+  _globals['_CHUPACABRASERVER']._serialized_end=1900
 # @@protoc_insertion_point(module_scope)
@@ -1,183 +1,586 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
 import grpc
+import warnings
 
 from chupacabra_client.protos import chupacabra_pb2 as chupacabra__client_dot_protos_dot_chupacabra__pb2
 from chupacabra_client.protos import game_structs_pb2 as chupacabra__client_dot_protos_dot_game__structs__pb2
 
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
 
-class ChupacabraServerStub(object):
-  """Defines the service
-  """
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
 
-  def __init__(self, channel):
-    """Constructor.
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in chupacabra_client/protos/chupacabra_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
 
-    Args:
-      channel: A grpc.Channel.
-    """
-    self.RegisterUser = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/RegisterUser',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserRequest.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserResponse.FromString,
-        )
-    self.BeginSession = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/BeginSession',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionRequest.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionResponse.FromString,
-        )
-    self.ListAvailableGames = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/ListAvailableGames',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.AvailableGamesResponse.FromString,
-        )
-    self.RequestGame = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/RequestGame',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequest.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.FromString,
-        )
-    self.CheckGameRequest = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/CheckGameRequest',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
-        )
-    self.GetGameState = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/GetGameState',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
-        )
-    self.CheckLegalMoves = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/CheckLegalMoves',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.FromString,
-        )
-    self.MakeMove = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/MakeMove',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.MoveRequest.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
-        )
-    self.ForfeitGame = channel.unary_unary(
-        '/chupacabra.ChupacabraServer/ForfeitGame',
-        request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
-        )
-
-
-class ChupacabraServerServicer(object):
-  """Defines the service
-  """
-
-  def RegisterUser(self, request, context):
-    """Register a new user
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def BeginSession(self, request, context):
-    """Begin a new session
+class ChupacabraServerStub:
+    """Defines the service
     """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def ListAvailableGames(self, request, context):
-    """List games available on the server
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    def __init__(self, channel):
+        """Constructor.
 
-  def RequestGame(self, request, context):
-    """Request a new game
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.RegisterUser = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/RegisterUser',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserResponse.FromString,
+                _registered_method=True)
+        self.BeginSession = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/BeginSession',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionResponse.FromString,
+                _registered_method=True)
+        self.ListAvailableGames = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/ListAvailableGames',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.AvailableGamesResponse.FromString,
+                _registered_method=True)
+        self.RequestGame = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/RequestGame',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.FromString,
+                _registered_method=True)
+        self.CheckGameRequest = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/CheckGameRequest',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+                _registered_method=True)
+        self.WaitForGame = channel.unary_stream(
+                '/chupacabra.ChupacabraServer/WaitForGame',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+                _registered_method=True)
+        self.GetGameState = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/GetGameState',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.WatchGame = channel.unary_stream(
+                '/chupacabra.ChupacabraServer/WatchGame',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.CheckLegalMoves = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/CheckLegalMoves',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.FromString,
+                _registered_method=True)
+        self.MakeMove = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/MakeMove',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.MoveRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.ForfeitGame = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/ForfeitGame',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.ListPendingRequests = channel.unary_unary(
+                '/chupacabra.ChupacabraServer/ListPendingRequests',
+                request_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.PendingRequestsResponse.FromString,
+                _registered_method=True)
 
-  def CheckGameRequest(self, request, context):
-    """Check if the game is available
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def GetGameState(self, request, context):
-    """Get the game state
+class ChupacabraServerServicer:
+    """Defines the service
     """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def CheckLegalMoves(self, request, context):
-    """See what legal moves are available
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    def RegisterUser(self, request, context):
+        """Register a new user
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
 
-  def MakeMove(self, request, context):
-    """Try to make a move
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    def BeginSession(self, request, context):
+        """Begin a new session
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
 
-  def ForfeitGame(self, request, context):
-    """Forfeit the game
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    def ListAvailableGames(self, request, context):
+        """List games available on the server
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RequestGame(self, request, context):
+        """Request a new game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckGameRequest(self, request, context):
+        """Check if the game is available
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WaitForGame(self, request, context):
+        """Wait for the game to be available, instead of checking again and again
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetGameState(self, request, context):
+        """Get the game state
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchGame(self, request, context):
+        """Watch the game, getting its state now and again each time it changes
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckLegalMoves(self, request, context):
+        """See what legal moves are available
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MakeMove(self, request, context):
+        """Try to make a move
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ForfeitGame(self, request, context):
+        """Forfeit the game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListPendingRequests(self, request, context):
+        """List the game requests that have not expired
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
 
 
 def add_ChupacabraServerServicer_to_server(servicer, server):
-  rpc_method_handlers = {
-      'RegisterUser': grpc.unary_unary_rpc_method_handler(
-          servicer.RegisterUser,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserRequest.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserResponse.SerializeToString,
-      ),
-      'BeginSession': grpc.unary_unary_rpc_method_handler(
-          servicer.BeginSession,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionRequest.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionResponse.SerializeToString,
-      ),
-      'ListAvailableGames': grpc.unary_unary_rpc_method_handler(
-          servicer.ListAvailableGames,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.AvailableGamesResponse.SerializeToString,
-      ),
-      'RequestGame': grpc.unary_unary_rpc_method_handler(
-          servicer.RequestGame,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequest.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.SerializeToString,
-      ),
-      'CheckGameRequest': grpc.unary_unary_rpc_method_handler(
-          servicer.CheckGameRequest,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.SerializeToString,
-      ),
-      'GetGameState': grpc.unary_unary_rpc_method_handler(
-          servicer.GetGameState,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
-      ),
-      'CheckLegalMoves': grpc.unary_unary_rpc_method_handler(
-          servicer.CheckLegalMoves,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.SerializeToString,
-      ),
-      'MakeMove': grpc.unary_unary_rpc_method_handler(
-          servicer.MakeMove,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.MoveRequest.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
-      ),
-      'ForfeitGame': grpc.unary_unary_rpc_method_handler(
-          servicer.ForfeitGame,
-          request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
-      ),
-  }
-  generic_handler = grpc.method_handlers_generic_handler(
-      'chupacabra.ChupacabraServer', rpc_method_handlers)
-  server.add_generic_rpc_handlers((generic_handler,))
+    rpc_method_handlers = {
+            'RegisterUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.RegisterUser,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.UserResponse.SerializeToString,
+            ),
+            'BeginSession': grpc.unary_unary_rpc_method_handler(
+                    servicer.BeginSession,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionResponse.SerializeToString,
+            ),
+            'ListAvailableGames': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListAvailableGames,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.AvailableGamesResponse.SerializeToString,
+            ),
+            'RequestGame': grpc.unary_unary_rpc_method_handler(
+                    servicer.RequestGame,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.SerializeToString,
+            ),
+            'CheckGameRequest': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckGameRequest,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.SerializeToString,
+            ),
+            'WaitForGame': grpc.unary_stream_rpc_method_handler(
+                    servicer.WaitForGame,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.SerializeToString,
+            ),
+            'GetGameState': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetGameState,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'WatchGame': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchGame,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'CheckLegalMoves': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckLegalMoves,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.SerializeToString,
+            ),
+            'MakeMove': grpc.unary_unary_rpc_method_handler(
+                    servicer.MakeMove,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.MoveRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'ForfeitGame': grpc.unary_unary_rpc_method_handler(
+                    servicer.ForfeitGame,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'ListPendingRequests': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListPendingRequests,
+                    request_deserializer=chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.PendingRequestsResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'chupacabra.ChupacabraServer', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('chupacabra.ChupacabraServer', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ChupacabraServer:
+    """Defines the service
+    """
+
+    @staticmethod
+    def RegisterUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/RegisterUser',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.UserRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.UserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BeginSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/BeginSession',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.SessionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListAvailableGames(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/ListAvailableGames',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.AvailableGamesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RequestGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/RequestGame',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckGameRequest(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/CheckGameRequest',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WaitForGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/WaitForGame',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.GameRequestStatus.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetGameState(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/GetGameState',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/WatchGame',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckLegalMoves(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/CheckLegalMoves',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def MakeMove(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/MakeMove',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.MoveRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ForfeitGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/ForfeitGame',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListPendingRequests(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chupacabra.ChupacabraServer/ListPendingRequests',
+            chupacabra__client_dot_protos_dot_chupacabra__pb2.PlayerGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.PendingRequestsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
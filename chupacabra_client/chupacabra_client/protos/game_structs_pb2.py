@@ -1,13 +1,22 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
 # source: chupacabra_client/protos/game_structs.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'chupacabra_client/protos/game_structs.proto'
+)
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -15,1031 +24,51 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='chupacabra_client/protos/game_structs.proto',
-  package='game_structs',
-  syntax='proto3',
-  serialized_pb=_b('\n+chupacabra_client/protos/game_structs.proto\x12\x0cgame_structs\"C\n\x0fMoveDescription\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05modes\x18\x03 \x03(\t\"4\n\x0fGameDescription\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\"A\n\x11GameMovesResponse\x12,\n\x05moves\x18\x01 \x03(\x0b\x32\x1d.game_structs.MoveDescription\"E\n\x12LegalMovesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\r\n\x05moves\x18\x03 \x03(\t\")\n\nCoordinate\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05\"E\n\x0b\x43oordinates\x12\x0c\n\x04name\x18\x01 \x01(\t\x12(\n\x06values\x18\x02 \x03(\x0b\x32\x18.game_structs.Coordinate\"`\n\rGamePieceMove\x12\x10\n\x08piece_id\x18\x01 \x01(\t\x12,\n\tlocations\x18\x02 \x03(\x0b\x32\x19.game_structs.Coordinates\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\"o\n\x04Move\x12\x11\n\tmove_name\x18\x01 \x01(\t\x12\x11\n\tplayer_id\x18\x02 \x01(\t\x12\x30\n\x0bpiece_moves\x18\x03 \x03(\x0b\x32\x1b.game_structs.GamePieceMove\x12\x0f\n\x07\x63omment\x18\x04 \x01(\t\"b\n\tGamePiece\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06player\x18\x03 \x01(\t\x12+\n\x08location\x18\x04 \x01(\x0b\x32\x19.game_structs.Coordinates\"\\\n\tGameBoard\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\'\n\x06pieces\x18\x04 \x03(\x0b\x32\x17.game_structs.GamePiece\"b\n\x19GameRequestStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\ngame_found\x18\x03 \x01(\x08\x12\x0f\n\x07game_id\x18\x04 \x01(\t\"\\\n\x13GameRequestResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\t\x12\x0f\n\x07game_id\x18\x04 \x01(\t\"M\n\nPlayerInfo\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08nickname\x18\x02 \x01(\t\x12\r\n\x05level\x18\x03 \x01(\t\x12\x0c\n\x04team\x18\x04 \x01(\t\"\x80\x01\n\tGameScore\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\x12\x12\n\nscore_type\x18\x03 \x01(\t\x12\x11\n\tint_score\x18\x04 \x01(\x05\x12\x13\n\x0b\x66loat_score\x18\x05 \x01(\x02\x12\x0f\n\x07\x63omment\x18\x06 \x01(\t\"V\n\nGameStatus\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07\x63omment\x18\x02 \x01(\t\x12\'\n\x06scores\x18\x03 \x03(\x0b\x32\x17.game_structs.GameScore\"\xa6\x01\n\tGameState\x12(\n\x06status\x18\x01 \x01(\x0b\x32\x18.game_structs.GameStatus\x12\'\n\x06\x62oards\x18\x02 \x03(\x0b\x32\x17.game_structs.GameBoard\x12\x0c\n\x04mode\x18\x03 \x01(\t\x12\x1b\n\x13turn_time_remaining\x18\x04 \x01(\x05\x12\x1b\n\x13game_time_remaining\x18\x05 \x01(\x05\"\x84\x01\n\x0eGameStatusInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12)\n\x07players\x18\x02 \x03(\x0b\x32\x18.game_structs.PlayerInfo\x12&\n\x05state\x18\x03 \x01(\x0b\x32\x17.game_structs.GameState\x12\x13\n\x0blegal_moves\x18\x04 \x03(\t\"i\n\x12GameStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x31\n\x0bstatus_info\x18\x03 \x01(\x0b\x32\x1c.game_structs.GameStatusInfob\x06proto3')
-)
-
-
-
-
-_MOVEDESCRIPTION = _descriptor.Descriptor(
-  name='MoveDescription',
-  full_name='game_structs.MoveDescription',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='game_structs.MoveDescription.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='description', full_name='game_structs.MoveDescription.description', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='modes', full_name='game_structs.MoveDescription.modes', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=61,
-  serialized_end=128,
-)
-
-
-_GAMEDESCRIPTION = _descriptor.Descriptor(
-  name='GameDescription',
-  full_name='game_structs.GameDescription',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='game_structs.GameDescription.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='description', full_name='game_structs.GameDescription.description', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=130,
-  serialized_end=182,
-)
-
-
-_GAMEMOVESRESPONSE = _descriptor.Descriptor(
-  name='GameMovesResponse',
-  full_name='game_structs.GameMovesResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='moves', full_name='game_structs.GameMovesResponse.moves', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=184,
-  serialized_end=249,
-)
-
-
-_LEGALMOVESRESPONSE = _descriptor.Descriptor(
-  name='LegalMovesResponse',
-  full_name='game_structs.LegalMovesResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='success', full_name='game_structs.LegalMovesResponse.success', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='game_structs.LegalMovesResponse.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='moves', full_name='game_structs.LegalMovesResponse.moves', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=251,
-  serialized_end=320,
-)
-
-
-_COORDINATE = _descriptor.Descriptor(
-  name='Coordinate',
-  full_name='game_structs.Coordinate',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='game_structs.Coordinate.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='game_structs.Coordinate.value', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=322,
-  serialized_end=363,
-)
-
-
-_COORDINATES = _descriptor.Descriptor(
-  name='Coordinates',
-  full_name='game_structs.Coordinates',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='game_structs.Coordinates.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='values', full_name='game_structs.Coordinates.values', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=365,
-  serialized_end=434,
-)
-
-
-_GAMEPIECEMOVE = _descriptor.Descriptor(
-  name='GamePieceMove',
-  full_name='game_structs.GamePieceMove',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='piece_id', full_name='game_structs.GamePieceMove.piece_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='locations', full_name='game_structs.GamePieceMove.locations', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='comment', full_name='game_structs.GamePieceMove.comment', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=436,
-  serialized_end=532,
-)
-
-
-_MOVE = _descriptor.Descriptor(
-  name='Move',
-  full_name='game_structs.Move',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='move_name', full_name='game_structs.Move.move_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='player_id', full_name='game_structs.Move.player_id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='piece_moves', full_name='game_structs.Move.piece_moves', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='comment', full_name='game_structs.Move.comment', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=534,
-  serialized_end=645,
-)
-
-
-_GAMEPIECE = _descriptor.Descriptor(
-  name='GamePiece',
-  full_name='game_structs.GamePiece',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='game_structs.GamePiece.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='game_structs.GamePiece.name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='player', full_name='game_structs.GamePiece.player', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='location', full_name='game_structs.GamePiece.location', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=647,
-  serialized_end=745,
-)
-
-
-_GAMEBOARD = _descriptor.Descriptor(
-  name='GameBoard',
-  full_name='game_structs.GameBoard',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='game_structs.GameBoard.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='game_structs.GameBoard.name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='game_structs.GameBoard.type', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='pieces', full_name='game_structs.GameBoard.pieces', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=747,
-  serialized_end=839,
-)
-
-
-_GAMEREQUESTSTATUSRESPONSE = _descriptor.Descriptor(
-  name='GameRequestStatusResponse',
-  full_name='game_structs.GameRequestStatusResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='success', full_name='game_structs.GameRequestStatusResponse.success', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='game_structs.GameRequestStatusResponse.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_found', full_name='game_structs.GameRequestStatusResponse.game_found', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_id', full_name='game_structs.GameRequestStatusResponse.game_id', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=841,
-  serialized_end=939,
-)
-
-
-_GAMEREQUESTRESPONSE = _descriptor.Descriptor(
-  name='GameRequestResponse',
-  full_name='game_structs.GameRequestResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='success', full_name='game_structs.GameRequestResponse.success', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='game_structs.GameRequestResponse.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='request_id', full_name='game_structs.GameRequestResponse.request_id', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_id', full_name='game_structs.GameRequestResponse.game_id', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=941,
-  serialized_end=1033,
-)
-
-
-_PLAYERINFO = _descriptor.Descriptor(
-  name='PlayerInfo',
-  full_name='game_structs.PlayerInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='username', full_name='game_structs.PlayerInfo.username', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='nickname', full_name='game_structs.PlayerInfo.nickname', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='level', full_name='game_structs.PlayerInfo.level', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='team', full_name='game_structs.PlayerInfo.team', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1035,
-  serialized_end=1112,
-)
-
-
-_GAMESCORE = _descriptor.Descriptor(
-  name='GameScore',
-  full_name='game_structs.GameScore',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='player_id', full_name='game_structs.GameScore.player_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='player_name', full_name='game_structs.GameScore.player_name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='score_type', full_name='game_structs.GameScore.score_type', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='int_score', full_name='game_structs.GameScore.int_score', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='float_score', full_name='game_structs.GameScore.float_score', index=4,
-      number=5, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='comment', full_name='game_structs.GameScore.comment', index=5,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1115,
-  serialized_end=1243,
-)
-
-
-_GAMESTATUS = _descriptor.Descriptor(
-  name='GameStatus',
-  full_name='game_structs.GameStatus',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='status', full_name='game_structs.GameStatus.status', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='comment', full_name='game_structs.GameStatus.comment', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='scores', full_name='game_structs.GameStatus.scores', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1245,
-  serialized_end=1331,
-)
-
-
-_GAMESTATE = _descriptor.Descriptor(
-  name='GameState',
-  full_name='game_structs.GameState',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='status', full_name='game_structs.GameState.status', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='boards', full_name='game_structs.GameState.boards', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='mode', full_name='game_structs.GameState.mode', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='turn_time_remaining', full_name='game_structs.GameState.turn_time_remaining', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='game_time_remaining', full_name='game_structs.GameState.game_time_remaining', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1334,
-  serialized_end=1500,
-)
-
-
-_GAMESTATUSINFO = _descriptor.Descriptor(
-  name='GameStatusInfo',
-  full_name='game_structs.GameStatusInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='game_structs.GameStatusInfo.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='players', full_name='game_structs.GameStatusInfo.players', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='state', full_name='game_structs.GameStatusInfo.state', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='legal_moves', full_name='game_structs.GameStatusInfo.legal_moves', index=3,
-      number=4, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1503,
-  serialized_end=1635,
-)
-
-
-_GAMESTATUSRESPONSE = _descriptor.Descriptor(
-  name='GameStatusResponse',
-  full_name='game_structs.GameStatusResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='success', full_name='game_structs.GameStatusResponse.success', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='message', full_name='game_structs.GameStatusResponse.message', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='status_info', full_name='game_structs.GameStatusResponse.status_info', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1637,
-  serialized_end=1742,
-)
-
-_GAMEMOVESRESPONSE.fields_by_name['moves'].message_type = _MOVEDESCRIPTION
-_COORDINATES.fields_by_name['values'].message_type = _COORDINATE
-_GAMEPIECEMOVE.fields_by_name['locations'].message_type = _COORDINATES
-_MOVE.fields_by_name['piece_moves'].message_type = _GAMEPIECEMOVE
-_GAMEPIECE.fields_by_name['location'].message_type = _COORDINATES
-_GAMEBOARD.fields_by_name['pieces'].message_type = _GAMEPIECE
-_GAMESTATUS.fields_by_name['scores'].message_type = _GAMESCORE
-_GAMESTATE.fields_by_name['status'].message_type = _GAMESTATUS
-_GAMESTATE.fields_by_name['boards'].message_type = _GAMEBOARD
-_GAMESTATUSINFO.fields_by_name['players'].message_type = _PLAYERINFO
-_GAMESTATUSINFO.fields_by_name['state'].message_type = _GAMESTATE
-_GAMESTATUSRESPONSE.fields_by_name['status_info'].message_type = _GAMESTATUSINFO
-DESCRIPTOR.message_types_by_name['MoveDescription'] = _MOVEDESCRIPTION
-DESCRIPTOR.message_types_by_name['GameDescription'] = _GAMEDESCRIPTION
-DESCRIPTOR.message_types_by_name['GameMovesResponse'] = _GAMEMOVESRESPONSE
-DESCRIPTOR.message_types_by_name['LegalMovesResponse'] = _LEGALMOVESRESPONSE
-DESCRIPTOR.message_types_by_name['Coordinate'] = _COORDINATE
-DESCRIPTOR.message_types_by_name['Coordinates'] = _COORDINATES
-DESCRIPTOR.message_types_by_name['GamePieceMove'] = _GAMEPIECEMOVE
-DESCRIPTOR.message_types_by_name['Move'] = _MOVE
-DESCRIPTOR.message_types_by_name['GamePiece'] = _GAMEPIECE
-DESCRIPTOR.message_types_by_name['GameBoard'] = _GAMEBOARD
-DESCRIPTOR.message_types_by_name['GameRequestStatusResponse'] = _GAMEREQUESTSTATUSRESPONSE
-DESCRIPTOR.message_types_by_name['GameRequestResponse'] = _GAMEREQUESTRESPONSE
-DESCRIPTOR.message_types_by_name['PlayerInfo'] = _PLAYERINFO
-DESCRIPTOR.message_types_by_name['GameScore'] = _GAMESCORE
-DESCRIPTOR.message_types_by_name['GameStatus'] = _GAMESTATUS
-DESCRIPTOR.message_types_by_name['GameState'] = _GAMESTATE
-DESCRIPTOR.message_types_by_name['GameStatusInfo'] = _GAMESTATUSINFO
-DESCRIPTOR.message_types_by_name['GameStatusResponse'] = _GAMESTATUSRESPONSE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-MoveDescription = _reflection.GeneratedProtocolMessageType('MoveDescription', (_message.Message,), dict(
-  DESCRIPTOR = _MOVEDESCRIPTION,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.MoveDescription)
-  ))
-_sym_db.RegisterMessage(MoveDescription)
-
-GameDescription = _reflection.GeneratedProtocolMessageType('GameDescription', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEDESCRIPTION,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameDescription)
-  ))
-_sym_db.RegisterMessage(GameDescription)
-
-GameMovesResponse = _reflection.GeneratedProtocolMessageType('GameMovesResponse', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEMOVESRESPONSE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameMovesResponse)
-  ))
-_sym_db.RegisterMessage(GameMovesResponse)
-
-LegalMovesResponse = _reflection.GeneratedProtocolMessageType('LegalMovesResponse', (_message.Message,), dict(
-  DESCRIPTOR = _LEGALMOVESRESPONSE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.LegalMovesResponse)
-  ))
-_sym_db.RegisterMessage(LegalMovesResponse)
-
-Coordinate = _reflection.GeneratedProtocolMessageType('Coordinate', (_message.Message,), dict(
-  DESCRIPTOR = _COORDINATE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.Coordinate)
-  ))
-_sym_db.RegisterMessage(Coordinate)
-
-Coordinates = _reflection.GeneratedProtocolMessageType('Coordinates', (_message.Message,), dict(
-  DESCRIPTOR = _COORDINATES,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.Coordinates)
-  ))
-_sym_db.RegisterMessage(Coordinates)
-
-GamePieceMove = _reflection.GeneratedProtocolMessageType('GamePieceMove', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEPIECEMOVE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GamePieceMove)
-  ))
-_sym_db.RegisterMessage(GamePieceMove)
-
-Move = _reflection.GeneratedProtocolMessageType('Move', (_message.Message,), dict(
-  DESCRIPTOR = _MOVE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.Move)
-  ))
-_sym_db.RegisterMessage(Move)
-
-GamePiece = _reflection.GeneratedProtocolMessageType('GamePiece', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEPIECE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GamePiece)
-  ))
-_sym_db.RegisterMessage(GamePiece)
-
-GameBoard = _reflection.GeneratedProtocolMessageType('GameBoard', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEBOARD,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameBoard)
-  ))
-_sym_db.RegisterMessage(GameBoard)
-
-GameRequestStatusResponse = _reflection.GeneratedProtocolMessageType('GameRequestStatusResponse', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEREQUESTSTATUSRESPONSE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameRequestStatusResponse)
-  ))
-_sym_db.RegisterMessage(GameRequestStatusResponse)
-
-GameRequestResponse = _reflection.GeneratedProtocolMessageType('GameRequestResponse', (_message.Message,), dict(
-  DESCRIPTOR = _GAMEREQUESTRESPONSE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameRequestResponse)
-  ))
-_sym_db.RegisterMessage(GameRequestResponse)
-
-PlayerInfo = _reflection.GeneratedProtocolMessageType('PlayerInfo', (_message.Message,), dict(
-  DESCRIPTOR = _PLAYERINFO,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.PlayerInfo)
-  ))
-_sym_db.RegisterMessage(PlayerInfo)
-
-GameScore = _reflection.GeneratedProtocolMessageType('GameScore', (_message.Message,), dict(
-  DESCRIPTOR = _GAMESCORE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameScore)
-  ))
-_sym_db.RegisterMessage(GameScore)
-
-GameStatus = _reflection.GeneratedProtocolMessageType('GameStatus', (_message.Message,), dict(
-  DESCRIPTOR = _GAMESTATUS,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameStatus)
-  ))
-_sym_db.RegisterMessage(GameStatus)
-
-GameState = _reflection.GeneratedProtocolMessageType('GameState', (_message.Message,), dict(
-  DESCRIPTOR = _GAMESTATE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameState)
-  ))
-_sym_db.RegisterMessage(GameState)
-
-GameStatusInfo = _reflection.GeneratedProtocolMessageType('GameStatusInfo', (_message.Message,), dict(
-  DESCRIPTOR = _GAMESTATUSINFO,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameStatusInfo)
-  ))
-_sym_db.RegisterMessage(GameStatusInfo)
-
-GameStatusResponse = _reflection.GeneratedProtocolMessageType('GameStatusResponse', (_message.Message,), dict(
-  DESCRIPTOR = _GAMESTATUSRESPONSE,
-  __module__ = 'chupacabra_client.protos.game_structs_pb2'
-  # @@protoc_insertion_point(class_scope:game_structs.GameStatusResponse)
-  ))
-_sym_db.RegisterMessage(GameStatusResponse)
-
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+chupacabra_client/protos/game_structs.proto\x12\x0cgame_structs\"C\n\x0fMoveDescription\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05modes\x18\x03 \x03(\t\"4\n\x0fGameDescription\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\"A\n\x11GameMovesResponse\x12,\n\x05moves\x18\x01 \x03(\x0b\x32\x1d.game_structs.MoveDescription\"E\n\x12LegalMovesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\r\n\x05moves\x18\x03 \x03(\t\")\n\nCoordinate\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05\"E\n\x0b\x43oordinates\x12\x0c\n\x04name\x18\x01 \x01(\t\x12(\n\x06values\x18\x02 \x03(\x0b\x32\x18.game_structs.Coordinate\"`\n\rGamePieceMove\x12\x10\n\x08piece_id\x18\x01 \x01(\t\x12,\n\tlocations\x18\x02 \x03(\x0b\x32\x19.game_structs.Coordinates\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\"o\n\x04Move\x12\x11\n\tmove_name\x18\x01 \x01(\t\x12\x11\n\tplayer_id\x18\x02 \x01(\t\x12\x30\n\x0bpiece_moves\x18\x03 \x03(\x0b\x32\x1b.game_structs.GamePieceMove\x12\x0f\n\x07\x63omment\x18\x04 \x01(\t\"b\n\tGamePiece\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06player\x18\x03 \x01(\t\x12+\n\x08location\x18\x04 \x01(\x0b\x32\x19.game_structs.Coordinates\"\\\n\tGameBoard\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\'\n\x06pieces\x18\x04 \x03(\x0b\x32\x17.game_structs.GamePiece\"b\n\x19GameRequestStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\ngame_found\x18\x03 \x01(\x08\x12\x0f\n\x07game_id\x18\x04 \x01(\t\"\\\n\x13GameRequestResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\t\x12\x0f\n\x07game_id\x18\x04 \x01(\t\"b\n\x0ePendingRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x12\n\ngame_found\x18\x02 \x01(\x08\x12\x0f\n\x07game_id\x18\x03 \x01(\t\x12\x17\n\x0f\x65xpiration_time\x18\x04 \x01(\x01\"k\n\x17PendingRequestsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12.\n\x08requests\x18\x03 \x03(\x0b\x32\x1c.game_structs.PendingRequest\"M\n\nPlayerInfo\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08nickname\x18\x02 \x01(\t\x12\r\n\x05level\x18\x03 \x01(\t\x12\x0c\n\x04team\x18\x04 \x01(\t\"\x80\x01\n\tGameScore\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\x12\x12\n\nscore_type\x18\x03 \x01(\t\x12\x11\n\tint_score\x18\x04 \x01(\x05\x12\x13\n\x0b\x66loat_score\x18\x05 \x01(\x02\x12\x0f\n\x07\x63omment\x18\x06 \x01(\t\"V\n\nGameStatus\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07\x63omment\x18\x02 \x01(\t\x12\'\n\x06scores\x18\x03 \x03(\x0b\x32\x17.game_structs.GameScore\"\xa6\x01\n\tGameState\x12(\n\x06status\x18\x01 \x01(\x0b\x32\x18.game_structs.GameStatus\x12\'\n\x06\x62oards\x18\x02 \x03(\x0b\x32\x17.game_structs.GameBoard\x12\x0c\n\x04mode\x18\x03 \x01(\t\x12\x1b\n\x13turn_time_remaining\x18\x04 \x01(\x05\x12\x1b\n\x13game_time_remaining\x18\x05 \x01(\x05\"\x84\x01\n\x0eGameStatusInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12)\n\x07players\x18\x02 \x03(\x0b\x32\x18.game_structs.PlayerInfo\x12&\n\x05state\x18\x03 \x01(\x0b\x32\x17.game_structs.GameState\x12\x13\n\x0blegal_moves\x18\x04 \x03(\t\"i\n\x12GameStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x31\n\x0bstatus_info\x18\x03 \x01(\x0b\x32\x1c.game_structs.GameStatusInfob\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chupacabra_client.protos.game_structs_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_MOVEDESCRIPTION']._serialized_start=61
+  _globals['_MOVEDESCRIPTION']._serialized_end=128
+  _globals['_GAMEDESCRIPTION']._serialized_start=130
+  _globals['_GAMEDESCRIPTION']._serialized_end=182
+  _globals['_GAMEMOVESRESPONSE']._serialized_start=184
+  _globals['_GAMEMOVESRESPONSE']._serialized_end=249
+  _globals['_LEGALMOVESRESPONSE']._serialized_start=251
+  _globals['_LEGALMOVESRESPONSE']._serialized_end=320
+  _globals['_COORDINATE']._serialized_start=322
+  _globals['_COORDINATE']._serialized_end=363
+  _globals['_COORDINATES']._serialized_start=365
+  _globals['_COORDINATES']._serialized_end=434
+  _globals['_GAMEPIECEMOVE']._serialized_start=436
+  _globals['_GAMEPIECEMOVE']._serialized_end=532
+  _globals['_MOVE']._serialized_start=534
+  _globals['_MOVE']._serialized_end=645
+  _globals['_GAMEPIECE']._serialized_start=647
+  _globals['_GAMEPIECE']._serialized_end=745
+  _globals['_GAMEBOARD']._serialized_start=747
+  _globals['_GAMEBOARD']._serialized_end=839
+  _globals['_GAMEREQUESTSTATUSRESPONSE']._serialized_start=841
+  _globals['_GAMEREQUESTSTATUSRESPONSE']._serialized_end=939
+  _globals['_GAMEREQUESTRESPONSE']._serialized_start=941
+  _globals['_GAMEREQUESTRESPONSE']._serialized_end=1033
+  _globals['_PENDINGREQUEST']._serialized_start=1035
+  _globals['_PENDINGREQUEST']._serialized_end=1133
+  _globals['_PENDINGREQUESTSRESPONSE']._serialized_start=1135
+  _globals['_PENDINGREQUESTSRESPONSE']._serialized_end=1242
+  _globals['_PLAYERINFO']._serialized_start=1244
+  _globals['_PLAYERINFO']._serialized_end=1321
+  _globals['_GAMESCORE']._serialized_start=1324
+  _globals['_GAMESCORE']._serialized_end=1452
+  _globals['_GAMESTATUS']._serialized_start=1454
+  _globals['_GAMESTATUS']._serialized_end=1540
+  _globals['_GAMESTATE']._serialized_start=1543
+  _globals['_GAMESTATE']._serialized_end=1709
+  _globals['_GAMESTATUSINFO']._serialized_start=1712
+  _globals['_GAMESTATUSINFO']._serialized_end=1844
+  _globals['_GAMESTATUSRESPONSE']._serialized_start=1846
+  _globals['_GAMESTATUSRESPONSE']._serialized_end=1951
 # @@protoc_insertion_point(module_scope)
@@ -32,8 +32,8 @@ setup(
     version=extract_variable_name('__version__'),
     packages=find_packages(),
     install_requires=[
-        "grpcio >= 1.19",
-        "grpcio-tools >= 1.19",
-        "protobuf >= 3.6.1"
+        "grpcio >= 1.84",
+        "grpcio-tools >= 1.84",
+        "protobuf >= 7.35.1"
     ]
 )
\ No newline at end of file
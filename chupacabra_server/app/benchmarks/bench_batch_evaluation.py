@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+import timeit
+
+import click
+import numpy as np
+
+from tic_tac_toe import tic_tac_toe_game as ttt
+
+
+@click.command()
+@click.option('--num-boards', default=100000, help='Number of random boards to evaluate')
+@click.option('--num-scalar', default=10000, help='Number of boards to time the scalar check on')
+def benchmark(num_boards: int, num_scalar: int) -> None:
+    """Compare the scalar game over check with the batch evaluation."""
+    random_state = np.random.RandomState(0)
+    boards = random_state.randint(-1, 2, size=[num_boards, 9]).astype(np.int8)
+
+    square_boards = boards[:num_scalar].reshape([-1, 3, 3])
+    scalar_seconds = timeit.timeit(
+        lambda: [ttt._check_for_game_over(board) for board in square_boards], number=1)
+    batch_seconds = timeit.timeit(lambda: ttt.evaluate_boards(boards), number=1)
+
+    print('scalar: {:8.3f} us per board'.format(1e6 * scalar_seconds / len(square_boards)))
+    print('batch:  {:8.3f} us per board'.format(1e6 * batch_seconds / num_boards))
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+import timeit
+
+import arrow
+from chupacabra_client.protos.game_structs_pb2 import (
+    Coordinate, Coordinates, GamePieceMove, Move, PlayerInfo
+)
+import click
+import numpy as np
+
+from tic_tac_toe import tic_tac_toe_game as ttt
+
+
+BOARD_RULES = [
+    ttt.BoardRules(rows=3, columns=3, win_length=3),
+    ttt.BoardRules(rows=7, columns=7, win_length=4),
+    ttt.BoardRules(rows=15, columns=15, win_length=5),
+    ttt.BoardRules(rows=31, columns=31, win_length=5),
+    ttt.BoardRules(rows=63, columns=63, win_length=5),
+    ttt.BoardRules(rows=127, columns=127, win_length=5),
+]
+
+
+def _make_state(rules: ttt.BoardRules) -> ttt.TicTacToeInternalState:
+    """Make a game with a third of the board filled in at random."""
+    random_state = np.random.RandomState(0)
+    board = np.zeros([rules.rows, rules.columns], dtype=np.int8)
+    num_filled = rules.rows * rules.columns // 3
+    for cell in random_state.permutation(rules.rows * rules.columns)[:num_filled]:
+        x_coord, y_coord = divmod(int(cell), rules.columns)
+        board[x_coord, y_coord] = ttt.TURN_SCORES[(x_coord + y_coord) % 2]
+    expiration_time = arrow.utcnow().timestamp + 3600
+    return ttt.TicTacToeInternalState(
+        'game',
+        ['1', '2'],
+        [PlayerInfo(), PlayerInfo()],
+        expiration_time,
+        expiration_time,
+        board=board,
+        rules=rules
+    )
+
+
+def _make_move(x_coord: int, y_coord: int) -> Move:
+    """Make the move that places a mark on the board."""
+    return Move(
+        piece_moves=[
+            GamePieceMove(
+                locations=[
+                    Coordinates(
+                        values=[
+                            Coordinate(name=ttt.X_COORD, value=x_coord),
+                            Coordinate(name=ttt.Y_COORD, value=y_coord)
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
+
+
+@click.command()
+@click.option('--number', default=2000, help='Number of moves to time per board size')
+def benchmark(number: int) -> None:
+    """Show that the cost of a move stays flat as the board grows."""
+    for rules in BOARD_RULES:
+        state = _make_state(rules)
+        x_coord, y_coord = (int(value) for value in np.argwhere(state.board == 0)[0])
+        move = _make_move(x_coord, y_coord)
+        player_id = state.player_ids[state.turn]
+        check_seconds = timeit.timeit(
+            lambda: ttt._check_for_game_over_after_move(
+                state.board, x_coord, y_coord, rules.win_length, state.version + 1),
+            number=number
+        )
+        move_seconds = timeit.timeit(
+            lambda: ttt.make_move(state, move, player_id, engine=ttt.INCREMENTAL_ENGINE),
+            number=number
+        )
+        print('{:>3}x{:<3} k={}: win check {:6.2f} us, make_move {:6.2f} us'.format(
+            rules.rows,
+            rules.columns,
+            rules.win_length,
+            1e6 * check_seconds / number,
+            1e6 * move_seconds / number
+        ))
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+import arrow
+from chupacabra_client.protos.game_structs_pb2 import PlayerInfo
+import click
+import numpy as np
+
+from tic_tac_toe import state_codec
+from tic_tac_toe import tic_tac_toe_game as ttt
+
+
+def _make_states(num_states: int) -> list:
+    """Make game states with realistic ids and player info at random points in a game."""
+    random_state = np.random.RandomState(0)
+    time_now = arrow.utcnow().float_timestamp
+    states = []
+    for idx in range(num_states):
+        board = np.zeros([3, 3], dtype=np.int8)
+        num_moves = random_state.randint(10)
+        cells = random_state.permutation(9)[:num_moves]
+        for move_idx, cell in enumerate(cells):
+            board[cell // 3, cell % 3] = ttt.TURN_SCORES[move_idx % 2]
+        states.append(ttt.TicTacToeInternalState(
+            'Xb8pHc1lq4SRGQzQ0yWjz2F3vN8vq7yHd6WRZtqk{:05d}'.format(idx),
+            ['{:016x}'.format(2 * idx), '{:016x}'.format(2 * idx + 1)],
+            [
+                PlayerInfo(username='player{}'.format(2 * idx), nickname='Player One'),
+                PlayerInfo(username='player{}'.format(2 * idx + 1), nickname='Player Two')
+            ],
+            time_now + ttt.TURN_EXPIRATION_TIME,
+            time_now + ttt.GAME_LIFETIME,
+            board=board,
+            turn=num_moves % 2
+        ))
+    return states
+
+
+@click.command()
+@click.option('--num-states', default=100, help='Number of game states to encode')
+@click.option('--number', default=100, help='Number of times to encode every state')
+def benchmark(num_states: int, number: int) -> None:
+    """Report bytes per game and encode/decode timings for every state codec."""
+    states = _make_states(num_states)
+    for codec in state_codec.STATE_CODECS.values():
+        report = state_codec.measure_codec(codec, states, number=number)
+        print('{:>8}: {:6.1f} bytes/game, encode {:6.2f} us, decode {:6.2f} us'.format(
+            report.name,
+            report.bytes_per_game,
+            report.encode_microseconds,
+            report.decode_microseconds
+        ))
+
+
+if __name__ == '__main__':
+    benchmark()
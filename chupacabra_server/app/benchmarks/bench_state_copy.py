@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+import copy
+import timeit
+import tracemalloc
+from typing import Callable
+
+import arrow
+from chupacabra_client.protos.game_structs_pb2 import PlayerInfo
+import click
+
+from tic_tac_toe import tic_tac_toe_game as ttt
+
+
+def _make_state() -> ttt.TicTacToeInternalState:
+    """Make a game state in the middle of a game."""
+    expiration_time = arrow.utcnow().timestamp + 3600
+    state = ttt.TicTacToeInternalState(
+        'a-fairly-long-game-id-like-the-ones-from-secrets.token_urlsafe',
+        ['player-id-1', 'player-id-2'],
+        [
+            PlayerInfo(username='player1', nickname='ABC', level='8999', team='Team A'),
+            PlayerInfo(username='player2', nickname='DEF', level='9001', team='Team B')
+        ],
+        expiration_time,
+        expiration_time
+    )
+    state.board[1, 1] = 1
+    state.board[0, 0] = -1
+    return state
+
+
+def _deepcopy_move(state: ttt.TicTacToeInternalState) -> ttt.TicTacToeInternalState:
+    """The old way to make a move: deep copy the state then modify it."""
+    new_state = copy.deepcopy(state)
+    new_state.board[0, 2] = 1
+    new_state.turn = 1
+    new_state.turn_expiration_time += ttt.TURN_EXPIRATION_TIME
+    return new_state
+
+
+def _evolve_move(state: ttt.TicTacToeInternalState) -> ttt.TicTacToeInternalState:
+    """The new way to make a move: copy the board and share everything else."""
+    new_board = state.board.copy()
+    new_board[0, 2] = 1
+    return state.evolve(
+        board=new_board,
+        turn=1,
+        turn_expiration_time=state.turn_expiration_time + ttt.TURN_EXPIRATION_TIME
+    )
+
+
+def _measure_allocations(function: Callable, state: ttt.TicTacToeInternalState) -> int:
+    """Get the number of bytes still allocated after one call."""
+    tracemalloc.start()
+    allocated_before, _ = tracemalloc.get_traced_memory()
+    new_state = function(state)
+    allocated_after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del new_state
+    return allocated_after - allocated_before
+
+
+@click.command()
+@click.option('--number', default=20000, help='Number of moves to time')
+def benchmark(number: int) -> None:
+    """Compare deep copying the state with evolving it for a single move."""
+    state = _make_state()
+    for name, function in [('deepcopy', _deepcopy_move), ('evolve', _evolve_move)]:
+        seconds = timeit.timeit(lambda: function(state), number=number)
+        allocated = _measure_allocations(function, state)
+        print('{:>10}: {:8.2f} us/move, {:6d} bytes allocated/move'.format(
+            name, 1e6 * seconds / number, allocated))
+
+
+if __name__ == '__main__':
+    benchmark()
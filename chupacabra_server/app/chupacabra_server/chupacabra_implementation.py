@@ -1,6 +1,8 @@
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List
 
 from chupacabra_client.protos import chupacabra_pb2, game_structs_pb2
+from google.protobuf.empty_pb2 import Empty
+import grpc
 
 from dbs.authentication import AuthenticationHandler, authenticate_user, hash_password
 from dbs.session import SessionHandler
@@ -10,6 +12,7 @@ from protos.game_server_pb2_grpc import GameServerStub
 
 AUTHENTICATION_FAILED = 'Authentication failed.'
 GAME_TYPE_NOT_FOUND = 'Game of type \'{}\' not found.'
+DESCRIBE_GAME_TIMEOUT = 2  # in seconds
 
 
 def register_user(
@@ -59,9 +62,34 @@ def begin_session(
     return response
 
 
+def describe_games(
+    game_map: Dict[str, GameServerStub]
+) -> Dict[str, game_structs_pb2.GameDescription]:
+    """Ask every game server to describe its game, all at the same time.
+
+    The descriptions are named after the game type the game is requested with.
+    Game servers that fail to answer within DESCRIBE_GAME_TIMEOUT are left out.
+    """
+    futures = {
+        game_type: game_stub.DescribeGame.future(Empty(), timeout=DESCRIBE_GAME_TIMEOUT)
+        for game_type, game_stub in game_map.items()
+    }
+    descriptions = {}
+    for game_type, future in futures.items():
+        try:
+            game_description = future.result()
+        except grpc.RpcError:
+            continue
+        descriptions[game_type] = game_structs_pb2.GameDescription(
+            name=game_type,
+            description=game_description.description
+        )
+    return descriptions
+
+
 def list_available_games(
     request: chupacabra_pb2.PlayerGameInfo,
-    games: List[str],
+    descriptions: List[game_structs_pb2.GameDescription],
     session_handler: SessionHandler
 ) -> chupacabra_pb2.AvailableGamesResponse:
     """List the games available on the server."""
@@ -74,12 +102,6 @@ def list_available_games(
             message=AUTHENTICATION_FAILED
         )
 
-    descriptions = [
-        game_structs_pb2.GameDescription(
-            name=game
-        )
-        for game in games
-    ]
     return chupacabra_pb2.AvailableGamesResponse(
         descriptions=descriptions,
         success=True,
@@ -154,6 +176,60 @@ def check_game_request(
     return response
 
 
+def _relay_stream(responses: Any, context: grpc.ServicerContext) -> Iterator[Any]:
+    """Relay a game server's stream until it ends or the client's call does.
+
+    Args:
+        responses: the game server's streaming call
+        context: grpc.ServicerContext, the context of the client's call
+    """
+    # Stop the game server's stream as soon as the client has gone away,
+    # instead of holding a thread until the game server sends something
+    if not context.add_callback(responses.cancel):
+        responses.cancel()
+        return
+    try:
+        yield from responses
+    except grpc.RpcError as error:
+        if error.code() != grpc.StatusCode.CANCELLED or context.is_active():
+            raise
+    finally:
+        responses.cancel()
+
+
+def wait_for_game(
+    request: chupacabra_pb2.GameRequestStatus,
+    game_map: Dict[str, GameServerStub],
+    session_handler: SessionHandler,
+    context: grpc.ServicerContext
+) -> Iterator[game_structs_pb2.GameRequestStatusResponse]:
+    """Relay the game server's updates on a game request until it has a game."""
+    username = request.username
+    session_id = request.session_id
+    user_data = session_handler.authenticate_session(username, session_id)
+    if user_data is None:
+        yield game_structs_pb2.GameRequestStatusResponse(
+            success=False,
+            message=AUTHENTICATION_FAILED
+        )
+        return
+
+    game_stub = game_map.get(request.game_type)
+    if game_stub is None:
+        yield game_structs_pb2.GameRequestStatusResponse(
+            success=False,
+            message=GAME_TYPE_NOT_FOUND.format(request.game_type)
+        )
+        return
+
+    internal_request = game_server_pb2.GameRequestStatusRequest(
+        player_id=user_data.user_id,
+        request_id=request.request_id
+    )
+
+    yield from _relay_stream(game_stub.WaitForGame(internal_request), context)
+
+
 def check_game_state(
     request: chupacabra_pb2.PlayerGameInfo,
     game_map: Dict[str, GameServerStub],
@@ -185,6 +261,39 @@ def check_game_state(
     return response
 
 
+def watch_game(
+    request: chupacabra_pb2.PlayerGameInfo,
+    game_map: Dict[str, GameServerStub],
+    session_handler: SessionHandler,
+    context: grpc.ServicerContext
+) -> Iterator[game_structs_pb2.GameStatusResponse]:
+    """Relay the game server's updates on a game until it is over."""
+    username = request.username
+    session_id = request.session_id
+    user_data = session_handler.authenticate_session(username, session_id)
+    if user_data is None:
+        yield game_structs_pb2.GameStatusResponse(
+            success=False,
+            message=AUTHENTICATION_FAILED
+        )
+        return
+
+    game_stub = game_map.get(request.game_type)
+    if game_stub is None:
+        yield game_structs_pb2.GameStatusResponse(
+            success=False,
+            message=GAME_TYPE_NOT_FOUND.format(request.game_type)
+        )
+        return
+
+    internal_request = game_server_pb2.UserGameInfo(
+        player_id=user_data.user_id,
+        game_id=request.game_id
+    )
+
+    yield from _relay_stream(game_stub.WatchGame(internal_request), context)
+
+
 def check_legal_moves(
     request: chupacabra_pb2.PlayerGameInfo,
     game_map: Dict[str, GameServerStub],
@@ -280,3 +389,33 @@ def forfeit_game(
 
     response = game_stub.ForfeitGame(internal_request)
     return response
+
+
+def list_pending_requests(
+    request: chupacabra_pb2.PlayerGameInfo,
+    game_map: Dict[str, GameServerStub],
+    session_handler: SessionHandler
+) -> game_structs_pb2.PendingRequestsResponse:
+    """List the game requests that have not expired."""
+    username = request.username
+    session_id = request.session_id
+    user_data = session_handler.authenticate_session(username, session_id)
+    if user_data is None:
+        return game_structs_pb2.PendingRequestsResponse(
+            success=False,
+            message=AUTHENTICATION_FAILED
+        )
+
+    game_stub = game_map.get(request.game_type)
+    if game_stub is None:
+        return game_structs_pb2.PendingRequestsResponse(
+            success=False,
+            message=GAME_TYPE_NOT_FOUND.format(request.game_type)
+        )
+
+    internal_request = game_server_pb2.PlayerRequest(
+        player_id=user_data.user_id
+    )
+
+    response = game_stub.ListPendingRequests(internal_request)
+    return response
@@ -11,6 +11,7 @@ import grpc
 
 from protos.game_server_pb2_grpc import GameServerStub
 from chupacabra_server.servicer import ChupacabraServicer
+from utils.stream_limit import DEFAULT_MAX_STREAMS, StreamLimit
 
 
 logger = logging.getLogger(__name__)
@@ -26,18 +27,22 @@ ONE_DAY = 24 * 60 * 60
 @click.option('--host', default='127.0.0.1', help='Host address')
 @click.option('--port', default=7653, help='Port number to expose')
 @click.option('--max-workers', default=10, help='Maximum number of worker threads')
+@click.option('--max-streams', default=DEFAULT_MAX_STREAMS,
+              help='Maximum number of streaming calls open at once')
 @click.option('--game-name', multiple=True, help='Name of a game to add to the server')
 @click.option('--game-server', multiple=True, help='URL to the game server, including GRPC port')
 def serve(
     host: str,
     port: int,
     max_workers: int,
+    max_streams: int,
     game_name: List[str],
     game_server: List[str]
 ) -> None:
     """Create and run a Chupacabra server"""
     logger.info('Starting Chupacabra server')
-    executor = ThreadPoolExecutor(max_workers=max_workers)
+    # Each open stream holds a thread, so streams get threads of their own
+    executor = ThreadPoolExecutor(max_workers=max_workers + max_streams)
     server = grpc.server(executor)
 
     game_dict = {
@@ -45,7 +50,7 @@ def serve(
         for game_name, game_server in zip(game_name, game_server)
     }
 
-    servicer = ChupacabraServicer(game_dict)
+    servicer = ChupacabraServicer(game_dict, StreamLimit(max_streams))
 
     add_ChupacabraServerServicer_to_server(servicer, server)
     server.add_insecure_port('{}:{}'.format(host, port))
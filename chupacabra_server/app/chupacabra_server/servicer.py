@@ -1,5 +1,7 @@
 import logging
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, Iterator, List
 
 from chupacabra_client.protos.chupacabra_pb2_grpc import ChupacabraServerServicer
 from chupacabra_client.protos import chupacabra_pb2
@@ -8,21 +10,71 @@ from chupacabra_client.protos import game_structs_pb2
 from chupacabra_server import chupacabra_implementation
 from chupacabra_server.config import get_session_handler, get_user_authentication_handler
 from protos.game_server_pb2_grpc import GameServerStub
+from utils.stream_limit import StreamLimit
 
 
 logger = logging.getLogger(__name__)
 
 
 ERROR_MESSAGE = 'Error during handling of your request'
+DESCRIBE_RETRY_INTERVAL = 30  # in seconds
 
 
 class ChupacabraServicer(ChupacabraServerServicer):
     def __init__(
         self,
-        game_map: Dict[Any, GameServerStub]
+        game_map: Dict[Any, GameServerStub],
+        stream_limit: StreamLimit = None
     ) -> None:
-        """Initialize the servicer."""
+        """Initialize the servicer.
+
+        Args:
+            game_map: dict, the game server of each game type
+            stream_limit: Maybe(StreamLimit), caps the streams open at once,
+                DEFAULT_MAX_STREAMS if not given
+        """
         self._game_map = game_map
+        self._stream_limit = stream_limit or StreamLimit()
+        self._descriptions: Dict[Any, game_structs_pb2.GameDescription] = {}
+        self._descriptions_lock = threading.Lock()
+        self._last_describe_time = None
+
+    def _get_game_descriptions(self) -> List[game_structs_pb2.GameDescription]:
+        """Get the description of every game, asking each game server only until it answers.
+
+        Game servers that have not answered are asked again at most every
+        DESCRIBE_RETRY_INTERVAL seconds, and their game is listed by name until then.
+        The lock is only held to read and update the cache, so other requests
+        are not held up while the game servers are asked.
+        """
+        time_now = time.monotonic()
+        with self._descriptions_lock:
+            missing_games = {
+                game_type: game_stub
+                for game_type, game_stub in self._game_map.items()
+                if game_type not in self._descriptions
+            }
+            should_describe = bool(missing_games) and (
+                self._last_describe_time is None or
+                time_now - self._last_describe_time >= DESCRIBE_RETRY_INTERVAL
+            )
+            if should_describe:
+                # Only this request asks, and the others use the cache meanwhile
+                self._last_describe_time = time_now
+
+        if should_describe:
+            new_descriptions = chupacabra_implementation.describe_games(missing_games)
+            for game_type in missing_games.keys() - new_descriptions.keys():
+                logger.warning('Could not describe game {}.'.format(game_type))
+            with self._descriptions_lock:
+                self._descriptions.update(new_descriptions)
+
+        with self._descriptions_lock:
+            return [
+                self._descriptions.get(game_type) or
+                game_structs_pb2.GameDescription(name=game_type)
+                for game_type in self._game_map
+            ]
 
     def RegisterUser(
         self,
@@ -62,9 +114,9 @@ class ChupacabraServicer(ChupacabraServerServicer):
         """List the available games on this server."""
         try:
             session_handler = get_session_handler()
-            games = list(self._game_map.keys())
+            descriptions = self._get_game_descriptions()
             return chupacabra_implementation.list_available_games(
-                request, games, session_handler
+                request, descriptions, session_handler
             )
         except Exception as exception:
             logger.error(exception)
@@ -100,6 +152,29 @@ class ChupacabraServicer(ChupacabraServerServicer):
             logger.error(exception)
             raise AssertionError(ERROR_MESSAGE)
 
+    def WaitForGame(
+        self,
+        request: chupacabra_pb2.GameRequestStatus,
+        context: Any
+    ) -> Iterator[game_structs_pb2.GameRequestStatusResponse]:
+        """Stream the status of a game request until it has a game."""
+        return self._stream_limit.stream(self._wait_for_game(request, context), context)
+
+    def _wait_for_game(
+        self,
+        request: chupacabra_pb2.GameRequestStatus,
+        context: Any
+    ) -> Iterator[game_structs_pb2.GameRequestStatusResponse]:
+        """Relay the status of a game request from its game server."""
+        try:
+            session_handler = get_session_handler()
+            yield from chupacabra_implementation.wait_for_game(
+                request, self._game_map, session_handler, context
+            )
+        except Exception as exception:
+            logger.error(exception)
+            raise AssertionError(ERROR_MESSAGE)
+
     def GetGameState(
         self,
         request: chupacabra_pb2.PlayerGameInfo,
@@ -115,6 +190,29 @@ class ChupacabraServicer(ChupacabraServerServicer):
             logger.error(exception)
             raise AssertionError(ERROR_MESSAGE)
 
+    def WatchGame(
+        self,
+        request: chupacabra_pb2.PlayerGameInfo,
+        context: Any
+    ) -> Iterator[game_structs_pb2.GameStatusResponse]:
+        """Stream the state of the game each time it changes, until it is over."""
+        return self._stream_limit.stream(self._watch_game(request, context), context)
+
+    def _watch_game(
+        self,
+        request: chupacabra_pb2.PlayerGameInfo,
+        context: Any
+    ) -> Iterator[game_structs_pb2.GameStatusResponse]:
+        """Relay the state of the game from its game server."""
+        try:
+            session_handler = get_session_handler()
+            yield from chupacabra_implementation.watch_game(
+                request, self._game_map, session_handler, context
+            )
+        except Exception as exception:
+            logger.error(exception)
+            raise AssertionError(ERROR_MESSAGE)
+
     def CheckLegalMoves(
         self,
         request: chupacabra_pb2.PlayerGameInfo,
@@ -159,3 +257,18 @@ class ChupacabraServicer(ChupacabraServerServicer):
         except Exception as exception:
             logger.error(exception)
             raise AssertionError(ERROR_MESSAGE)
+
+    def ListPendingRequests(
+        self,
+        request: chupacabra_pb2.PlayerGameInfo,
+        context: Any
+    ) -> game_structs_pb2.PendingRequestsResponse:
+        """List the game requests that have not expired."""
+        try:
+            session_handler = get_session_handler()
+            return chupacabra_implementation.list_pending_requests(
+                request, self._game_map, session_handler
+            )
+        except Exception as exception:
+            logger.error(exception)
+            raise AssertionError(ERROR_MESSAGE)
@@ -1,9 +1,12 @@
 import abc
 from contextlib import AbstractContextManager, contextmanager
-from typing import Any, Generator
+from typing import Any, Generator, List, Optional, Sequence, Tuple
 
 class KeyValueStore(abc.ABC):
-    """An abstract key value store with get, set, delete, and lock operations."""
+    """An abstract key value store with get, set, delete, and lock operations.
+
+    The batch operations work key by key unless a store can do better.
+    """
 
     @abc.abstractmethod
     def get(self, key: Any) -> Any:
@@ -34,3 +37,15 @@ class KeyValueStore(abc.ABC):
     def delete(self, key: Any) -> bool:
         """Delete the value for a key."""
         raise NotImplementedError()
+
+    def get_many(self, keys: Sequence[Any]) -> List[Any]:
+        """Get the values for several keys, in order, with None for missing keys."""
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Sequence[Tuple[Any, Any, Optional[int]]]) -> bool:
+        """Set several values, given (key, data, lifetime) for each."""
+        return all([self.set(key, data, lifetime=lifetime) for key, data, lifetime in items])
+
+    def delete_many(self, keys: Sequence[Any]) -> bool:
+        """Delete the values for several keys."""
+        return all([self.delete(key) for key in keys])
@@ -1,11 +1,150 @@
+from collections import defaultdict
 from contextlib import AbstractContextManager, contextmanager
-from typing import Any, Callable, Generator, Tuple
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Tuple
 
 from redis import StrictRedis
+from redis.client import Pipeline
 
 from dbs.keyvalue_store import KeyValueStore
 
 
+logger = logging.getLogger(__name__)
+
+RESUBSCRIBE_INTERVAL = 1  # in seconds
+# Handed to every listener once the subscriber is back after losing its
+# connection, as messages sent in between were missed
+MESSAGES_MISSED = object()
+
+
+class RedisBatch:
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        get_validated_inputs: Callable[[Any, Any], Tuple[str, str]],
+        get_validated_key: Callable[[Any], str]
+    ) -> None:
+        """Writes that are queued up and sent to redis together in one transaction.
+
+        Made by RedisCacheHandler.batch, and serializes keys and data like the handler.
+        """
+        self._pipeline = pipeline
+        self._get_validated_inputs = get_validated_inputs
+        self._get_validated_key = get_validated_key
+
+    def set(self, key: Any, data: Any, lifetime: int = 3600) -> bool:
+        """Queue setting a key, value pair for a given lifetime."""
+        serialized_key, serialized_data = self._get_validated_inputs(key, data)
+        if lifetime is None:
+            self._pipeline.set(serialized_key, serialized_data)
+        else:
+            self._pipeline.set(serialized_key, serialized_data, ex=lifetime)
+        return True
+
+    def set_hash_fields(self, key: Any, values: Dict[str, str], lifetime: int = 3600) -> bool:
+        """Queue setting fields of a hash and resetting its lifetime."""
+        serialized_key = self._get_validated_key(key)
+        for field, value in values.items():
+            self._pipeline.hset(serialized_key, field, value)
+        self._pipeline.expire(serialized_key, lifetime)
+        return True
+
+    def append(self, key: Any, values: Sequence[str], lifetime: int = 3600) -> bool:
+        """Queue appending values to the end of a list and resetting its lifetime."""
+        serialized_key = self._get_validated_key(key)
+        self._pipeline.rpush(serialized_key, *values)
+        self._pipeline.expire(serialized_key, lifetime)
+        return True
+
+    def set_score(self, key: Any, member: str, score: float) -> bool:
+        """Queue adding a member to a sorted set, or changing its score."""
+        self._pipeline.zadd(self._get_validated_key(key), {member: score})
+        return True
+
+    def delete(self, key: Any) -> bool:
+        """Queue deleting the data for a given key"""
+        self._pipeline.delete(self._get_validated_key(key))
+        return True
+
+    def publish(self, channel: str, message: str) -> bool:
+        """Queue publishing a message, sent once the rest of the batch is written."""
+        self._pipeline.publish(channel, message)
+        return True
+
+
+class RedisSubscriber:
+    def __init__(self, redis: StrictRedis, pattern: str) -> None:
+        """Listens to every channel that matches a pattern on a single connection,
+        and hands the messages to the threads waiting on each channel.
+
+        Args:
+            redis: StrictRedis, the redis client
+            pattern: str, the glob-style pattern of the channels
+        """
+        self._pattern = pattern
+        self._lock = threading.Lock()
+        self._listeners: Dict[str, List[queue.Queue]] = defaultdict(list)
+        self._pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.psubscribe(**{pattern: self._dispatch})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=1, daemon=True, exception_handler=self._handle_exception)
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether messages are still being received."""
+        return self._thread.is_alive()
+
+    def _dispatch(self, message: dict) -> None:
+        """Pass a message on to everyone listening to its channel."""
+        with self._lock:
+            listeners = list(self._listeners.get(message['channel'], []))
+        for listener in listeners:
+            listener.put(message['data'])
+
+    def _handle_exception(self, exception: BaseException, pubsub: Any, thread: Any) -> None:
+        """Subscribe again after losing the connection, instead of ending the thread.
+
+        Runs on the subscriber's thread, which carries on listening afterwards.
+        Every listener is handed MESSAGES_MISSED once subscribed again.
+        """
+        logger.error('Lost the subscription to {}: {}'.format(self._pattern, exception))
+        time.sleep(RESUBSCRIBE_INTERVAL)
+        try:
+            # Connecting again subscribes again to everything the pubsub had
+            pubsub.connection.connect()
+        except Exception as resubscribe_exception:
+            # Tried again once the next read fails as well
+            logger.error('Could not subscribe to {} again: {}'.format(
+                self._pattern, resubscribe_exception))
+            return
+        logger.info('Subscribed to {} again.'.format(self._pattern))
+        with self._lock:
+            listeners = [
+                listener
+                for channel_listeners in self._listeners.values()
+                for listener in channel_listeners
+            ]
+        for listener in listeners:
+            listener.put(MESSAGES_MISSED)
+
+    @contextmanager
+    def listen(self, channel: str) -> Generator[queue.Queue, None, None]:
+        """Receive the messages on a channel in a queue while in the block."""
+        listener = queue.Queue()
+        with self._lock:
+            self._listeners[channel].append(listener)
+        try:
+            yield listener
+        finally:
+            with self._lock:
+                self._listeners[channel].remove(listener)
+                if not self._listeners[channel]:
+                    del self._listeners[channel]
+
+
 class RedisCacheHandler(KeyValueStore):
     def __init__(
         self,
@@ -35,10 +174,14 @@ class RedisCacheHandler(KeyValueStore):
             decode_responses=True,
             encoding='utf-8'
         )
+        # For reading binary data, which the connection above would decode as text
+        self._binary_redis = StrictRedis(host=host, port=port, db=db)
         self._key_serializer = key_serializer
         self._key_deserializer = key_deserializer
         self._data_serializer = data_serializer
         self._data_deserializer = data_deserializer
+        self._subscribers_lock = threading.Lock()
+        self._subscribers: Dict[str, RedisSubscriber] = {}
 
     def get(self, key: Any) -> Any:
         """Get the data for the given key."""
@@ -83,6 +226,36 @@ class RedisCacheHandler(KeyValueStore):
 
         return True
 
+    def get_many(self, keys: Sequence[Any]) -> List[Any]:
+        """Get the data for several keys in one round trip, with None for missing keys."""
+        if not keys:
+            return []
+        serialized_keys = [self._get_validated_key(key) for key in keys]
+        values = self._redis.mget(serialized_keys)
+        if self._data_deserializer is None:
+            return values
+        return [
+            self._data_deserializer(data) if data is not None else None
+            for data in values
+        ]
+
+    def set_many(self, items: Sequence[Tuple[Any, Any, Optional[int]]]) -> bool:
+        """Set several key, value pairs in a single transaction.
+
+        Args:
+            items: list of (key, data, lifetime), with a lifetime of None for no
+                expiration time
+
+        Returns:
+            bool, should be True for a successful operation
+        """
+        if not items:
+            return True
+        with self.batch() as batch:
+            for key, data, lifetime in items:
+                batch.set(key, data, lifetime=lifetime)
+        return True
+
     @contextmanager
     def lock(
         self,
@@ -103,9 +276,119 @@ class RedisCacheHandler(KeyValueStore):
         if not isinstance(serialized_key, str):
             raise AssertionError('Illegal key of type {}'.format(serialized_key))
 
-        self._redis.delete([serialized_key])
+        self._redis.delete(serialized_key)
+        return True
+
+    def delete_many(self, keys: Sequence[Any]) -> bool:
+        """Delete the data for several keys in one round trip."""
+        if keys:
+            self._redis.delete(*[self._get_validated_key(key) for key in keys])
+        return True
+
+    def append(self, key: Any, values: Sequence[str], lifetime: int = 3600) -> int:
+        """Append values to the end of a list and reset its lifetime.
+
+        Both happen in a single transaction.
+
+        Args:
+            key: the key of the list, will be serialized to string
+            values: the strings to append
+            lifetime: int, the expiration time in seconds
+
+        Returns:
+            int, the length of the list after appending
+        """
+        serialized_key = self._get_validated_key(key)
+        pipeline = self._redis.pipeline()
+        pipeline.rpush(serialized_key, *values)
+        pipeline.expire(serialized_key, lifetime)
+        length, _ = pipeline.execute()
+        return length
+
+    def get_range(self, key: Any, start: int, end: int = -1) -> List[str]:
+        """Get the values of a list from the start index to the end index, inclusive."""
+        serialized_key = self._get_validated_key(key)
+        return self._redis.lrange(serialized_key, start, end)
+
+    def get_hash(self, key: Any) -> Dict[str, str]:
+        """Get every field of a hash."""
+        serialized_key = self._get_validated_key(key)
+        return self._redis.hgetall(serialized_key)
+
+    def set_hash_fields(self, key: Any, values: Dict[str, str], lifetime: int = 3600) -> bool:
+        """Set fields of a hash and reset its lifetime, in a single transaction."""
+        serialized_key = self._get_validated_key(key)
+        pipeline = self._redis.pipeline()
+        for field, value in values.items():
+            pipeline.hset(serialized_key, field, value)
+        pipeline.expire(serialized_key, lifetime)
+        pipeline.execute()
         return True
 
+    def delete_hash_fields(self, key: Any, fields: Sequence[str]) -> bool:
+        """Delete fields of a hash."""
+        serialized_key = self._get_validated_key(key)
+        self._redis.hdel(serialized_key, *fields)
+        return True
+
+    @contextmanager
+    def batch(self) -> Generator[RedisBatch, None, None]:
+        """Queue up writes and send them in a single transaction at the end of the block.
+
+        Nothing is sent if the block raises an exception.
+        """
+        pipeline = self._redis.pipeline()
+        yield RedisBatch(pipeline, self._get_validated_inputs, self._get_validated_key)
+        pipeline.execute()
+
+    def subscriber(self, pattern: str) -> RedisSubscriber:
+        """Get the subscriber to the channels that match a pattern, started on first use.
+
+        There is one per pattern, so a process holds a single connection for all of
+        its listeners on those channels. A subscriber that has stopped is replaced.
+        """
+        with self._subscribers_lock:
+            subscriber = self._subscribers.get(pattern)
+            if subscriber is None or not subscriber.is_alive:
+                subscriber = RedisSubscriber(self._redis, pattern)
+                self._subscribers[pattern] = subscriber
+            return subscriber
+
+    def register_script(
+        self,
+        script: str,
+        binary: bool = False
+    ) -> Callable[[Sequence[str], Sequence[Any]], Any]:
+        """Register a Lua script to run atomically on the server.
+
+        Args:
+            script: str, the Lua source
+            binary: bool, whether the script's strings are returned as bytes instead
+                of being decoded
+
+        Returns:
+            function, runs the script given its keys and arguments
+        """
+        registered_script = self._redis.register_script(script)
+
+        def run_script(keys: Sequence[str], args: Sequence[Any]) -> Any:
+            client = self._binary_redis if binary else self._redis
+            return registered_script(keys=keys, args=args, client=client)
+
+        return run_script
+
+    def _get_validated_key(self, key: Any) -> str:
+        """Serialize and validate a key"""
+        if self._key_serializer is not None:
+            serialized_key = self._key_serializer(key)
+        else:
+            serialized_key = key
+
+        if not isinstance(serialized_key, str):
+            raise AssertionError('Illegal key of type {}'.format(serialized_key))
+
+        return serialized_key
+
     def _get_validated_inputs(self, key: Any, data: Any) -> Tuple[str, str]:
         """Serialize and validate an input key and data"""
         if self._key_serializer is not None:
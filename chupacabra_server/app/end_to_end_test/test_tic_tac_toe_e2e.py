@@ -5,7 +5,7 @@ from chupacabra_client.protos.game_structs_pb2 import (
 )
 import grpc
 from protos.game_server_pb2 import (
-    GameRequest, GameRequestStatusRequest, MoveRequest, UserGameInfo
+    GameRequest, GameRequestStatusRequest, MoveRequest, PlayerRequest, UserGameInfo
 )
 from protos.game_server_pb2_grpc import GameServerStub
 
@@ -50,6 +50,14 @@ class TestTicTacToeServer(TestCase):
         # Adding a second request should fail
         request_response1 = self.client_stub.RequestGame(request1)
         self.assertFalse(request_response1.success)
+        # The first request is pending, without a game yet
+        pending_response1 = self.client_stub.ListPendingRequests(
+            PlayerRequest(player_id=self.player1['id']))
+        self.assertEqual(
+            [request_response1.request_id],
+            [pending.request_id for pending in pending_response1.requests]
+        )
+        self.assertFalse(pending_response1.requests[0].game_found)
         # Another user's request will get matched and start a game
         request_response2 = self.client_stub.RequestGame(request2)
 
@@ -68,6 +76,10 @@ class TestTicTacToeServer(TestCase):
         self.assertTrue(status_response1.game_found)
         self.assertTrue(status_response2.game_found)
         self.assertEqual(status_response1.game_id, status_response2.game_id)
+        # Waiting on a matched request gives back the game right away
+        wait_responses = list(self.client_stub.WaitForGame(status_request1))
+        self.assertEqual(1, len(wait_responses))
+        self.assertEqual(status_response1.game_id, wait_responses[0].game_id)
 
         # Check the game state
         game_info1 = UserGameInfo(
@@ -203,3 +215,7 @@ class TestTicTacToeServer(TestCase):
         move_response = self.client_stub.MakeMove(move5)
         self.assertTrue(move_response.success)
         self.assertEqual('over', move_response.status_info.state.mode)
+        # Watching a finished game gives back its final status and ends
+        watch_responses = list(self.client_stub.WatchGame(second_player))
+        self.assertEqual(1, len(watch_responses))
+        self.assertEqual('over', watch_responses[0].status_info.state.mode)
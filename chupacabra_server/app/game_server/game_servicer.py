@@ -1,10 +1,24 @@
-from typing import Callable, NamedTuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence
 
-from protos.game_server_pb2_grpc import GameServerServicer
+import grpc
+
+from protos.game_server_pb2_grpc import GameServerServicer, add_GameServerServicer_to_server
+from utils.stream_limit import StreamLimit
+
+
+# Methods whose responses may be serialized ahead of time
+PRESERIALIZED_METHODS = ('DescribeGame', 'DescribeMoves')
 
 
 class GameImplementation(NamedTuple):
-    """Class to hold the different game functions."""
+    """Class to hold the different game functions.
+
+    The describe game and describe moves functions may return their response
+    either as a message or already serialized, as bytes, when the servicer is
+    added with add_game_servicer_to_server. The wait for
+    game and watch game functions take the grpc context of the call as well
+    as the request, to find out when the call ends.
+    """
 
     request_game_function: Callable
     check_game_request_function: Callable
@@ -14,12 +28,26 @@ class GameImplementation(NamedTuple):
     get_game_status_function: Callable
     get_legal_moves_function: Callable
     forfeit_game_function: Callable
+    list_pending_requests_function: Callable = None
+    wait_for_game_function: Callable = None
+    watch_game_function: Callable = None
 
 
 class BasicGameServicer(GameServerServicer):
-    def __init__(self, implementation: GameImplementation) -> None:
-        """Basic game server to run on a fairly common game interface."""
+    def __init__(
+        self,
+        implementation: GameImplementation,
+        stream_limit: StreamLimit = None
+    ) -> None:
+        """Basic game server to run on a fairly common game interface.
+
+        Args:
+            implementation: GameImplementation, the game functions
+            stream_limit: Maybe(StreamLimit), caps the streams open at once,
+                DEFAULT_MAX_STREAMS if not given
+        """
         self._implementation: GameImplementation = implementation
+        self._stream_limit = stream_limit or StreamLimit()
 
     def RequestGame(self, request, context):
         """Request a game."""
@@ -29,6 +57,13 @@ class BasicGameServicer(GameServerServicer):
         """Check if the request has been accepted."""
         return self._implementation.check_game_request_function(request)
 
+    def WaitForGame(self, request, context):
+        """Stream the request's status until it has a game."""
+        if self._implementation.wait_for_game_function is None:
+            return super().WaitForGame(request, context)
+        return self._stream_limit.stream(
+            self._implementation.wait_for_game_function(request, context), context)
+
     def DescribeGame(self, request, context):
         """Describe the game"""
         return self._implementation.describe_game_function()
@@ -45,9 +80,89 @@ class BasicGameServicer(GameServerServicer):
         """Get the game status"""
         return self._implementation.get_game_status_function(request)
 
+    def WatchGame(self, request, context):
+        """Stream the game status each time the game changes."""
+        if self._implementation.watch_game_function is None:
+            return super().WatchGame(request, context)
+        return self._stream_limit.stream(
+            self._implementation.watch_game_function(request, context), context)
+
     def GetLegalMoves(self, request, context):
         """Get the legal moves at the current time."""
         return self._implementation.get_legal_moves_function(request)
 
     def ForfeitGame(self, request, context):
         return self._implementation.forfeit_game_function(request)
+
+    def ListPendingRequests(self, request, context):
+        """List the player's game requests that have not expired."""
+        if self._implementation.list_pending_requests_function is None:
+            return super().ListPendingRequests(request, context)
+        return self._implementation.list_pending_requests_function(request)
+
+
+def _allow_serialized(serialize: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+    """Make a response serializer that sends responses serialized ahead of time as they are."""
+    def serialize_response(response: Any) -> bytes:
+        if isinstance(response, bytes):
+            return response
+        return serialize(response)
+
+    return serialize_response
+
+
+def _allow_serialized_responses(
+    method_name: str,
+    method_handler: Optional[grpc.RpcMethodHandler]
+) -> Optional[grpc.RpcMethodHandler]:
+    """Let a method in PRESERIALIZED_METHODS send bytes, and leave any other method as it is."""
+    if method_handler is None or method_name not in PRESERIALIZED_METHODS:
+        return method_handler
+    return method_handler._replace(
+        response_serializer=_allow_serialized(method_handler.response_serializer))
+
+
+class _PreserializedGenericHandler(grpc.GenericRpcHandler):
+    def __init__(self, handler: grpc.GenericRpcHandler) -> None:
+        """A generic handler whose PRESERIALIZED_METHODS may send bytes."""
+        self._handler = handler
+
+    def service(self, handler_call_details: grpc.HandlerCallDetails) -> Any:
+        """Find the method handler of a call."""
+        method_name = handler_call_details.method.rsplit('/', 1)[-1]
+        return _allow_serialized_responses(
+            method_name, self._handler.service(handler_call_details))
+
+
+class _PreserializedServer:
+    def __init__(self, server: grpc.Server) -> None:
+        """Adds the method handlers of the generated code to a server, letting the
+        PRESERIALIZED_METHODS send bytes.
+        """
+        self._server = server
+
+    def add_generic_rpc_handlers(self, generic_rpc_handlers: Sequence[Any]) -> None:
+        """Add generic handlers to the server."""
+        self._server.add_generic_rpc_handlers(
+            tuple(_PreserializedGenericHandler(handler) for handler in generic_rpc_handlers))
+
+    def add_registered_method_handlers(
+        self,
+        service_name: str,
+        method_handlers: Dict[str, grpc.RpcMethodHandler]
+    ) -> None:
+        """Add the method handlers of a service to the server."""
+        self._server.add_registered_method_handlers(service_name, {
+            method_name: _allow_serialized_responses(method_name, method_handler)
+            for method_name, method_handler in method_handlers.items()
+        })
+
+
+def add_game_servicer_to_server(servicer: GameServerServicer, server: grpc.Server) -> None:
+    """Add a game servicer to a server.
+
+    Uses the generated add_GameServerServicer_to_server, except that
+    DescribeGame and DescribeMoves may also send their responses serialized
+    ahead of time, as bytes.
+    """
+    add_GameServerServicer_to_server(servicer, _PreserializedServer(server))
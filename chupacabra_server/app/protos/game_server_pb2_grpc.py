@@ -1,167 +1,543 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
 import grpc
+import warnings
 
 from chupacabra_client.protos import game_structs_pb2 as chupacabra__client_dot_protos_dot_game__structs__pb2
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 from protos import game_server_pb2 as protos_dot_game__server__pb2
 
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
 
-class GameServerStub(object):
-  """A fairly generic game server
-  """
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
 
-  def __init__(self, channel):
-    """Constructor.
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in protos/game_server_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
 
-    Args:
-      channel: A grpc.Channel.
-    """
-    self.RequestGame = channel.unary_unary(
-        '/game_server.GameServer/RequestGame',
-        request_serializer=protos_dot_game__server__pb2.GameRequest.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.FromString,
-        )
-    self.CheckGameRequest = channel.unary_unary(
-        '/game_server.GameServer/CheckGameRequest',
-        request_serializer=protos_dot_game__server__pb2.GameRequestStatusRequest.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
-        )
-    self.DescribeGame = channel.unary_unary(
-        '/game_server.GameServer/DescribeGame',
-        request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameDescription.FromString,
-        )
-    self.DescribeMoves = channel.unary_unary(
-        '/game_server.GameServer/DescribeMoves',
-        request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameMovesResponse.FromString,
-        )
-    self.MakeMove = channel.unary_unary(
-        '/game_server.GameServer/MakeMove',
-        request_serializer=protos_dot_game__server__pb2.MoveRequest.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
-        )
-    self.GetGameStatus = channel.unary_unary(
-        '/game_server.GameServer/GetGameStatus',
-        request_serializer=protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
-        )
-    self.GetLegalMoves = channel.unary_unary(
-        '/game_server.GameServer/GetLegalMoves',
-        request_serializer=protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.FromString,
-        )
-    self.ForfeitGame = channel.unary_unary(
-        '/game_server.GameServer/ForfeitGame',
-        request_serializer=protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
-        response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
-        )
-
-
-class GameServerServicer(object):
-  """A fairly generic game server
-  """
-
-  def RequestGame(self, request, context):
-    """Request a new game
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def CheckGameRequest(self, request, context):
-    """Check a request
+class GameServerStub:
+    """A fairly generic game server
     """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def DescribeGame(self, request, context):
-    """Describe the game contained in this server
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    def __init__(self, channel):
+        """Constructor.
 
-  def DescribeMoves(self, request, context):
-    """Describe the moves available in this game
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.RequestGame = channel.unary_unary(
+                '/game_server.GameServer/RequestGame',
+                request_serializer=protos_dot_game__server__pb2.GameRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.FromString,
+                _registered_method=True)
+        self.CheckGameRequest = channel.unary_unary(
+                '/game_server.GameServer/CheckGameRequest',
+                request_serializer=protos_dot_game__server__pb2.GameRequestStatusRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+                _registered_method=True)
+        self.WaitForGame = channel.unary_stream(
+                '/game_server.GameServer/WaitForGame',
+                request_serializer=protos_dot_game__server__pb2.GameRequestStatusRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+                _registered_method=True)
+        self.DescribeGame = channel.unary_unary(
+                '/game_server.GameServer/DescribeGame',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameDescription.FromString,
+                _registered_method=True)
+        self.DescribeMoves = channel.unary_unary(
+                '/game_server.GameServer/DescribeMoves',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameMovesResponse.FromString,
+                _registered_method=True)
+        self.MakeMove = channel.unary_unary(
+                '/game_server.GameServer/MakeMove',
+                request_serializer=protos_dot_game__server__pb2.MoveRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.GetGameStatus = channel.unary_unary(
+                '/game_server.GameServer/GetGameStatus',
+                request_serializer=protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.WatchGame = channel.unary_stream(
+                '/game_server.GameServer/WatchGame',
+                request_serializer=protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.GetLegalMoves = channel.unary_unary(
+                '/game_server.GameServer/GetLegalMoves',
+                request_serializer=protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.FromString,
+                _registered_method=True)
+        self.ForfeitGame = channel.unary_unary(
+                '/game_server.GameServer/ForfeitGame',
+                request_serializer=protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+                _registered_method=True)
+        self.ListPendingRequests = channel.unary_unary(
+                '/game_server.GameServer/ListPendingRequests',
+                request_serializer=protos_dot_game__server__pb2.PlayerRequest.SerializeToString,
+                response_deserializer=chupacabra__client_dot_protos_dot_game__structs__pb2.PendingRequestsResponse.FromString,
+                _registered_method=True)
 
-  def MakeMove(self, request, context):
-    """Make a move
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def GetGameStatus(self, request, context):
-    """Get the game status
+class GameServerServicer:
+    """A fairly generic game server
     """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
 
-  def GetLegalMoves(self, request, context):
-    """Get the moves available to the user at this point in the game
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    def RequestGame(self, request, context):
+        """Request a new game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
 
-  def ForfeitGame(self, request, context):
-    """Forfeit the game
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    def CheckGameRequest(self, request, context):
+        """Check a request
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WaitForGame(self, request, context):
+        """Wait for a request to be matched, getting its status now and again once it has a game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DescribeGame(self, request, context):
+        """Describe the game contained in this server
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DescribeMoves(self, request, context):
+        """Describe the moves available in this game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MakeMove(self, request, context):
+        """Make a move
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetGameStatus(self, request, context):
+        """Get the game status
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchGame(self, request, context):
+        """Watch the game, getting its status now and again each time it changes
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetLegalMoves(self, request, context):
+        """Get the moves available to the user at this point in the game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ForfeitGame(self, request, context):
+        """Forfeit the game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListPendingRequests(self, request, context):
+        """List the player's game requests that have not expired
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
 
 
 def add_GameServerServicer_to_server(servicer, server):
-  rpc_method_handlers = {
-      'RequestGame': grpc.unary_unary_rpc_method_handler(
-          servicer.RequestGame,
-          request_deserializer=protos_dot_game__server__pb2.GameRequest.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.SerializeToString,
-      ),
-      'CheckGameRequest': grpc.unary_unary_rpc_method_handler(
-          servicer.CheckGameRequest,
-          request_deserializer=protos_dot_game__server__pb2.GameRequestStatusRequest.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.SerializeToString,
-      ),
-      'DescribeGame': grpc.unary_unary_rpc_method_handler(
-          servicer.DescribeGame,
-          request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameDescription.SerializeToString,
-      ),
-      'DescribeMoves': grpc.unary_unary_rpc_method_handler(
-          servicer.DescribeMoves,
-          request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameMovesResponse.SerializeToString,
-      ),
-      'MakeMove': grpc.unary_unary_rpc_method_handler(
-          servicer.MakeMove,
-          request_deserializer=protos_dot_game__server__pb2.MoveRequest.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
-      ),
-      'GetGameStatus': grpc.unary_unary_rpc_method_handler(
-          servicer.GetGameStatus,
-          request_deserializer=protos_dot_game__server__pb2.UserGameInfo.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
-      ),
-      'GetLegalMoves': grpc.unary_unary_rpc_method_handler(
-          servicer.GetLegalMoves,
-          request_deserializer=protos_dot_game__server__pb2.UserGameInfo.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.SerializeToString,
-      ),
-      'ForfeitGame': grpc.unary_unary_rpc_method_handler(
-          servicer.ForfeitGame,
-          request_deserializer=protos_dot_game__server__pb2.UserGameInfo.FromString,
-          response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
-      ),
-  }
-  generic_handler = grpc.method_handlers_generic_handler(
-      'game_server.GameServer', rpc_method_handlers)
-  server.add_generic_rpc_handlers((generic_handler,))
+    rpc_method_handlers = {
+            'RequestGame': grpc.unary_unary_rpc_method_handler(
+                    servicer.RequestGame,
+                    request_deserializer=protos_dot_game__server__pb2.GameRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.SerializeToString,
+            ),
+            'CheckGameRequest': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckGameRequest,
+                    request_deserializer=protos_dot_game__server__pb2.GameRequestStatusRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.SerializeToString,
+            ),
+            'WaitForGame': grpc.unary_stream_rpc_method_handler(
+                    servicer.WaitForGame,
+                    request_deserializer=protos_dot_game__server__pb2.GameRequestStatusRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.SerializeToString,
+            ),
+            'DescribeGame': grpc.unary_unary_rpc_method_handler(
+                    servicer.DescribeGame,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameDescription.SerializeToString,
+            ),
+            'DescribeMoves': grpc.unary_unary_rpc_method_handler(
+                    servicer.DescribeMoves,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameMovesResponse.SerializeToString,
+            ),
+            'MakeMove': grpc.unary_unary_rpc_method_handler(
+                    servicer.MakeMove,
+                    request_deserializer=protos_dot_game__server__pb2.MoveRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'GetGameStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetGameStatus,
+                    request_deserializer=protos_dot_game__server__pb2.UserGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'WatchGame': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchGame,
+                    request_deserializer=protos_dot_game__server__pb2.UserGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'GetLegalMoves': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetLegalMoves,
+                    request_deserializer=protos_dot_game__server__pb2.UserGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.SerializeToString,
+            ),
+            'ForfeitGame': grpc.unary_unary_rpc_method_handler(
+                    servicer.ForfeitGame,
+                    request_deserializer=protos_dot_game__server__pb2.UserGameInfo.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.SerializeToString,
+            ),
+            'ListPendingRequests': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListPendingRequests,
+                    request_deserializer=protos_dot_game__server__pb2.PlayerRequest.FromString,
+                    response_serializer=chupacabra__client_dot_protos_dot_game__structs__pb2.PendingRequestsResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'game_server.GameServer', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('game_server.GameServer', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class GameServer:
+    """A fairly generic game server
+    """
+
+    @staticmethod
+    def RequestGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/RequestGame',
+            protos_dot_game__server__pb2.GameRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckGameRequest(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/CheckGameRequest',
+            protos_dot_game__server__pb2.GameRequestStatusRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WaitForGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/game_server.GameServer/WaitForGame',
+            protos_dot_game__server__pb2.GameRequestStatusRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameRequestStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DescribeGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/DescribeGame',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameDescription.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DescribeMoves(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/DescribeMoves',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameMovesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def MakeMove(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/MakeMove',
+            protos_dot_game__server__pb2.MoveRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetGameStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/GetGameStatus',
+            protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/game_server.GameServer/WatchGame',
+            protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetLegalMoves(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/GetLegalMoves',
+            protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.LegalMovesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ForfeitGame(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/ForfeitGame',
+            protos_dot_game__server__pb2.UserGameInfo.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.GameStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListPendingRequests(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game_server.GameServer/ListPendingRequests',
+            protos_dot_game__server__pb2.PlayerRequest.SerializeToString,
+            chupacabra__client_dot_protos_dot_game__structs__pb2.PendingRequestsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
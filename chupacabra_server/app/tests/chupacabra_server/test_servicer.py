@@ -0,0 +1,80 @@
+import sys
+import types
+from unittest import TestCase, mock
+
+from chupacabra_client.protos import game_structs_pb2
+import grpc
+
+from chupacabra_server import chupacabra_implementation
+
+# The servicer's config connects to the session and user databases on import
+FAKE_CONFIG = types.SimpleNamespace(
+    get_session_handler=None, get_user_authentication_handler=None)
+with mock.patch.dict(sys.modules, {'chupacabra_server.config': FAKE_CONFIG}):
+    from chupacabra_server import servicer
+
+
+class FailedCall(grpc.RpcError):
+    pass
+
+
+def _make_stub(description=None):
+    """Make a game server stub that describes its game, or fails to if there is no description."""
+    stub = mock.Mock()
+    future = stub.DescribeGame.future.return_value
+    if description is None:
+        future.result.side_effect = FailedCall()
+    else:
+        future.result.return_value = game_structs_pb2.GameDescription(
+            name='internal name', description=description)
+    return stub
+
+
+class TestDescribeGames(TestCase):
+    def test_describe_games(self):
+        stubs = {'a': _make_stub('Game A'), 'b': _make_stub()}
+        descriptions = chupacabra_implementation.describe_games(stubs)
+
+        # Games are named after their game type, and servers that fail are left out
+        self.assertEqual(
+            {'a': game_structs_pb2.GameDescription(name='a', description='Game A')},
+            descriptions
+        )
+        for stub in stubs.values():
+            _, kwargs = stub.DescribeGame.future.call_args
+            self.assertEqual(chupacabra_implementation.DESCRIBE_GAME_TIMEOUT, kwargs['timeout'])
+
+
+class TestGameDescriptions(TestCase):
+    @mock.patch.object(servicer.time, 'monotonic')
+    @mock.patch.object(servicer.chupacabra_implementation, 'describe_games')
+    def test_retry_missing_games(self, describe_games, monotonic):
+        game_map = {'a': _make_stub(), 'b': _make_stub()}
+        chupacabra_servicer = servicer.ChupacabraServicer(game_map)
+        described_a = game_structs_pb2.GameDescription(name='a', description='Game A')
+        described_b = game_structs_pb2.GameDescription(name='b', description='Game B')
+
+        # Games that have not answered are listed by name
+        monotonic.return_value = 100.0
+        describe_games.return_value = {'a': described_a}
+        with self.assertLogs(servicer.logger, 'WARNING'):
+            self.assertEqual(
+                [described_a, game_structs_pb2.GameDescription(name='b')],
+                chupacabra_servicer._get_game_descriptions()
+            )
+        describe_games.assert_called_once_with(game_map)
+
+        # and are not asked again until the retry interval has passed
+        monotonic.return_value = 100.0 + servicer.DESCRIBE_RETRY_INTERVAL - 1
+        chupacabra_servicer._get_game_descriptions()
+        self.assertEqual(1, describe_games.call_count)
+
+        monotonic.return_value = 100.0 + servicer.DESCRIBE_RETRY_INTERVAL
+        describe_games.return_value = {'b': described_b}
+        self.assertEqual([described_a, described_b], chupacabra_servicer._get_game_descriptions())
+        describe_games.assert_called_with({'b': game_map['b']})
+
+        # Once every game is described, the game servers are not asked again
+        monotonic.return_value = 1000.0
+        chupacabra_servicer._get_game_descriptions()
+        self.assertEqual(2, describe_games.call_count)
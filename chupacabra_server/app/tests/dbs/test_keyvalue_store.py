@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from unittest import TestCase
+
+from dbs.keyvalue_store import KeyValueStore
+
+
+class DictStore(KeyValueStore):
+    """A key value store in a dictionary, counting the calls to each operation."""
+
+    def __init__(self):
+        self.data = {}
+        self.lifetimes = {}
+        self.num_calls = 0
+
+    def get(self, key):
+        self.num_calls += 1
+        return self.data.get(key)
+
+    def set(self, key, data, lifetime=3600):
+        self.num_calls += 1
+        self.data[key] = data
+        self.lifetimes[key] = lifetime
+        return True
+
+    @contextmanager
+    def lock(self, key, blocking_timeout):
+        yield None
+
+    def delete(self, key):
+        self.num_calls += 1
+        self.data.pop(key, None)
+        return True
+
+
+class TestKeyValueStore(TestCase):
+    def test_batch_operations_fall_back_to_single_keys(self):
+        store = DictStore()
+        self.assertTrue(store.set_many([('a', '1', 10), ('b', '2', None)]))
+        self.assertEqual({'a': 10, 'b': None}, store.lifetimes)
+        self.assertEqual(['1', None, '2'], store.get_many(['a', 'c', 'b']))
+        self.assertTrue(store.delete_many(['a', 'c']))
+        self.assertEqual({'b': '2'}, store.data)
+        self.assertEqual(7, store.num_calls)
+
+        self.assertEqual([], store.get_many([]))
+        self.assertTrue(store.set_many([]))
+        self.assertTrue(store.delete_many([]))
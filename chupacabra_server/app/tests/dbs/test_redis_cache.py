@@ -0,0 +1,104 @@
+import time
+from unittest import TestCase, mock
+
+from dbs import redis_cache
+from tests.tic_tac_toe.helpers import make_redis_handler, requires_fakeredis
+
+
+@requires_fakeredis
+class TestRedisCacheHandler(TestCase):
+    def setUp(self):
+        self.handler = make_redis_handler()
+        self.redis = self.handler._redis
+
+    def test_batch_operations(self):
+        with mock.patch.object(self.redis, 'get', wraps=self.redis.get) as get:
+            self.assertTrue(
+                self.handler.set_many([('a', '1', 10), ('b', '2', None), ('c', '3', 20)]))
+            self.assertEqual(['1', None, '2'], self.handler.get_many(['a', 'd', 'b']))
+            # The keys are read in one MGET rather than one GET each
+            get.assert_not_called()
+
+        # Each key gets its own lifetime, and None leaves it without one
+        self.assertTrue(0 < self.redis.ttl('a') <= 10)
+        self.assertEqual(-1, self.redis.ttl('b'))
+        self.assertTrue(10 < self.redis.ttl('c') <= 20)
+
+        self.assertTrue(self.handler.delete_many(['a', 'c', 'd']))
+        self.assertEqual(['b'], self.redis.keys('*'))
+
+        self.assertEqual([], self.handler.get_many([]))
+        self.assertTrue(self.handler.set_many([]))
+        self.assertTrue(self.handler.delete_many([]))
+
+    def test_set_many_is_one_transaction(self):
+        # A bad key stops the whole batch before anything is written
+        with self.assertRaises(AssertionError):
+            self.handler.set_many([('a', '1', 10), (2, '2', 10)])
+        self.assertEqual([], self.redis.keys('*'))
+
+    def test_serializers(self):
+        self.handler._key_serializer = lambda key: 'key.{}'.format(key)
+        self.handler._data_serializer = lambda data: ','.join(data)
+        self.handler._data_deserializer = lambda data: data.split(',')
+
+        self.handler.set_many([(1, ['a', 'b'], 10), (2, ['c'], None)])
+        self.assertEqual('a,b', self.redis.get('key.1'))
+        self.assertEqual('c', self.redis.get('key.2'))
+        self.assertEqual([['a', 'b'], None, ['c']], self.handler.get_many([1, 3, 2]))
+
+        self.handler.delete_many([1, 3])
+        self.assertEqual(['key.2'], self.redis.keys('*'))
+
+        # Keys must still end up as strings
+        self.handler._key_serializer = None
+        with self.assertRaises(AssertionError):
+            self.handler.get_many([1])
+        with self.assertRaises(AssertionError):
+            self.handler.delete_many([1])
+
+
+@requires_fakeredis
+class TestRedisSubscriber(TestCase):
+    def setUp(self):
+        self.handler = make_redis_handler()
+        self.redis = self.handler._redis
+
+    def tearDown(self):
+        for subscriber in self.handler._subscribers.values():
+            subscriber._thread.stop()
+            subscriber._thread.join(5)
+
+    @mock.patch.object(redis_cache, 'RESUBSCRIBE_INTERVAL', 0.01)
+    def test_resubscribe(self):
+        subscriber = self.handler.subscriber('game.*')
+        with subscriber.listen('game.1') as messages:
+            self.redis.publish('game.1', '1')
+            self.assertEqual('1', messages.get(timeout=5))
+
+            # The listeners are told that they missed messages once the connection is back
+            server = self.redis.connection_pool.connection_kwargs['server']
+            with self.assertLogs(redis_cache.logger, 'ERROR') as logs:
+                server.connected = False
+                give_up_time = time.time() + 5
+                while not logs.records and time.time() < give_up_time:
+                    time.sleep(0.01)
+                server.connected = True
+                self.assertIs(redis_cache.MESSAGES_MISSED, messages.get(timeout=5))
+            self.assertTrue(subscriber.is_alive)
+
+            self.redis.publish('game.1', '2')
+            self.assertEqual('2', messages.get(timeout=5))
+        self.assertIs(subscriber, self.handler.subscriber('game.*'))
+
+    def test_replace_stopped_subscriber(self):
+        subscriber = self.handler.subscriber('game.*')
+        subscriber._thread.stop()
+        subscriber._thread.join(5)
+        self.assertFalse(subscriber.is_alive)
+
+        new_subscriber = self.handler.subscriber('game.*')
+        self.assertIsNot(subscriber, new_subscriber)
+        with new_subscriber.listen('game.1') as messages:
+            self.redis.publish('game.1', '1')
+            self.assertEqual('1', messages.get(timeout=5))
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from chupacabra_client.protos import game_structs_pb2
+from google.protobuf.empty_pb2 import Empty
+import grpc
+
+from game_server.game_servicer import (
+    BasicGameServicer,
+    GameImplementation,
+    add_game_servicer_to_server
+)
+from protos import game_server_pb2
+from protos.game_server_pb2_grpc import GameServerStub
+
+
+DESCRIPTION = game_structs_pb2.GameDescription(name='game', description='A game')
+MOVES = game_structs_pb2.GameMovesResponse(
+    moves=[game_structs_pb2.MoveDescription(name='move')])
+
+
+def _make_implementation(describe_game, describe_moves):
+    return GameImplementation(
+        request_game_function=lambda request: game_structs_pb2.GameRequestResponse(
+            success=True, request_id='request'),
+        check_game_request_function=None,
+        describe_game_function=describe_game,
+        describe_moves_function=describe_moves,
+        make_move_function=None,
+        get_game_status_function=None,
+        get_legal_moves_function=None,
+        forfeit_game_function=None
+    )
+
+
+class TestGameServicer(TestCase):
+    def _serve(self, implementation):
+        server = grpc.server(ThreadPoolExecutor(max_workers=2))
+        add_game_servicer_to_server(BasicGameServicer(implementation), server)
+        port = server.add_insecure_port('127.0.0.1:0')
+        server.start()
+        self.addCleanup(server.stop, None)
+        channel = grpc.insecure_channel('127.0.0.1:{}'.format(port))
+        self.addCleanup(channel.close)
+        return GameServerStub(channel)
+
+    def test_describe_serialized(self):
+        stub = self._serve(_make_implementation(
+            DESCRIPTION.SerializeToString, MOVES.SerializeToString))
+        self.assertEqual(DESCRIPTION, stub.DescribeGame(Empty()))
+        self.assertEqual(MOVES, stub.DescribeMoves(Empty()))
+
+    def test_describe_messages(self):
+        stub = self._serve(_make_implementation(lambda: DESCRIPTION, lambda: MOVES))
+        self.assertEqual(DESCRIPTION, stub.DescribeGame(Empty()))
+        self.assertEqual(MOVES, stub.DescribeMoves(Empty()))
+
+        # The other methods are served as generated
+        response = stub.RequestGame(game_server_pb2.GameRequest(player_id='1'))
+        self.assertEqual('request', response.request_id)
+        with self.assertRaises(grpc.RpcError) as raised:
+            stub.ListPendingRequests(game_server_pb2.PlayerRequest(player_id='1'))
+        self.assertEqual(grpc.StatusCode.UNIMPLEMENTED, raised.exception.code())
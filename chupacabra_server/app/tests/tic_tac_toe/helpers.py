@@ -0,0 +1,88 @@
+import importlib.util
+import os
+import tempfile
+from typing import Sequence
+import unittest
+from unittest import mock
+
+import arrow
+from chupacabra_client.protos.game_structs_pb2 import PlayerInfo
+
+from dbs.redis_cache import RedisCacheHandler
+from tic_tac_toe import solver, tic_tac_toe_game
+from tic_tac_toe.config import get_default_tictactoe_cache_handler
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+# The Lua scripts need fakeredis with its Lua support, which comes from lupa
+requires_fakeredis = unittest.skipIf(
+    fakeredis is None or importlib.util.find_spec('lupa') is None,
+    'fakeredis and lupa are not installed'
+)
+
+
+def make_state(
+    player_ids: Sequence[str] = ('1', '2'),
+    **kwargs
+) -> tic_tac_toe_game.TicTacToeInternalState:
+    """Make a new game that is an hour away from running out of time.
+
+    Args:
+        player_ids: list of str, the players
+        kwargs: any other fields of the state, e.g. board or turn
+    """
+    good_time = arrow.utcnow().timestamp + 3600
+    return tic_tac_toe_game.TicTacToeInternalState(
+        '1',
+        list(player_ids),
+        [PlayerInfo(), PlayerInfo()],
+        good_time,
+        good_time,
+        **kwargs
+    )
+
+
+class SolverTableTestCase(unittest.TestCase):
+    """Builds one solved game in a temporary file for all the tests of a class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.table_path = os.path.join(cls.directory.name, 'solver.bin')
+        cls.table = solver.get_solver_table(cls.table_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+
+def make_redis_handler() -> RedisCacheHandler:
+    """Make a redis handler backed by its own empty in-memory fake redis."""
+    handler = RedisCacheHandler('localhost', 6379, 0)
+    server = fakeredis.FakeServer()
+    handler._redis = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+    handler._binary_redis = fakeredis.FakeStrictRedis(server=server)
+    return handler
+
+
+class DefaultHandlerTestCase(unittest.TestCase):
+    """Runs each test against an empty fake redis behind the default Tic Tac Toe handler."""
+
+    def setUp(self):
+        self.handler = get_default_tictactoe_cache_handler()
+        fake_handler = make_redis_handler()
+        for name in ('_redis', '_binary_redis', '_subscribers'):
+            patcher = mock.patch.object(self.handler, name, getattr(fake_handler, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self._stop_subscribers)
+        self.redis = fake_handler._redis
+
+    def _stop_subscribers(self):
+        for subscriber in self.handler._subscribers.values():
+            subscriber._thread.stop()
+            subscriber._thread.join(5)
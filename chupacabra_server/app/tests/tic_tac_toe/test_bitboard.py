@@ -0,0 +1,120 @@
+import itertools
+import unittest
+
+import arrow
+from chupacabra_client.protos.game_structs_pb2 import (
+    Coordinate, Coordinates, GamePieceMove, Move, PlayerInfo
+)
+import numpy as np
+
+from tic_tac_toe import bitboard, tic_tac_toe_game
+
+
+def _make_move(x_coord, y_coord):
+    return Move(
+        piece_moves=[
+            GamePieceMove(
+                locations=[
+                    Coordinates(
+                        values=[
+                            Coordinate(name='x', value=x_coord),
+                            Coordinate(name='y', value=y_coord)
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
+
+
+def _reachable_boards():
+    """Every board that can come up in a legal game, including finished ones."""
+    boards = []
+    for cells in itertools.product([0, 1, -1], repeat=9):
+        board = np.array(cells, dtype=np.int8).reshape([3, 3])
+        num_x = int(np.sum(board == 1))
+        num_o = int(np.sum(board == -1))
+        if num_x - num_o not in (0, 1):
+            continue
+        x_bits, o_bits = bitboard.from_board(board)
+        if bitboard.has_win(x_bits) and bitboard.has_win(o_bits):
+            continue
+        boards.append(board)
+    return boards
+
+
+class TestBitboard(unittest.TestCase):
+    def test_win_masks(self):
+        self.assertEqual(8, len(bitboard.WIN_MASKS))
+        self.assertEqual(8, len(set(bitboard.WIN_MASKS)))
+        for mask in bitboard.WIN_MASKS:
+            self.assertEqual(3, bin(mask).count('1'))
+
+    def test_round_trip(self):
+        board = np.array([[1, -1, 0], [0, 1, 0], [-1, 0, 0]], dtype=np.int8)
+        x_bits, o_bits = bitboard.from_board(board)
+        self.assertEqual(bitboard.cell_mask(0, 0) | bitboard.cell_mask(1, 1), x_bits)
+        self.assertEqual(bitboard.cell_mask(0, 1) | bitboard.cell_mask(2, 0), o_bits)
+        np.testing.assert_array_equal(board, bitboard.to_board(x_bits, o_bits))
+
+    def test_parity_with_numpy(self):
+        boards = _reachable_boards()
+        self.assertGreater(len(boards), 5000)
+        for board in boards:
+            self.assertEqual(
+                tic_tac_toe_game._check_for_game_over(board),
+                bitboard.check_board_for_game_over(board),
+                msg=str(board)
+            )
+
+    def test_make_move_parity(self):
+        good_time = arrow.utcnow().timestamp + 3600
+        moves = [(1, 1), (0, 0), (0, 2), (2, 0), (1, 0), (1, 2), (0, 1), (2, 1), (2, 2)]
+        states = {
+            engine: tic_tac_toe_game.TicTacToeInternalState(
+                '1', ['1', '2'], [PlayerInfo(), PlayerInfo()], good_time, good_time)
+            for engine in tic_tac_toe_game.ENGINES
+        }
+        for idx, (x_coord, y_coord) in enumerate(moves):
+            player_id = ['1', '2'][idx % 2]
+            for engine, state in states.items():
+                message, new_state = tic_tac_toe_game.make_move(
+                    state, _make_move(x_coord, y_coord), player_id, engine=engine)
+                self.assertEqual('Success.', message)
+                states[engine] = new_state
+            numpy_state = states[tic_tac_toe_game.NUMPY_ENGINE]
+            for engine_state in states.values():
+                np.testing.assert_array_equal(numpy_state.board, engine_state.board)
+                self.assertEqual(numpy_state.mode, engine_state.mode)
+                self.assertEqual(numpy_state.winner, engine_state.winner)
+
+        self.assertEqual(tic_tac_toe_game.FINISHED_MODE, states['bitboard'].mode)
+        self.assertEqual(-1, states['bitboard'].winner)
+
+        with self.assertRaises(AssertionError):
+            tic_tac_toe_game.make_move(
+                states['bitboard'], _make_move(0, 0), '1', engine='unknown')
+
+    def test_symmetries(self):
+        self.assertEqual(8, len(set(bitboard.SYMMETRIES)))
+        self.assertEqual(tuple(range(9)), bitboard.SYMMETRIES[0])
+        # Win masks map onto win masks under every symmetry
+        for symmetry in range(len(bitboard.SYMMETRIES)):
+            transformed_masks = {
+                bitboard.transform(mask, symmetry) for mask in bitboard.WIN_MASKS
+            }
+            self.assertEqual(set(bitboard.WIN_MASKS), transformed_masks)
+
+    def test_canonicalize(self):
+        corners = [(0, 0), (0, 2), (2, 0), (2, 2)]
+        canonical_forms = {
+            bitboard.canonicalize(bitboard.cell_mask(*corner), 0)[:2]
+            for corner in corners
+        }
+        self.assertEqual(1, len(canonical_forms))
+
+        x_bits = bitboard.cell_mask(2, 2)
+        o_bits = bitboard.cell_mask(1, 1)
+        canonical_x, canonical_o, symmetry = bitboard.canonicalize(x_bits, o_bits)
+        self.assertEqual(canonical_x, bitboard.transform(x_bits, symmetry))
+        self.assertEqual(canonical_o, bitboard.transform(o_bits, symmetry))
@@ -0,0 +1,42 @@
+import numpy as np
+
+from tests.tic_tac_toe.helpers import SolverTableTestCase, make_state
+from tic_tac_toe import bot, tic_tac_toe_game
+
+
+class TestBot(SolverTableTestCase):
+    def test_has_bot(self):
+        self.assertTrue(bot.has_bot(make_state(['1', bot.BOT_PLAYER_ID])))
+        self.assertFalse(bot.has_bot(make_state(['1', '2'])))
+        self.assertTrue(bot.is_bot(bot.BOT_PLAYER_ID))
+        self.assertFalse(bot.is_bot('1'))
+
+    def test_bot_moves_on_its_turn(self):
+        state = make_state([bot.BOT_PLAYER_ID, '1'])
+        new_state = bot.play_bot_turn(state, self.table)
+        self.assertEqual(1, np.sum(new_state.board != 0))
+        self.assertEqual(1, new_state.turn)
+
+        # Not the bot's turn any more
+        self.assertIs(new_state, bot.play_bot_turn(new_state, self.table))
+
+    def test_bot_takes_the_win(self):
+        board = np.array([[-1, -1, 0], [1, 1, 0], [1, 0, 0]], dtype=np.int8)
+        state = make_state(['1', bot.BOT_PLAYER_ID], board=board, turn=1)
+        new_state = bot.play_bot_turn(state, self.table)
+        self.assertEqual(tic_tac_toe_game.FINISHED_MODE, new_state.mode)
+        self.assertEqual(1, new_state.winner)
+        self.assertEqual(-1, new_state.board[0, 2])
+
+    def test_bot_never_loses(self):
+        # The human always plays the first open cell
+        for bot_index in range(2):
+            player_ids = ['1', '1']
+            player_ids[bot_index] = bot.BOT_PLAYER_ID
+            state = bot.play_bot_turn(make_state(player_ids), self.table)
+            while state.mode == tic_tac_toe_game.PLAY_MODE:
+                x_coord, y_coord = np.argwhere(state.board == 0)[0]
+                move = bot._make_place_mark_move(int(x_coord), int(y_coord))
+                _, state = tic_tac_toe_game.make_move(state, move, '1')
+                state = bot.play_bot_turn(state, self.table)
+            self.assertIn(state.winner, (-1, bot_index))
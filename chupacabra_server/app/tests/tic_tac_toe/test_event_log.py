@@ -0,0 +1,76 @@
+import unittest
+
+import numpy as np
+
+from tests.tic_tac_toe.helpers import make_state
+from tic_tac_toe import event_log, tic_tac_toe_game
+
+
+class TestEventLog(unittest.TestCase):
+    def assertStatesEqual(self, expected, actual):
+        np.testing.assert_array_equal(expected.board, actual.board)
+        self.assertEqual(expected.mode, actual.mode)
+        self.assertEqual(expected.turn, actual.turn)
+        self.assertEqual(expected.winner, actual.winner)
+        self.assertEqual(expected.version, actual.version)
+        self.assertEqual(expected.turn_expiration_time, actual.turn_expiration_time)
+
+    def test_events(self):
+        self.assertEqual('m1,2,100', event_log.make_move_event(1, 2, 100))
+        self.assertEqual('f-1', event_log.make_finish_event(-1))
+
+        state = event_log.apply_event(make_state(), 'm1,2,100')
+        self.assertEqual(1, state.board[1, 2])
+        self.assertEqual(1, state.turn)
+        self.assertEqual(100, state.turn_expiration_time)
+        self.assertEqual(1, state.version)
+
+        state = event_log.apply_event(state, 'f0')
+        self.assertEqual(tic_tac_toe_game.FINISHED_MODE, state.mode)
+        self.assertEqual(0, state.winner)
+        self.assertEqual(2, state.version)
+
+        with self.assertRaises(AssertionError):
+            event_log.apply_event(state, 'm0,0,100')
+        with self.assertRaises(AssertionError):
+            event_log.apply_event(make_state(), 'x')
+
+    def test_replay_game(self):
+        moves = [(1, 1), (0, 0), (0, 2), (2, 0), (1, 0), (1, 2), (0, 1), (2, 1), (2, 2)]
+        initial_state = make_state()
+        state = initial_state
+        log = []
+        for x_coord, y_coord in moves:
+            new_state = tic_tac_toe_game.place_mark(state, x_coord, y_coord, 100)
+            events = event_log.diff_events(state, new_state)
+            self.assertEqual(1, len(events))
+            log.extend(events)
+            state = new_state
+
+        self.assertEqual(tic_tac_toe_game.FINISHED_MODE, state.mode)
+        self.assertEqual(len(moves), state.version)
+        self.assertStatesEqual(state, event_log.apply_events(initial_state, log))
+
+        # Rebuilding from a snapshot part way through gives the same state
+        snapshot = event_log.apply_events(initial_state, log[:4])
+        self.assertStatesEqual(
+            state, event_log.apply_events(snapshot, log[snapshot.version:]))
+        # Replaying places the marks on a copy of the snapshot's board
+        self.assertEqual(4, np.count_nonzero(snapshot.board))
+        self.assertEqual(0, np.count_nonzero(initial_state.board))
+
+    def test_diff_several_changes(self):
+        state = make_state()
+        # A player's move and the bot's reply are saved together
+        new_state = tic_tac_toe_game.place_mark(state, 0, 0, 100)
+        new_state = tic_tac_toe_game.place_mark(new_state, 1, 1, 200)
+        new_state = tic_tac_toe_game.finish_game(new_state, 1)
+        events = event_log.diff_events(state, new_state)
+        self.assertEqual(['m0,0,200', 'm1,1,200', 'f1'], events)
+        self.assertStatesEqual(new_state, event_log.apply_events(state, events))
+
+        self.assertEqual([], event_log.diff_events(state, state))
+
+        # Changes that are not moves or endings cannot be logged
+        with self.assertRaises(AssertionError):
+            event_log.diff_events(state, state.evolve(turn=1))
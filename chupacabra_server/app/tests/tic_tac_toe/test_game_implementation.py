@@ -0,0 +1,292 @@
+import threading
+import time
+from unittest import mock
+
+from chupacabra_client.protos import game_structs_pb2
+import grpc
+
+from game_server.game_servicer import BasicGameServicer
+from protos import game_server_pb2
+from dbs import redis_cache
+from tests.tic_tac_toe.helpers import DefaultHandlerTestCase, make_state, requires_fakeredis
+from tic_tac_toe import game_implementation
+from tic_tac_toe import tic_tac_toe_game as ttt
+from tic_tac_toe.config import get_default_tictactoe_config
+from utils.stream_limit import StreamLimit
+
+
+class Aborted(Exception):
+    pass
+
+
+class FakeContext:
+    """The parts of a grpc.ServicerContext that the streaming calls use."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+        return True
+
+    def end_call(self):
+        for callback in self.callbacks:
+            callback()
+
+    def abort(self, code, details):
+        raise Aborted(code, details)
+
+
+def _request_game(player_id):
+    return game_implementation.request_game(game_server_pb2.GameRequest(
+        player_id=player_id,
+        player_info=game_structs_pb2.PlayerInfo(username='user' + player_id)
+    ))
+
+
+def _make_status_request(player_id, request_id):
+    return game_server_pb2.GameRequestStatusRequest(
+        player_id=player_id, request_id=request_id)
+
+
+def _make_move(game_id, player_id, x, y):
+    coordinates = [
+        game_structs_pb2.Coordinate(name='x', value=x),
+        game_structs_pb2.Coordinate(name='y', value=y)
+    ]
+    return game_implementation.make_move(game_server_pb2.MoveRequest(
+        game_info=game_server_pb2.UserGameInfo(player_id=player_id, game_id=game_id),
+        move=game_structs_pb2.Move(piece_moves=[game_structs_pb2.GamePieceMove(
+            locations=[game_structs_pb2.Coordinates(values=coordinates)])])
+    ))
+
+
+def _forfeit_game(game_id, player_id):
+    return game_implementation.forfeit_game(
+        game_server_pb2.UserGameInfo(player_id=player_id, game_id=game_id))
+
+
+@requires_fakeredis
+class TestWaitForGame(DefaultHandlerTestCase):
+    def setUp(self):
+        super().setUp()
+        # Only another player can match the requests
+        patcher = mock.patch.object(get_default_tictactoe_config(), 'bot_wait_time', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_listeners_removed(self):
+        subscriber = self.handler.subscriber(game_implementation.REQUEST_CHANNEL_PATTERN)
+        self.assertEqual({}, subscriber._listeners)
+
+    def test_match_is_pushed(self):
+        request_id = _request_game('1').request_id
+        responses = game_implementation.wait_for_game(
+            _make_status_request('1', request_id), FakeContext())
+        self.assertFalse(next(responses).game_found)
+
+        # The match is sent as soon as it happens
+        timer = threading.Timer(0.1, _request_game, ['2'])
+        timer.start()
+        start_time = time.monotonic()
+        response = next(responses)
+        self.assertLess(time.monotonic() - start_time, 5)
+        timer.join()
+        self.assertTrue(response.game_found)
+        self.assertEqual(game_implementation.get_request_queue().get_pending(
+            '1', time.time())[0].game_id, response.game_id)
+        self.assertEqual([], list(responses))
+        self.assert_listeners_removed()
+
+    def test_already_matched(self):
+        request_id = _request_game('1').request_id
+        game_id = _request_game('2').game_id
+        responses = list(game_implementation.wait_for_game(
+            _make_status_request('1', request_id), FakeContext()))
+        self.assertEqual([game_id], [response.game_id for response in responses])
+
+    def test_request_not_found(self):
+        responses = list(game_implementation.wait_for_game(
+            _make_status_request('1', 'missing'), FakeContext()))
+        self.assertEqual(1, len(responses))
+        self.assertFalse(responses[0].success)
+        self.assert_listeners_removed()
+
+    def test_wait_ends_with_the_request(self):
+        request_id = _request_game('1').request_id
+        with mock.patch.object(game_implementation, 'REQUEST_LIFETIME', 0.2):
+            responses = list(game_implementation.wait_for_game(
+                _make_status_request('1', request_id), FakeContext()))
+        self.assertEqual(2, len(responses))
+        self.assertTrue(responses[1].success)
+        self.assertFalse(responses[1].game_found)
+        self.assert_listeners_removed()
+
+    def test_call_ended(self):
+        request_id = _request_game('1').request_id
+        context = FakeContext()
+        responses = game_implementation.wait_for_game(
+            _make_status_request('1', request_id), context)
+        self.assertFalse(next(responses).game_found)
+        self.assertEqual(1, len(context.callbacks))
+
+        # The wait stops right away, without waiting for the request to run out
+        timer = threading.Timer(0.1, context.end_call)
+        timer.start()
+        self.assertEqual([], list(responses))
+        timer.join()
+        self.assert_listeners_removed()
+
+    def test_stream_limit(self):
+        servicer = BasicGameServicer(
+            game_implementation.make_tic_tac_toe_implementation(), StreamLimit(max_streams=1))
+        request = _make_status_request('1', _request_game('1').request_id)
+        first_stream = servicer.WaitForGame(request, FakeContext())
+        self.assertFalse(next(first_stream).game_found)
+
+        # Streams over the limit are turned away
+        with self.assertRaises(Aborted) as aborted:
+            next(servicer.WaitForGame(request, FakeContext()))
+        self.assertEqual(grpc.StatusCode.RESOURCE_EXHAUSTED, aborted.exception.args[0])
+
+        # And let in once a stream ends
+        first_stream.close()
+        second_stream = servicer.WaitForGame(request, FakeContext())
+        self.assertFalse(next(second_stream).game_found)
+        second_stream.close()
+        self.assert_listeners_removed()
+
+
+@requires_fakeredis
+class TestWatchGame(DefaultHandlerTestCase):
+    def start_game(self, game_id):
+        with self.handler.batch() as batch:
+            game_implementation._save_new_game(batch, make_state().evolve(id=game_id))
+
+    def watch(self, game_id, context=None):
+        return game_implementation.watch_game(
+            game_server_pb2.UserGameInfo(player_id='2', game_id=game_id), context or FakeContext())
+
+    def assert_listeners_removed(self):
+        subscriber = self.handler.subscriber(game_implementation.GAME_CHANNEL_PATTERN)
+        self.assertEqual({}, subscriber._listeners)
+
+    def test_changes_are_pushed(self):
+        self.start_game('pushed')
+        responses = self.watch('pushed')
+        self.assertEqual([], next(responses).status_info.legal_moves)
+
+        # Announcing the version the stream already has sends nothing
+        self.redis.publish(game_implementation._make_game_channel('pushed'), '0')
+        timer = threading.Timer(0.1, _make_move, ['pushed', '1', 0, 0])
+        timer.start()
+        response = next(responses)
+        timer.join()
+        self.assertTrue(response.success)
+        self.assertEqual(ttt.PLAY_MODE, response.status_info.state.mode)
+        self.assertNotEqual([], response.status_info.legal_moves)
+
+        # The stream ends with the game
+        timer = threading.Timer(0.1, _forfeit_game, ['pushed', '1'])
+        timer.start()
+        finished = list(responses)
+        timer.join()
+        self.assertEqual(1, len(finished))
+        self.assertEqual(ttt.FINISHED_MODE, finished[0].status_info.state.mode)
+        self.assert_listeners_removed()
+
+    def test_game_not_found(self):
+        responses = list(self.watch('missing'))
+        self.assertEqual(1, len(responses))
+        self.assertFalse(responses[0].success)
+        self.assert_listeners_removed()
+
+    def test_call_ended(self):
+        self.start_game('ended')
+        context = FakeContext()
+        responses = self.watch('ended', context)
+        self.assertTrue(next(responses).success)
+
+        timer = threading.Timer(0.1, context.end_call)
+        timer.start()
+        self.assertEqual([], list(responses))
+        timer.join()
+        self.assert_listeners_removed()
+
+    @mock.patch.object(redis_cache, 'RESUBSCRIBE_INTERVAL', 0.01)
+    def test_lost_subscription(self):
+        self.start_game('lost')
+        responses = self.watch('lost')
+        self.assertEqual(ttt.PLAY_MODE, next(responses).status_info.state.mode)
+
+        # The game ends without the stream hearing about it
+        with mock.patch.object(
+            game_implementation, '_make_game_channel', return_value='unheard'
+        ):
+            self.assertTrue(_forfeit_game('lost', '1').success)
+
+        # Once subscribed again, the stream loads the game, sends it, and ends
+        server = self.redis.connection_pool.connection_kwargs['server']
+        with self.assertLogs(redis_cache.logger, 'ERROR') as logs:
+            server.connected = False
+            give_up_time = time.time() + 5
+            while not logs.records and time.time() < give_up_time:
+                time.sleep(0.01)
+            server.connected = True
+        resent = list(responses)
+        self.assertEqual(1, len(resent))
+        self.assertEqual(ttt.FINISHED_MODE, resent[0].status_info.state.mode)
+        self.assert_listeners_removed()
+
+
+@requires_fakeredis
+class TestUpdateGameState(DefaultHandlerTestCase):
+    def setUp(self):
+        super().setUp()
+        with self.handler.batch() as batch:
+            game_implementation._save_new_game(batch, make_state().evolve(id='busy'))
+        self.load_state = game_implementation._load_state
+        self.num_changes = 0
+
+    def load_and_change(self, num_changes):
+        """Load the game, and then have someone else save a change before the caller can."""
+        def load_state(game_id, player_id):
+            loaded = self.load_state(game_id, player_id)
+            if self.num_changes < num_changes:
+                self.num_changes += 1
+                _, internal_state, log_position = loaded
+                self.assertTrue(game_implementation._save_state(
+                    '2',
+                    internal_state,
+                    internal_state.evolve(version=internal_state.version + 1),
+                    log_position
+                ))
+            return loaded
+
+        return mock.patch.object(game_implementation, '_load_state', side_effect=load_state)
+
+    def test_retry(self):
+        with self.load_and_change(1) as load_state:
+            response = _make_move('busy', '1', 1, 1)
+        self.assertTrue(response.success)
+        self.assertEqual(2, load_state.call_count)
+
+        # The move is made on top of the other change
+        internal_state = self.load_state('busy', '1')[1]
+        self.assertEqual(2, internal_state.version)
+        self.assertEqual(1, internal_state.turn)
+        self.assertEqual(1, int(internal_state.board[1, 1]))
+
+    def test_give_up(self):
+        max_attempts = game_implementation.MAX_SAVE_ATTEMPTS
+        with self.load_and_change(max_attempts) as load_state:
+            response = _make_move('busy', '1', 1, 1)
+        self.assertFalse(response.success)
+        self.assertEqual('The game is busy. Please try again.', response.message)
+        self.assertEqual(max_attempts, load_state.call_count)
+
+        # Only the other changes were saved
+        internal_state = self.load_state('busy', '1')[1]
+        self.assertEqual(max_attempts, internal_state.version)
+        self.assertEqual(0, internal_state.turn)
+        self.assertEqual(0, int(internal_state.board[1, 1]))
@@ -0,0 +1,158 @@
+import json
+import unittest
+
+from tests.tic_tac_toe.helpers import make_redis_handler, requires_fakeredis
+from tic_tac_toe import game_store
+
+
+KEYS = ['game.game', 'game.events', 'game:valid', 'game.state']
+CHANNEL = 'game.changed'
+PLAYER_IDS = json.dumps(['1', '2'])
+
+
+@requires_fakeredis
+class TestGameStore(unittest.TestCase):
+    def setUp(self):
+        self.handler = make_redis_handler()
+        self.redis = self.handler._redis
+        self.store = game_store.GameStore(self.handler)
+
+    def save(
+        self,
+        player_id='1',
+        expected_version=0,
+        new_version=1,
+        events=('e1',),
+        snapshot=None,
+        deadline=500.0
+    ):
+        return self.store.save(
+            KEYS, CHANNEL, 'game', deadline, player_id, expected_version, new_version,
+            900, list(events), snapshot)
+
+    def new_game(self):
+        self.redis.hset(KEYS[0], mapping={
+            game_store.PLAYERS_FIELD: PLAYER_IDS,
+            game_store.STATE_FIELD: 'state0',
+            game_store.SNAPSHOT_FIELD: 0,
+            game_store.VERSION_FIELD: 0
+        })
+
+    def test_version_conflict(self):
+        self.new_game()
+        self.assertTrue(self.save(expected_version=0, new_version=1))
+
+        # A change made from the version that was loaded before is rejected
+        self.assertFalse(self.save(expected_version=0, new_version=1, events=['stale']))
+        self.assertEqual(['e1'], self.redis.lrange(KEYS[1], 0, -1))
+        self.assertEqual('1', self.redis.hget(KEYS[0], game_store.VERSION_FIELD))
+
+        self.assertTrue(self.save(player_id='2', expected_version=1, new_version=2,
+                                  events=['e2']))
+        self.assertEqual(['e1', 'e2'], self.redis.lrange(KEYS[1], 0, -1))
+
+    def test_non_player(self):
+        self.new_game()
+        self.assertIsNone(self.store.load(KEYS, '3'))
+        self.assertFalse(self.save(player_id='3'))
+        self.assertEqual(0, self.redis.llen(KEYS[1]))
+        self.assertEqual(0, self.redis.zcard(game_store.DEADLINES_KEY))
+
+        # Maintenance loads skip the player check
+        self.assertEqual(b'state0', self.store.load(KEYS, None).state_data)
+        self.assertEqual(
+            game_store.LoadedGame(state_data=None, snapshot_version=None, log_length=0,
+                                  events=[]),
+            self.store.load(['other.game', 'other.events', 'other:valid', 'other.state'],
+                            None)
+        )
+
+    def test_migrate_old_keys(self):
+        self.redis.set(KEYS[2], PLAYER_IDS)
+        self.redis.set(KEYS[3], 'old state')
+
+        loaded = self.store.load(KEYS, '2')
+        self.assertEqual(
+            game_store.LoadedGame(state_data=b'old state', snapshot_version=None,
+                                  log_length=0, events=[]),
+            loaded
+        )
+
+        # Games without a version are taken to be unchanged, and the first
+        # save moves them into the game record
+        self.assertTrue(self.save(expected_version=4, new_version=5, events=[]))
+        self.assertEqual(0, self.redis.exists(KEYS[2], KEYS[3]))
+        self.assertEqual(
+            {
+                game_store.PLAYERS_FIELD: PLAYER_IDS,
+                game_store.STATE_FIELD: 'old state',
+                game_store.VERSION_FIELD: '5'
+            },
+            self.redis.hgetall(KEYS[0])
+        )
+        self.assertEqual(b'old state', self.store.load(KEYS, '1').state_data)
+        self.assertFalse(self.save(expected_version=4, new_version=5, events=[]))
+
+    def test_snapshot_and_events(self):
+        self.new_game()
+        self.assertTrue(self.save(expected_version=0, new_version=2, events=['e1', 'e2']))
+        loaded = self.store.load(KEYS, '1')
+        self.assertEqual(b'state0', loaded.state_data)
+        self.assertEqual(0, loaded.snapshot_version)
+        self.assertEqual(2, loaded.log_length)
+        self.assertEqual(['e1', 'e2'], loaded.events)
+
+        # Only the events after the latest snapshot are loaded
+        self.assertTrue(self.save(expected_version=2, new_version=3, events=['e3'],
+                                  snapshot='state3'))
+        self.assertTrue(self.save(expected_version=3, new_version=4, events=['e4']))
+        self.assertEqual(
+            game_store.LoadedGame(state_data=b'state3', snapshot_version=3, log_length=4,
+                                  events=['e4']),
+            self.store.load(KEYS, '1')
+        )
+
+        # Without a known snapshot version, the whole log is loaded
+        self.redis.hdel(KEYS[0], game_store.SNAPSHOT_FIELD)
+        loaded = self.store.load(KEYS, '1')
+        self.assertIsNone(loaded.snapshot_version)
+        self.assertEqual(['e1', 'e2', 'e3', 'e4'], loaded.events)
+
+    def test_binary_state(self):
+        self.new_game()
+        state = bytes(range(256))
+        self.assertTrue(self.save(snapshot=state))
+        self.assertEqual(state, self.store.load(KEYS, '1').state_data)
+
+        # The events are still read as text
+        self.assertTrue(self.save(expected_version=1, new_version=2, events=['e2']))
+        loaded = self.store.load(KEYS, '1')
+        self.assertEqual(state, loaded.state_data)
+        self.assertEqual(['e2'], loaded.events)
+
+    def test_deadlines(self):
+        self.new_game()
+        pubsub = self.redis.pubsub()
+        pubsub.subscribe(CHANNEL)
+        self.assertEqual('subscribe', pubsub.get_message(timeout=1)['type'])
+
+        self.assertTrue(self.save(deadline=500.0))
+        self.assertEqual(500.0, self.redis.zscore(game_store.DEADLINES_KEY, 'game'))
+        self.assertEqual('1', pubsub.get_message(timeout=1)['data'])
+
+        self.assertTrue(self.save(expected_version=1, new_version=2, deadline=700.0))
+        self.assertEqual(700.0, self.redis.zscore(game_store.DEADLINES_KEY, 'game'))
+        self.assertEqual([], self.store.get_due(700.0, 10))
+        self.assertEqual(['game'], self.store.get_due(701.0, 10))
+
+        # A game that is over is no longer tracked
+        self.assertTrue(self.save(expected_version=2, new_version=3, deadline=None))
+        self.assertEqual(0, self.redis.zcard(game_store.DEADLINES_KEY))
+
+        self.store.set_deadline('a', 100.0)
+        self.store.set_deadline('b', 50.0)
+        with self.handler.batch() as batch:
+            self.store.add_deadline(batch, 'c', 75.0)
+        self.assertEqual(['b', 'c'], self.store.get_due(200.0, 2))
+        self.store.set_deadline('b', None)
+        self.assertEqual(['c', 'a'], self.store.get_due(200.0, 10))
@@ -0,0 +1,195 @@
+import unittest
+from unittest import mock
+
+from tests.tic_tac_toe.helpers import make_redis_handler, requires_fakeredis
+from tic_tac_toe import request_queue
+
+
+def _make_request(player_id, level='1000', time=100.0, expiration=200.0):
+    return {
+        'id': 'request-' + player_id,
+        'player_id': player_id,
+        'level': level,
+        'time': time,
+        'expiration': expiration
+    }
+
+
+class TestRequestQueue(unittest.TestCase):
+    def test_parse_level(self):
+        self.assertEqual(1200.0, request_queue.parse_level('1200'))
+        self.assertEqual(3.5, request_queue.parse_level('3.5'))
+        self.assertEqual(request_queue.DEFAULT_LEVEL, request_queue.parse_level(''))
+        self.assertEqual(request_queue.DEFAULT_LEVEL, request_queue.parse_level('expert'))
+
+    def test_matchmaking_metrics(self):
+        metrics = request_queue.MatchmakingMetrics()
+        self.assertEqual(0, metrics.stats().num_matches)
+        self.assertEqual(0.0, metrics.stats().mean_wait_time)
+
+        metrics.record_match([
+            {'id': '1', 'level': '1000', 'time': 100.0},
+            {'id': '2', 'level': '1100', 'time': 110.0}
+        ], 130.0)
+        metrics.record_match([
+            {'id': '3', 'level': '', 'time': 120.0},
+            {'id': '4', 'level': '50', 'time': 125.0}
+        ], 130.0)
+
+        stats = metrics.stats()
+        self.assertEqual(2, stats.num_matches)
+        self.assertEqual(75.0, stats.mean_level_gap)
+        self.assertEqual(100.0, stats.max_level_gap)
+        self.assertEqual(20.0, stats.mean_wait_time)
+        self.assertEqual(30.0, stats.max_wait_time)
+
+    def test_pair_requests(self):
+        requests = [
+            {'id': '1', 'level': '900', 'time': 100.0},
+            {'id': '2', 'level': '1000', 'time': 100.0},
+            {'id': '3', 'level': '1060', 'time': 100.0},
+            {'id': '4', 'level': '1500', 'time': 100.0},
+            {'id': '5', 'level': '1900', 'time': 80.0},
+            {'id': '6', 'level': '3000', 'time': 100.0}
+        ]
+
+        def pair_ids(time_now):
+            pairs = request_queue.pair_requests(requests, time_now, 100.0, 20.0)
+            return [(first['id'], second['id']) for first, second in pairs]
+
+        # 5 has waited 20 seconds, so its window is 500 wide
+        self.assertEqual([('1', '2'), ('4', '5')], pair_ids(100.0))
+        # 3 and 4 can be paired after 20 seconds, and then 5 and 6 after 30 more
+        self.assertEqual([('1', '2'), ('3', '4')], pair_ids(120.0))
+        self.assertEqual([('1', '2'), ('3', '4'), ('5', '6')], pair_ids(130.0))
+        self.assertEqual([], request_queue.pair_requests(requests[:1], 100.0, 100.0, 20.0))
+
+
+@requires_fakeredis
+class TestRequestQueueScripts(unittest.TestCase):
+    def setUp(self):
+        self.queue = request_queue.RequestQueue(
+            make_redis_handler(),
+            queue_lifetime=90,
+            request_lifetime=60,
+            level_window=100.0,
+            level_window_growth=20.0
+        )
+
+    def test_duplicate_request(self):
+        first = _make_request('1')
+        result = self.queue.match_or_enqueue(first, 100.0)
+        self.assertEqual(request_queue.QueueResult(request_queue.ENQUEUED_STATUS, first), result)
+
+        # A second request from the same player gets the one already waiting
+        second = dict(_make_request('1'), id='another-request')
+        result = self.queue.match_or_enqueue(second, 101.0)
+        self.assertEqual(request_queue.QueueResult(request_queue.QUEUED_STATUS, first), result)
+        self.assertEqual([first], self.queue.get_waiting(101.0))
+        self.assertEqual(
+            ['request-1'],
+            [pending.request_id for pending in self.queue.get_pending('1', 101.0)]
+        )
+
+    def test_match(self):
+        first = _make_request('1', level='1000')
+        far = _make_request('2', level='2000')
+        near = _make_request('3', level='1050')
+        for request in (first, far):
+            self.assertEqual(
+                request_queue.ENQUEUED_STATUS,
+                self.queue.match_or_enqueue(request, 100.0).status
+            )
+
+        # The nearest level request within the window is taken out of the queue
+        result = self.queue.match_or_enqueue(near, 100.0)
+        self.assertEqual(request_queue.QueueResult(request_queue.MATCHED_STATUS, first), result)
+        self.assertEqual([far], self.queue.get_waiting(100.0))
+        self.assertEqual(1, self.queue.metrics.stats().num_matches)
+
+        # Once its window has grown enough, a waiting request is matched too
+        other = _make_request('4', level='1500')
+        self.queue.match_or_enqueue(other, 100.0, match=False)
+        # Until then, it is told when that will be
+        self.assertEqual(
+            request_queue.WaitingMatch(requests=None, next_match_time=120.0),
+            self.queue.match_waiting('4', other['id'], 100.0)
+        )
+        self.assertEqual(
+            request_queue.WaitingMatch(requests=(other, far), next_match_time=None),
+            self.queue.match_waiting('4', other['id'], 120.0)
+        )
+        self.assertEqual([], self.queue.get_waiting(120.0))
+
+    def test_match_all(self):
+        requests = [
+            _make_request('1', level='1000'),
+            _make_request('2', level='1060'),
+            _make_request('3', level='3000')
+        ]
+        for request in requests:
+            self.queue.match_or_enqueue(request, 100.0, match=False)
+        self.assertEqual(requests, self.queue.get_waiting(100.0))
+
+        self.assertEqual([tuple(requests[:2])], self.queue.match_all(100.0))
+        self.assertEqual(requests[2:], self.queue.get_waiting(100.0))
+
+    def test_match_all_in_pages(self):
+        queue = request_queue.RequestQueue(
+            make_redis_handler(),
+            queue_lifetime=90,
+            request_lifetime=60,
+            level_window=100.0,
+            level_window_growth=20.0,
+            page_size=3
+        )
+        levels = ['1000', '2000', '3000', '3050', '4000', '5000', '5050']
+        requests = [
+            _make_request(str(idx), level=level) for idx, level in enumerate(levels)]
+        for request in requests:
+            queue.match_or_enqueue(request, 100.0, match=False)
+        self.assertEqual(requests, queue.get_waiting(100.0))
+
+        # Pairs that straddle two pages are still found
+        self.assertEqual(
+            [(requests[2], requests[3]), (requests[5], requests[6])],
+            queue.match_all(100.0)
+        )
+        self.assertEqual(
+            [requests[0], requests[1], requests[4]], queue.get_waiting(100.0))
+
+        with self.assertRaises(AssertionError):
+            request_queue.RequestQueue(make_redis_handler(), 90, 60, 100.0, 20.0, page_size=1)
+
+    def test_stale_request_expires(self):
+        stale = _make_request('1', expiration=150.0)
+        self.queue.match_or_enqueue(stale, 100.0)
+
+        # Requests past their expiration are dropped before looking for a partner
+        fresh = _make_request('2', expiration=300.0)
+        result = self.queue.match_or_enqueue(fresh, 160.0)
+        self.assertEqual(request_queue.ENQUEUED_STATUS, result.status)
+        self.assertEqual([fresh], self.queue.get_waiting(160.0))
+        self.assertIsNone(self.queue.remove('1', stale['id'], 160.0))
+        self.assertEqual([], self.queue.get_pending('1', 160.0))
+
+    def test_claim_removed_request(self):
+        first = _make_request('1', level='1000')
+        second = _make_request('2', level='1010')
+        for request in (first, second):
+            self.queue.match_or_enqueue(request, 100.0, match=False)
+        page = self.queue._get_waiting_page(100.0, 0)
+
+        # The first request leaves the queue after the matcher has read it
+        self.assertEqual(first, self.queue.remove('1', first['id'], 100.0))
+        self.assertIsNone(self.queue.remove('1', first['id'], 100.0))
+        with mock.patch.object(self.queue, '_get_waiting_page', return_value=page):
+            self.assertEqual([], self.queue.match_all(100.0))
+
+        # The pair is not claimed, so the other request keeps waiting
+        self.assertEqual([second], self.queue.get_waiting(100.0))
+        self.assertEqual(0, self.queue.metrics.stats().num_matches)
+        self.assertEqual(
+            request_queue.WaitingMatch(requests=None, next_match_time=None),
+            self.queue.match_waiting('1', first['id'], 100.0)
+        )
@@ -0,0 +1,88 @@
+import fcntl
+import os
+import shutil
+import stat
+import threading
+import time
+from unittest import mock
+
+import numpy as np
+
+from tests.tic_tac_toe.helpers import SolverTableTestCase
+from tic_tac_toe import bitboard, solver
+
+
+class TestSolver(SolverTableTestCase):
+    def test_table_file(self):
+        self.assertEqual(
+            len(solver.TABLE_HEADER) + solver.NUM_POSITIONS, os.path.getsize(self.table_path))
+        self.assertIs(self.table, solver.get_solver_table(self.table_path))
+        self.assertEqual(0o644, stat.S_IMODE(os.stat(self.table_path).st_mode))
+
+    def test_table_written_while_waiting(self):
+        path = os.path.join(self.directory.name, 'waiting.bin')
+        tables = []
+        with open(path + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            with mock.patch.object(solver, 'write_table') as write_table:
+                thread = threading.Thread(
+                    target=lambda: tables.append(solver.get_solver_table(path)))
+                thread.start()
+                time.sleep(0.1)
+                # Another process finishes the table while this one waits for the lock
+                shutil.copy(self.table_path, path)
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                thread.join(5)
+        write_table.assert_not_called()
+        self.assertEqual(1, len(tables))
+        self.assertEqual(self.table.lookup(0, 0), tables[0].lookup(0, 0))
+
+    def test_reachable_positions(self):
+        table = solver.build_table()
+        num_reachable = sum(1 for entry in table if entry != 0)
+        self.assertEqual(5478, num_reachable)
+
+    def test_empty_board_is_a_draw(self):
+        entry = self.table.lookup(0, 0)
+        self.assertEqual(-1, entry.winner)
+        self.assertIsNotNone(entry.best_move)
+
+    def test_takes_the_win(self):
+        board = np.array([[1, 1, 0], [-1, -1, 0], [0, 0, 0]], dtype=np.int8)
+        entry = self.table.lookup_board(board)
+        self.assertEqual(0, entry.winner)
+        self.assertEqual((0, 2), entry.best_move)
+
+    def test_blocks_the_win(self):
+        board = np.array([[1, 1, 0], [0, -1, 0], [0, 0, 0]], dtype=np.int8)
+        entry = self.table.lookup_board(board)
+        self.assertEqual(-1, entry.winner)
+        self.assertEqual((0, 2), entry.best_move)
+
+    def test_finished_and_unreachable_positions(self):
+        board = np.array([[1, 1, 1], [-1, -1, 0], [0, 0, 0]], dtype=np.int8)
+        entry = self.table.lookup_board(board)
+        self.assertEqual(0, entry.winner)
+        self.assertIsNone(entry.best_move)
+
+        board = np.array([[1, 1, 1], [1, 0, 0], [0, 0, 0]], dtype=np.int8)
+        self.assertIsNone(self.table.lookup_board(board))
+
+    def test_symmetric_positions_agree(self):
+        x_bits = bitboard.cell_mask(0, 0)
+        o_bits = bitboard.cell_mask(0, 1)
+        winners = {
+            self.table.lookup(
+                bitboard.transform(x_bits, symmetry),
+                bitboard.transform(o_bits, symmetry)
+            ).winner
+            for symmetry in range(len(bitboard.SYMMETRIES))
+        }
+        self.assertEqual({0}, winners)
+
+    def test_bad_table(self):
+        bad_path = os.path.join(self.directory.name, 'bad.bin')
+        with open(bad_path, 'wb') as bad_file:
+            bad_file.write(b'0' * 10)
+        with self.assertRaises(AssertionError):
+            solver.SolverTable(bad_path)
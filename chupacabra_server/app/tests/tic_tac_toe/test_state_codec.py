@@ -0,0 +1,120 @@
+import base64
+import unittest
+
+from chupacabra_client.protos.game_structs_pb2 import PlayerInfo
+import numpy as np
+
+from tic_tac_toe import state_codec
+from tic_tac_toe import tic_tac_toe_game
+
+
+def _make_state(version=7):
+    return tic_tac_toe_game.TicTacToeInternalState(
+        'game-1',
+        ['1', '2'],
+        [
+            PlayerInfo(username='player1', nickname='ABC', level='8999', team='Team A'),
+            PlayerInfo(username='player2', nickname='DEF', level='9001', team='Team A')
+        ],
+        1234567890.5,
+        1234568000,
+        board=np.array([[1, -1, 0], [0, 1, 0], [0, 0, -1]], dtype=np.int8),
+        mode=tic_tac_toe_game.FINISHED_MODE,
+        turn=1,
+        winner=0,
+        version=version
+    )
+
+
+class TestStateCodec(unittest.TestCase):
+    def assertStatesEqual(self, expected, actual):
+        self.assertEqual(expected.id, actual.id)
+        self.assertEqual(list(expected.player_ids), list(actual.player_ids))
+        self.assertEqual(list(expected.players), list(actual.players))
+        np.testing.assert_array_equal(expected.board, actual.board)
+        self.assertEqual(np.int8, actual.board.dtype)
+        self.assertEqual(expected.mode, actual.mode)
+        self.assertEqual(expected.turn, actual.turn)
+        self.assertEqual(expected.winner, actual.winner)
+        self.assertEqual(expected.turn_expiration_time, actual.turn_expiration_time)
+        self.assertEqual(expected.game_expiration_time, actual.game_expiration_time)
+        self.assertEqual(expected.version, actual.version)
+
+    def test_round_trip(self):
+        state = _make_state()
+        for codec in state_codec.STATE_CODECS.values():
+            decoded = codec.decode(codec.encode(state))
+            self.assertStatesEqual(state, decoded)
+
+    def test_binary_reads_legacy_json(self):
+        state = _make_state()
+        legacy_data = state_codec.get_state_codec('json').encode(state)
+        binary_codec = state_codec.get_state_codec('binary')
+        self.assertStatesEqual(state, binary_codec.decode(legacy_data))
+        self.assertStatesEqual(state, binary_codec.decode(legacy_data.encode('utf-8')))
+
+    def test_binary_reads_base64(self):
+        state = _make_state()
+        codec = state_codec.BinaryStateCodec()
+        data = codec.encode(state)
+        self.assertIsInstance(data, bytes)
+        self.assertTrue(data.startswith(state_codec.BINARY_MAGIC))
+
+        # States stored before they were stored as raw bytes
+        base64_data = base64.b64encode(data).decode('ascii')
+        self.assertStatesEqual(state, codec.decode(base64_data))
+        self.assertStatesEqual(state, codec.decode(base64_data.encode('ascii')))
+
+    def test_binary_board_is_writable(self):
+        codec = state_codec.BinaryStateCodec()
+        decoded = codec.decode(codec.encode(_make_state()))
+        decoded.board[1, 0] = 1
+        self.assertEqual(1, decoded.board[1, 0])
+
+    def test_binary_is_smaller(self):
+        state = _make_state()
+        json_data = state_codec.get_state_codec('json').encode(state)
+        binary_data = state_codec.get_state_codec('binary').encode(state)
+        self.assertLess(2 * len(binary_data), len(json_data))
+
+    def test_binary_interns_strings(self):
+        state = _make_state()
+        codec = state_codec.BinaryStateCodec()
+        data = codec.encode_bytes(state)
+        self.assertEqual(1, data.count(b'Team A'))
+
+    def test_binary_version(self):
+        codec = state_codec.BinaryStateCodec()
+        data = bytearray(codec.encode_bytes(_make_state()))
+        self.assertEqual(state_codec.BINARY_FORMAT_VERSION, data[2])
+
+        data[2] = 255
+        with self.assertRaises(AssertionError):
+            codec.decode(base64.b64encode(bytes(data)).decode('ascii'))
+
+        with self.assertRaises(AssertionError):
+            codec.decode_bytes(b'XX' + bytes(data[2:]))
+
+    def test_get_state_codec(self):
+        self.assertEqual('binary', state_codec.get_state_codec('binary').name)
+        with self.assertRaises(AssertionError):
+            state_codec.get_state_codec('xml')
+
+    def test_measure_codec(self):
+        codec = state_codec.get_state_codec('binary')
+        report = state_codec.measure_codec(codec, [_make_state()], number=2)
+        self.assertEqual('binary', report.name)
+        self.assertEqual(len(codec.encode(_make_state())), report.bytes_per_game)
+        self.assertGreater(report.encode_microseconds, 0)
+        self.assertGreater(report.decode_microseconds, 0)
+
+    def test_large_board(self):
+        rules = tic_tac_toe_game.BoardRules(rows=15, columns=13, win_length=5)
+        board = np.random.RandomState(0).randint(-1, 2, size=[15, 13]).astype(np.int8)
+        state = tic_tac_toe_game.TicTacToeInternalState(
+            'game-2', ['1', '2'], [PlayerInfo(), PlayerInfo()], 5, 6,
+            board=board, rules=rules)
+        for codec in state_codec.STATE_CODECS.values():
+            decoded = codec.decode(codec.encode(state))
+            self.assertStatesEqual(state, decoded)
+            self.assertEqual(rules, decoded.rules)
@@ -0,0 +1,47 @@
+import unittest
+
+from chupacabra_client.protos import game_structs_pb2
+
+from tic_tac_toe import status_cache
+
+
+class TestStatusCache(unittest.TestCase):
+    def test_repeated_lookups_reuse_the_status(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return game_structs_pb2.GameStatusInfo(id='game', legal_moves=['place_mark'])
+
+        cache = status_cache.StatusCache()
+        first = cache.get(('game', 1, True), build)
+        second = cache.get(('game', 1, True), build)
+        self.assertIs(first, second)
+        self.assertEqual(1, len(calls))
+
+        # Another version or player gets its own entry
+        cache.get(('game', 2, True), build)
+        cache.get(('game', 1, False), build)
+        self.assertEqual(3, len(calls))
+
+        stats = cache.stats()
+        self.assertEqual((1, 3, 0, 3), (stats.hits, stats.misses, stats.evictions, stats.size))
+        self.assertEqual(1 / 4, stats.hit_rate)
+
+        cache.clear()
+        self.assertEqual(status_cache.StatusCacheStats(0, 0, 0, 0), cache.stats())
+        self.assertEqual(0.0, cache.stats().hit_rate)
+
+    def test_eviction(self):
+        cache = status_cache.StatusCache(max_size=2)
+        for version in range(3):
+            cache.get(('game', version), lambda: game_structs_pb2.GameStatusInfo(id='game'))
+        stats = cache.stats()
+        self.assertEqual((0, 3, 1, 2), (stats.hits, stats.misses, stats.evictions, stats.size))
+
+        # The least recently used status was evicted
+        cache.get(('game', 0), lambda: game_structs_pb2.GameStatusInfo(id='game'))
+        self.assertEqual(4, cache.stats().misses)
+
+        with self.assertRaises(AssertionError):
+            status_cache.StatusCache(max_size=0)
@@ -0,0 +1,77 @@
+from unittest import mock
+
+import arrow
+
+from tests.tic_tac_toe.helpers import DefaultHandlerTestCase, make_state, requires_fakeredis
+from tic_tac_toe import game_implementation, game_store
+from tic_tac_toe import tic_tac_toe_game as ttt
+
+
+@requires_fakeredis
+class TestSweeper(DefaultHandlerTestCase):
+    def load(self, game_id):
+        return game_implementation._load_state(game_id, None)[1]
+
+    def test_sweep_expired_games(self):
+        time_now = arrow.utcnow().float_timestamp
+        expired = make_state().evolve(id='expired', turn_expiration_time=time_now - 10)
+        playing = make_state().evolve(id='playing')
+        with self.handler.batch() as batch:
+            game_implementation._save_new_game(batch, expired)
+            game_implementation._save_new_game(batch, playing)
+        self.assertEqual(2, self.redis.zcard(game_store.DEADLINES_KEY))
+
+        self.assertEqual(['expired'], game_implementation.sweep_expired_games())
+        # The player whose turn ran out loses
+        swept_state = self.load('expired')
+        self.assertEqual(ttt.FINISHED_MODE, swept_state.mode)
+        self.assertEqual(1, swept_state.winner)
+        self.assertEqual(1, swept_state.version)
+        self.assertIsNone(self.redis.zscore(game_store.DEADLINES_KEY, 'expired'))
+
+        self.assertEqual(ttt.PLAY_MODE, self.load('playing').mode)
+        self.assertEqual(
+            playing.turn_expiration_time,
+            self.redis.zscore(game_store.DEADLINES_KEY, 'playing')
+        )
+        self.assertEqual([], game_implementation.sweep_expired_games())
+
+    def test_stale_deadlines(self):
+        playing = make_state().evolve(id='playing')
+        with self.handler.batch() as batch:
+            game_implementation._save_new_game(batch, playing)
+        self.redis.zadd(game_store.DEADLINES_KEY, {'gone': 1, 'playing': 1})
+
+        # Gone games are dropped, and games with time left go back to their deadline
+        self.assertEqual([], game_implementation.sweep_expired_games())
+        self.assertEqual(
+            [('playing', playing.turn_expiration_time)],
+            self.redis.zrange(game_store.DEADLINES_KEY, 0, -1, withscores=True)
+        )
+
+    def test_unsaved_games_leave_the_index(self):
+        long_ago = arrow.utcnow().timestamp - game_implementation.GAME_PERSISTENCE_TIME
+        kept_too_long = make_state().evolve(
+            id='kept_too_long', turn_expiration_time=long_ago, game_expiration_time=long_ago)
+        expired = make_state().evolve(
+            id='expired', turn_expiration_time=arrow.utcnow().timestamp - 10)
+        with self.handler.batch() as batch:
+            game_implementation._save_new_game(batch, kept_too_long)
+            game_implementation._save_new_game(batch, expired)
+
+        # The game disappears between loading it and saving the end of the game
+        def lose_save(*args):
+            self.redis.delete(game_implementation._make_game_record_key('expired'))
+            return False
+
+        with mock.patch.object(game_implementation, '_save_state', side_effect=lose_save):
+            self.assertEqual([], game_implementation.sweep_expired_games())
+        self.assertEqual(0, self.redis.zcard(game_store.DEADLINES_KEY))
+
+    def test_save_past_lifetime(self):
+        long_ago = arrow.utcnow().timestamp - game_implementation.GAME_PERSISTENCE_TIME
+        old_state = make_state().evolve(
+            turn_expiration_time=long_ago, game_expiration_time=long_ago)
+        new_state = ttt.finish_game(old_state, -1)
+        self.assertFalse(game_implementation._save_state(
+            '1', old_state, new_state, game_implementation.LogPosition(0, 0)))
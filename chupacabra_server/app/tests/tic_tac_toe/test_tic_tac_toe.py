@@ -455,3 +455,179 @@ class TestTicTacToeGame(unittest.TestCase):
         )
         self.assertEqual(tic_tac_toe_game.FINISHED_MODE, new_state.mode)
         self.assertEqual(0, new_state.winner)
+
+    def test_evolve(self):
+        players = [PlayerInfo(username='player1'), PlayerInfo(username='player2')]
+        state = tic_tac_toe_game.TicTacToeInternalState(
+            '1', ['1', '2'], players, 5, 6)
+        new_state = state.evolve(turn=1, turn_expiration_time=7)
+        self.assertEqual(1, new_state.turn)
+        self.assertEqual(7, new_state.turn_expiration_time)
+        self.assertEqual(0, state.turn)
+        self.assertEqual(5, state.turn_expiration_time)
+        self.assertIs(state.players, new_state.players)
+        self.assertIs(state.player_ids, new_state.player_ids)
+        self.assertIs(state.board, new_state.board)
+
+        with self.assertRaises(AssertionError):
+            state.evolve(not_a_field=1)
+
+        with self.assertRaises(AttributeError):
+            state.not_a_field = 1
+
+    def test_make_move_does_not_modify_state(self):
+        good_time = arrow.utcnow().timestamp + 3600
+        state = tic_tac_toe_game.TicTacToeInternalState(
+            '1', ['1', '2'], [PlayerInfo(), PlayerInfo()], good_time, good_time)
+        move = Move(
+            piece_moves=[
+                GamePieceMove(
+                    locations=[
+                        Coordinates(
+                            values=[
+                                Coordinate(name='x', value=2),
+                                Coordinate(name='y', value=1)
+                            ]
+                        ),
+                    ]
+                )
+            ]
+        )
+        _, new_state = tic_tac_toe_game.make_move(state, move, '1')
+        self.assertEqual(0, state.board[2, 1])
+        self.assertEqual(1, new_state.board[2, 1])
+        self.assertEqual(0, state.turn)
+        self.assertEqual(1, new_state.turn)
+        self.assertIs(state.players, new_state.players)
+
+    def test__check_for_game_over_after_move(self):
+        # Agrees with the full board check after every move of every game
+        boards = [(np.zeros([3, 3], dtype=np.int8), 0)]
+        seen_boards = set()
+        while boards:
+            board, turn = boards.pop()
+            for x_coord, y_coord in np.argwhere(board == 0):
+                new_board = board.copy()
+                new_board[x_coord, y_coord] = tic_tac_toe_game.TURN_SCORES[turn]
+                expected = tic_tac_toe_game._check_for_game_over(new_board)
+                result = tic_tac_toe_game._check_for_game_over_after_move(
+                    new_board, x_coord, y_coord, 3, np.count_nonzero(new_board))
+                self.assertEqual(expected, result)
+                if not result[0] and new_board.tobytes() not in seen_boards:
+                    seen_boards.add(new_board.tobytes())
+                    boards.append((new_board, 1 - turn))
+        self.assertEqual(4519, len(seen_boards))
+
+    def test__check_for_game_over_after_move_large_board(self):
+        board = np.zeros([15, 15], dtype=np.int8)
+        board[3, 4:8] = -1
+        self.assertEqual(
+            (False, -1),
+            tic_tac_toe_game._check_for_game_over_after_move(
+                board, 3, 7, 5, np.count_nonzero(board))
+        )
+        board[3, 8] = -1
+        self.assertEqual(
+            (True, 1),
+            tic_tac_toe_game._check_for_game_over_after_move(
+                board, 3, 8, 5, np.count_nonzero(board))
+        )
+
+        board = np.zeros([15, 15], dtype=np.int8)
+        for idx in range(5):
+            board[10 - idx, 2 + idx] = 1
+        self.assertEqual(
+            (True, 0),
+            tic_tac_toe_game._check_for_game_over_after_move(
+                board, 8, 4, 5, np.count_nonzero(board))
+        )
+
+        # Five in a row wraps around the edge of the board: not a win
+        board = np.zeros([15, 15], dtype=np.int8)
+        board[0, 12:15] = 1
+        board[1, 0:2] = 1
+        self.assertEqual(
+            (False, -1),
+            tic_tac_toe_game._check_for_game_over_after_move(
+                board, 1, 0, 5, np.count_nonzero(board))
+        )
+
+        # The last mark fills the board without a line: a draw
+        board = np.array(
+            [[1, 1, -1, -1], [-1, -1, 1, 1], [1, 1, -1, -1], [-1, -1, 1, 0]], dtype=np.int8)
+        self.assertEqual(
+            (False, -1),
+            tic_tac_toe_game._check_for_game_over_after_move(board, 2, 3, 4, 15)
+        )
+        board[3, 3] = 1
+        self.assertEqual(
+            (True, -1),
+            tic_tac_toe_game._check_for_game_over_after_move(board, 3, 3, 4, 16)
+        )
+
+    def test_make_move_with_rules(self):
+        good_time = arrow.utcnow().timestamp + 3600
+        rules = tic_tac_toe_game.BoardRules(rows=15, columns=15, win_length=5)
+        state = tic_tac_toe_game.TicTacToeInternalState(
+            '1', ['1', '2'], [PlayerInfo(), PlayerInfo()], good_time, good_time, rules=rules)
+        self.assertEqual((15, 15), state.board.shape)
+        self.assertEqual(rules, state.rules)
+
+        def place(x_coord, y_coord):
+            return Move(
+                piece_moves=[
+                    GamePieceMove(
+                        locations=[
+                            Coordinates(
+                                values=[
+                                    Coordinate(name='x', value=x_coord),
+                                    Coordinate(name='y', value=y_coord)
+                                ]
+                            ),
+                        ]
+                    )
+                ]
+            )
+
+        message, _ = tic_tac_toe_game.make_move(state, place(15, 0), '1')
+        self.assertEqual(tic_tac_toe_game.ILLEGAL_MOVE_MESSAGE, message)
+
+        for idx in range(4):
+            _, state = tic_tac_toe_game.make_move(state, place(14, 10 + idx), '1')
+            _, state = tic_tac_toe_game.make_move(state, place(0, idx), '2')
+            self.assertEqual(tic_tac_toe_game.PLAY_MODE, state.mode)
+        _, state = tic_tac_toe_game.make_move(state, place(14, 14), '1')
+        self.assertEqual(tic_tac_toe_game.FINISHED_MODE, state.mode)
+        self.assertEqual(0, state.winner)
+
+        serialized = tic_tac_toe_game.serialize_state(state)
+        deserialized = tic_tac_toe_game.deserialize_state(serialized)
+        self.assertEqual(rules, deserialized.rules)
+        np.testing.assert_array_equal(state.board, deserialized.board)
+
+        with self.assertRaises(AssertionError):
+            tic_tac_toe_game.TicTacToeInternalState(
+                '1', ['1', '2'], [PlayerInfo(), PlayerInfo()], 0, 0,
+                rules=tic_tac_toe_game.BoardRules(rows=3, columns=3, win_length=4))
+
+    def test_evaluate_boards(self):
+        # Every possible board, including ones that cannot come up in a game
+        cells = np.array(
+            np.meshgrid(*[[0, 1, -1]] * 9, indexing='ij'), dtype=np.int8
+        ).reshape([9, -1]).T
+        self.assertEqual((3 ** 9, 9), cells.shape)
+        game_over, winners = tic_tac_toe_game.evaluate_boards(cells)
+        for board_cells, board_game_over, board_winner in zip(cells, game_over, winners):
+            expected = tic_tac_toe_game._check_for_game_over(board_cells.reshape([3, 3]))
+            self.assertEqual(expected, (bool(board_game_over), int(board_winner)))
+
+        game_over_3x3, winners_3x3 = tic_tac_toe_game.evaluate_boards(
+            cells.reshape([-1, 3, 3]))
+        np.testing.assert_array_equal(game_over, game_over_3x3)
+        np.testing.assert_array_equal(winners, winners_3x3)
+
+        game_over, winners = tic_tac_toe_game.evaluate_boards(np.zeros([0, 9], np.int8))
+        self.assertEqual(0, len(game_over))
+
+        with self.assertRaises(AssertionError):
+            tic_tac_toe_game.evaluate_boards(np.zeros([5, 4, 4], np.int8))
@@ -0,0 +1,26 @@
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from utils.id_allocator import ID_BYTES, IdAllocator
+
+
+class TestIdAllocator(TestCase):
+    def test_next_id(self):
+        allocator = IdAllocator(batch_size=8)
+        ids = [allocator.next_id() for _ in range(20)]
+        self.assertEqual(20, len(set(ids)))
+        for new_id in ids:
+            self.assertEqual(22, len(new_id))
+            self.assertEqual(ID_BYTES, len(base64.urlsafe_b64decode(new_id + '==')))
+
+        with self.assertRaises(AssertionError):
+            IdAllocator(id_bytes=8)
+        with self.assertRaises(AssertionError):
+            IdAllocator(batch_size=0)
+
+    def test_threads(self):
+        allocator = IdAllocator(batch_size=16)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: allocator.next_id(), range(1000)))
+        self.assertEqual(1000, len(set(ids)))
@@ -0,0 +1,41 @@
+from unittest import TestCase, mock
+
+import grpc
+
+from utils.stream_limit import TOO_MANY_STREAMS_MESSAGE, StreamLimit
+
+
+class Aborted(Exception):
+    pass
+
+
+def _make_context():
+    context = mock.Mock()
+    context.abort.side_effect = Aborted()
+    return context
+
+
+class TestStreamLimit(TestCase):
+    def test_stream(self):
+        limit = StreamLimit(max_streams=2)
+        self.assertEqual(2, limit.max_streams)
+        first = limit.stream(iter([1, 2]), _make_context())
+        second = limit.stream(iter([3]), _make_context())
+        self.assertEqual(1, next(first))
+        self.assertEqual(3, next(second))
+
+        # A stream over the limit is turned away
+        context = _make_context()
+        with self.assertRaises(Aborted):
+            next(limit.stream(iter([4]), context))
+        context.abort.assert_called_once_with(
+            grpc.StatusCode.RESOURCE_EXHAUSTED, TOO_MANY_STREAMS_MESSAGE)
+
+        # Streams make room once they end, or are closed early
+        self.assertEqual([2], list(first))
+        second.close()
+        self.assertEqual([4], list(limit.stream(iter([4]), _make_context())))
+        self.assertEqual([5], list(limit.stream(iter([5]), _make_context())))
+
+        with self.assertRaises(AssertionError):
+            StreamLimit(max_streams=0)
@@ -0,0 +1,174 @@
+from typing import Tuple
+
+import numpy as np
+
+
+# Each player's marks are stored as a 9-bit integer. The cell at board[x, y]
+# is stored in bit 3 * x + y, i.e. the same order as board.ravel().
+BOARD_SIZE = 3
+NUM_CELLS = BOARD_SIZE * BOARD_SIZE
+FULL_BOARD = (1 << NUM_CELLS) - 1
+
+# Board values used by the numpy representation of the game
+X_VALUE = 1
+O_VALUE = -1
+
+
+def cell_mask(x_coord: int, y_coord: int) -> int:
+    """Get the bit for a single cell of the board."""
+    return 1 << (BOARD_SIZE * x_coord + y_coord)
+
+
+def _make_win_masks() -> Tuple[int, ...]:
+    """Make the masks for every line that wins the game."""
+    rows = [
+        sum(cell_mask(x_coord, y_coord) for y_coord in range(BOARD_SIZE))
+        for x_coord in range(BOARD_SIZE)
+    ]
+    columns = [
+        sum(cell_mask(x_coord, y_coord) for x_coord in range(BOARD_SIZE))
+        for y_coord in range(BOARD_SIZE)
+    ]
+    diagonal = sum(cell_mask(idx, idx) for idx in range(BOARD_SIZE))
+    anti_diagonal = sum(cell_mask(idx, BOARD_SIZE - 1 - idx) for idx in range(BOARD_SIZE))
+    return tuple(rows + columns + [diagonal, anti_diagonal])
+
+
+# The 8 winning lines: 3 rows, 3 columns, and 2 diagonals
+WIN_MASKS = _make_win_masks()
+
+
+def from_board(board: np.ndarray) -> Tuple[int, int]:
+    """Convert a 3x3 numpy board into a pair of bitboards.
+
+    Args:
+        board: numpy.ndarray, the 3x3 game board
+
+    Returns:
+        tuple of int (X's marks), int (O's marks)
+    """
+    x_bits = 0
+    o_bits = 0
+    for idx, value in enumerate(board.ravel().tolist()):
+        if value == X_VALUE:
+            x_bits |= 1 << idx
+        elif value == O_VALUE:
+            o_bits |= 1 << idx
+    return x_bits, o_bits
+
+
+def to_board(x_bits: int, o_bits: int) -> np.ndarray:
+    """Convert a pair of bitboards back into a 3x3 numpy board."""
+    cells = [
+        X_VALUE if x_bits >> idx & 1 else O_VALUE if o_bits >> idx & 1 else 0
+        for idx in range(NUM_CELLS)
+    ]
+    return np.array(cells, dtype=np.int8).reshape([BOARD_SIZE, BOARD_SIZE])
+
+
+def has_win(bits: int) -> bool:
+    """Check if a single player's marks fill any winning line."""
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def check_for_game_over(x_bits: int, o_bits: int) -> Tuple[bool, int]:
+    """Check if the game is over given both players' bitboards
+
+    Args:
+        x_bits: int, the marks of the first player
+        o_bits: int, the marks of the second player
+
+    Returns:
+        tuple of bool (True=game over), and int (index of winner or -1 for no winner)
+    """
+    if has_win(x_bits):
+        return True, 0
+    if has_win(o_bits):
+        return True, 1
+    if x_bits | o_bits == FULL_BOARD:
+        return True, -1
+    return False, -1
+
+
+def check_board_for_game_over(board: np.ndarray) -> Tuple[bool, int]:
+    """Check if the game is over for a numpy board using the bitboard engine."""
+    x_bits, o_bits = from_board(board)
+    return check_for_game_over(x_bits, o_bits)
+
+
+def _make_symmetries() -> Tuple[Tuple[int, ...], ...]:
+    """Make the 8 symmetries of the board as permutations of the cells.
+
+    Each permutation maps a cell index of the transformed board to the index of
+    the cell it comes from in the original board.
+    """
+    last = BOARD_SIZE - 1
+    coordinate_maps = [
+        lambda x, y: (x, y),
+        lambda x, y: (y, last - x),
+        lambda x, y: (last - x, last - y),
+        lambda x, y: (last - y, x),
+        lambda x, y: (x, last - y),
+        lambda x, y: (last - x, y),
+        lambda x, y: (y, x),
+        lambda x, y: (last - y, last - x),
+    ]
+    symmetries = []
+    for coordinate_map in coordinate_maps:
+        permutation = []
+        for x_coord in range(BOARD_SIZE):
+            for y_coord in range(BOARD_SIZE):
+                source_x, source_y = coordinate_map(x_coord, y_coord)
+                permutation.append(BOARD_SIZE * source_x + source_y)
+        symmetries.append(tuple(permutation))
+    return tuple(symmetries)
+
+
+# The rotations and reflections of the board, starting with the identity
+SYMMETRIES = _make_symmetries()
+
+
+def _make_symmetry_tables() -> Tuple[Tuple[int, ...], ...]:
+    """Tabulate every symmetry for every possible 9-bit set of marks."""
+    tables = []
+    for permutation in SYMMETRIES:
+        table = []
+        for bits in range(FULL_BOARD + 1):
+            transformed_bits = 0
+            for target, source in enumerate(permutation):
+                if bits >> source & 1:
+                    transformed_bits |= 1 << target
+            table.append(transformed_bits)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+SYMMETRY_TABLES = _make_symmetry_tables()
+
+
+def transform(bits: int, symmetry: int) -> int:
+    """Apply one of the board symmetries to a player's marks."""
+    return SYMMETRY_TABLES[symmetry][bits]
+
+
+def canonicalize(x_bits: int, o_bits: int) -> Tuple[int, int, int]:
+    """Get the canonical form of a position among all of its symmetries.
+
+    Args:
+        x_bits: int, the marks of the first player
+        o_bits: int, the marks of the second player
+
+    Returns:
+        tuple of int (canonical X marks), int (canonical O marks), and int
+        (index of the symmetry that maps the position onto its canonical form)
+    """
+    best = (x_bits, o_bits, 0)
+    for symmetry in range(1, len(SYMMETRY_TABLES)):
+        table = SYMMETRY_TABLES[symmetry]
+        candidate = (table[x_bits], table[o_bits], symmetry)
+        if candidate < best:
+            best = candidate
+    return best
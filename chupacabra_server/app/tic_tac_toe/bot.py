@@ -0,0 +1,74 @@
+from chupacabra_client.protos.game_structs_pb2 import (
+    Coordinate, Coordinates, GamePieceMove, Move, PlayerInfo
+)
+
+from tic_tac_toe import tic_tac_toe_game as ttt
+from tic_tac_toe.solver import SolverTable
+
+
+# The bot plays under an id that can never be given to a real user
+BOT_PLAYER_ID = 'tic-tac-toe-bot'
+BOT_PLAYER_INFO = PlayerInfo(
+    username='TicTacToeBot',
+    nickname='Bot'
+)
+
+
+def is_bot(player_id: str) -> bool:
+    """Check if a player is the bot."""
+    return player_id == BOT_PLAYER_ID
+
+
+def has_bot(state: ttt.TicTacToeInternalState) -> bool:
+    """Check if the bot is playing in a game."""
+    return BOT_PLAYER_ID in state.player_ids
+
+
+def _make_place_mark_move(x_coord: int, y_coord: int) -> Move:
+    """Make the move that places a mark on the board."""
+    return Move(
+        piece_moves=[
+            GamePieceMove(
+                locations=[
+                    Coordinates(
+                        values=[
+                            Coordinate(name=ttt.X_COORD, value=x_coord),
+                            Coordinate(name=ttt.Y_COORD, value=y_coord)
+                        ]
+                    )
+                ]
+            )
+        ]
+    )
+
+
+def play_bot_turn(
+    state: ttt.TicTacToeInternalState,
+    table: SolverTable
+) -> ttt.TicTacToeInternalState:
+    """Let the bot move if it is the bot's turn, using perfect play from the solver.
+
+    The solver only covers the standard board, so the bot does not move on others.
+
+    Args:
+        state: the current game state
+        table: SolverTable, the solved game
+
+    Returns:
+        TicTacToeInternalState, the state after the bot's move, or the same state
+        if the bot cannot move
+    """
+    if state.mode != ttt.PLAY_MODE or not is_bot(state.player_ids[state.turn]):
+        return state
+    if state.rules != ttt.DEFAULT_RULES:
+        return state
+
+    entry = table.lookup_board(state.board)
+    if entry is None or entry.best_move is None:
+        return state
+
+    move = _make_place_mark_move(*entry.best_move)
+    _, new_state = ttt.make_move(state, move, BOT_PLAYER_ID)
+    if new_state is None:
+        return state
+    return new_state
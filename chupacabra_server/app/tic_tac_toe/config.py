@@ -2,6 +2,10 @@ import json
 import os
 
 from dbs.redis_cache import RedisCacheHandler
+from tic_tac_toe.solver import DEFAULT_TABLE_PATH, SolverTable, get_solver_table
+from tic_tac_toe.state_codec import StateCodec, get_state_codec
+from tic_tac_toe.status_cache import DEFAULT_MAX_SIZE as DEFAULT_STATUS_CACHE_SIZE, StatusCache
+from tic_tac_toe.tic_tac_toe_game import DEFAULT_RULES, BoardRules, validate_rules
 from utils.config_utils import get_variable_with_fallback
 
 
@@ -13,6 +17,24 @@ TICTACTOE_CONFIG_PATH = (
 TICTACTOE_REDIS_HOST = 'TICTACTOE_REDIS_HOST'
 TICTACTOE_REDIS_PORT = 'TICTACTOE_REDIS_PORT'
 TICTACTOE_REDIS_DB = 'TICTACTOE_REDIS_DB'
+TICTACTOE_STATE_CODEC = 'TICTACTOE_STATE_CODEC'
+TICTACTOE_SOLVER_TABLE_PATH = 'TICTACTOE_SOLVER_TABLE_PATH'
+TICTACTOE_BOT_WAIT_TIME = 'TICTACTOE_BOT_WAIT_TIME'
+TICTACTOE_BOARD_ROWS = 'TICTACTOE_BOARD_ROWS'
+TICTACTOE_BOARD_COLUMNS = 'TICTACTOE_BOARD_COLUMNS'
+TICTACTOE_WIN_LENGTH = 'TICTACTOE_WIN_LENGTH'
+TICTACTOE_EVENT_SOURCING = 'TICTACTOE_EVENT_SOURCING'
+TICTACTOE_SNAPSHOT_INTERVAL = 'TICTACTOE_SNAPSHOT_INTERVAL'
+TICTACTOE_LEVEL_WINDOW = 'TICTACTOE_LEVEL_WINDOW'
+TICTACTOE_LEVEL_WINDOW_GROWTH = 'TICTACTOE_LEVEL_WINDOW_GROWTH'
+TICTACTOE_BATCH_MATCHMAKING = 'TICTACTOE_BATCH_MATCHMAKING'
+TICTACTOE_STATUS_CACHE_SIZE = 'TICTACTOE_STATUS_CACHE_SIZE'
+
+DEFAULT_STATE_CODEC = 'json'
+DEFAULT_SNAPSHOT_INTERVAL = 8
+DEFAULT_LEVEL_WINDOW = 100.0
+DEFAULT_LEVEL_WINDOW_GROWTH = 20.0
+TRUE_VALUES = frozenset({'1', 'true', 'yes'})
 
 
 class TicTacToeConfig:
@@ -27,6 +49,56 @@ class TicTacToeConfig:
         self.redis_host = get_variable_with_fallback(TICTACTOE_REDIS_HOST, config_data)
         self.redis_port = get_variable_with_fallback(TICTACTOE_REDIS_PORT, config_data)
         self.redis_db = get_variable_with_fallback(TICTACTOE_REDIS_DB, config_data)
+        self.state_codec = get_variable_with_fallback(
+            TICTACTOE_STATE_CODEC, config_data, is_required=False) or DEFAULT_STATE_CODEC
+        self.solver_table_path = get_variable_with_fallback(
+            TICTACTOE_SOLVER_TABLE_PATH, config_data, is_required=False) or DEFAULT_TABLE_PATH
+        # Seconds a request waits for a partner before the bot joins. No bot if not set.
+        bot_wait_time = get_variable_with_fallback(
+            TICTACTOE_BOT_WAIT_TIME, config_data, is_required=False)
+        self.bot_wait_time = float(bot_wait_time) if bot_wait_time is not None else None
+        # The board size and win length of new games, standard Tic Tac Toe if not set
+        self.rules = BoardRules(
+            rows=int(get_variable_with_fallback(
+                TICTACTOE_BOARD_ROWS, config_data, is_required=False) or DEFAULT_RULES.rows),
+            columns=int(get_variable_with_fallback(
+                TICTACTOE_BOARD_COLUMNS, config_data, is_required=False) or DEFAULT_RULES.columns),
+            win_length=int(get_variable_with_fallback(
+                TICTACTOE_WIN_LENGTH, config_data, is_required=False) or DEFAULT_RULES.win_length)
+        )
+        validate_rules(self.rules)
+        # Store games as a log of moves with a snapshot every few moves,
+        # instead of rewriting the whole state on every change
+        event_sourcing = get_variable_with_fallback(
+            TICTACTOE_EVENT_SOURCING, config_data, is_required=False)
+        self.event_sourcing = str(event_sourcing).lower() in TRUE_VALUES
+        self.snapshot_interval = int(get_variable_with_fallback(
+            TICTACTOE_SNAPSHOT_INTERVAL, config_data, is_required=False
+        ) or DEFAULT_SNAPSHOT_INTERVAL)
+        if self.snapshot_interval < 1:
+            raise AssertionError('Illegal snapshot interval {}.'.format(self.snapshot_interval))
+        # The level difference a new request accepts in a partner,
+        # and how much wider it gets for every second the request waits
+        self.level_window = float(get_variable_with_fallback(
+            TICTACTOE_LEVEL_WINDOW, config_data, is_required=False
+        ) or DEFAULT_LEVEL_WINDOW)
+        self.level_window_growth = float(get_variable_with_fallback(
+            TICTACTOE_LEVEL_WINDOW_GROWTH, config_data, is_required=False
+        ) or DEFAULT_LEVEL_WINDOW_GROWTH)
+        if self.level_window < 0 or self.level_window_growth < 0:
+            raise AssertionError('Illegal level window {} growing by {}.'.format(
+                self.level_window, self.level_window_growth))
+        # Leave pairing requests to the matchmaker process, tic_tac_toe/matchmaker.py,
+        # so that RequestGame only adds the request to the queue
+        batch_matchmaking = get_variable_with_fallback(
+            TICTACTOE_BATCH_MATCHMAKING, config_data, is_required=False)
+        self.batch_matchmaking = str(batch_matchmaking).lower() in TRUE_VALUES
+        # The most game statuses to keep built, one per game version and player
+        self.status_cache_size = int(get_variable_with_fallback(
+            TICTACTOE_STATUS_CACHE_SIZE, config_data, is_required=False
+        ) or DEFAULT_STATUS_CACHE_SIZE)
+        if self.status_cache_size < 1:
+            raise AssertionError('Illegal status cache size {}.'.format(self.status_cache_size))
 
 
 # Standard configuration
@@ -48,3 +120,24 @@ TICTACTOE_REDIS_HANDLER = RedisCacheHandler(
 def get_default_tictactoe_cache_handler() -> RedisCacheHandler:
     """Get the default redis handler for the Tic Tac Toe server."""
     return TICTACTOE_REDIS_HANDLER
+
+
+TICTACTOE_STATE_CODEC_INSTANCE = get_state_codec(TICTACTOE_CONFIG.state_codec)
+
+
+def get_default_state_codec() -> StateCodec:
+    """Get the codec used to store game states for the Tic Tac Toe server."""
+    return TICTACTOE_STATE_CODEC_INSTANCE
+
+
+def get_default_solver_table() -> SolverTable:
+    """Get the solved game for the Tic Tac Toe server. It is loaded on first use."""
+    return get_solver_table(TICTACTOE_CONFIG.solver_table_path)
+
+
+TICTACTOE_STATUS_CACHE = StatusCache(TICTACTOE_CONFIG.status_cache_size)
+
+
+def get_default_status_cache() -> StatusCache:
+    """Get the cache of the game statuses sent back by the Tic Tac Toe server."""
+    return TICTACTOE_STATUS_CACHE
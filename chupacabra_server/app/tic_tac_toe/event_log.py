@@ -0,0 +1,122 @@
+from typing import List, Sequence
+
+import numpy as np
+
+from tic_tac_toe import tic_tac_toe_game as ttt
+
+
+# Events are short strings so that each change to a game only writes a few bytes:
+#   move: 'm' + x coordinate, y coordinate, and the next turn's expiration time
+#       e.g. 'm1,2,1600000000'
+#   finish: 'f' + the index of the winner (-1 for no winner), e.g. 'f0'
+# Event i of a game's log takes the game from version i to version i + 1.
+MOVE_EVENT = 'm'
+FINISH_EVENT = 'f'
+EVENT_SEPARATOR = ','
+
+
+def make_move_event(move_x: int, move_y: int, turn_expiration_time: int) -> str:
+    """Make the event for a mark placed on the board."""
+    return MOVE_EVENT + EVENT_SEPARATOR.join(
+        str(int(value)) for value in (move_x, move_y, turn_expiration_time))
+
+
+def make_finish_event(winner: int) -> str:
+    """Make the event for a game ending without a move, like a forfeit or a timeout."""
+    return FINISH_EVENT + str(int(winner))
+
+
+def apply_event(
+    state: ttt.TicTacToeInternalState,
+    event: str,
+    copy_board: bool = True
+) -> ttt.TicTacToeInternalState:
+    """Apply a single event to a game state.
+
+    Args:
+        state: the game state before the event
+        event: str, the event
+        copy_board: bool, False to change the board of the given state, which
+            then must not be used again
+
+    Returns:
+        TicTacToeInternalState, the game state after the event
+    """
+    event_type, payload = event[:1], event[1:]
+    if event_type == MOVE_EVENT:
+        move_x, move_y, turn_expiration_time = (
+            int(value) for value in payload.split(EVENT_SEPARATOR))
+        if state.mode != ttt.PLAY_MODE or state.board[move_x, move_y] != 0:
+            raise AssertionError('Cannot apply event {} to game {}.'.format(event, state.id))
+        return ttt.place_mark(
+            state, move_x, move_y, turn_expiration_time, copy_board=copy_board)
+    elif event_type == FINISH_EVENT:
+        return ttt.finish_game(state, int(payload))
+    raise AssertionError('Unknown game event {}.'.format(event))
+
+
+def apply_events(
+    state: ttt.TicTacToeInternalState,
+    events: Sequence[str]
+) -> ttt.TicTacToeInternalState:
+    """Rebuild a game state from a snapshot and the events that came after it.
+
+    The board is copied once, rather than once per event, and the new marks
+    are placed on the copy.
+    """
+    if not events:
+        return state
+    state = state.evolve(board=state.board.copy())
+    for event in events:
+        state = apply_event(state, event, copy_board=False)
+    return state
+
+
+def diff_events(
+    old_state: ttt.TicTacToeInternalState,
+    new_state: ttt.TicTacToeInternalState
+) -> List[str]:
+    """Find the events that take a game from one state to a later one.
+
+    New marks on the board become move events, in turn order starting with the
+    player to move in the old state. If the game then ended some other way, a
+    finish event is added.
+
+    Args:
+        old_state: the earlier game state
+        new_state: the later game state
+
+    Returns:
+        list of str, the events
+    """
+    changed_cells = np.argwhere(old_state.board != new_state.board)
+    player_cells = [
+        [
+            (int(move_x), int(move_y))
+            for move_x, move_y in changed_cells
+            if new_state.board[move_x, move_y] == ttt.TURN_SCORES[player]
+        ]
+        for player in ((old_state.turn + offset) % 2 for offset in range(2))
+    ]
+    num_first, num_second = (len(cells) for cells in player_cells)
+    if num_first - num_second not in (0, 1):
+        raise AssertionError('Game {} has moves out of turn.'.format(new_state.id))
+
+    events = []
+    for idx in range(num_first + num_second):
+        move_x, move_y = player_cells[idx % 2][idx // 2]
+        events.append(make_move_event(move_x, move_y, new_state.turn_expiration_time))
+    replayed_state = apply_events(old_state, events)
+    if (replayed_state.mode, replayed_state.winner) != (new_state.mode, new_state.winner):
+        finish_event = make_finish_event(new_state.winner)
+        events.append(finish_event)
+        replayed_state = apply_event(replayed_state, finish_event)
+
+    if (
+        replayed_state.version != new_state.version or
+        replayed_state.turn != new_state.turn or
+        replayed_state.mode != new_state.mode
+    ):
+        raise AssertionError(
+            'Changes to game {} cannot be written as events.'.format(new_state.id))
+    return events
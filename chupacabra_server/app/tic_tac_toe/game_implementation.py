@@ -1,33 +1,55 @@
 import json
 import logging
-import secrets
-from typing import List, Optional, Tuple
+from queue import Empty
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
 
 import arrow
 from chupacabra_client.protos import game_structs_pb2
+import grpc
 import numpy as np
 
-from dbs.redis_cache import RedisCacheHandler
+from dbs.redis_cache import MESSAGES_MISSED, RedisBatch, RedisCacheHandler
 from game_server.game_servicer import GameImplementation
 from protos import game_server_pb2
+from tic_tac_toe import bot, event_log, game_store, request_queue
 from tic_tac_toe import tic_tac_toe_game as ttt
-from tic_tac_toe.config import get_default_tictactoe_cache_handler
+from tic_tac_toe.config import (
+    get_default_solver_table,
+    get_default_state_codec,
+    get_default_status_cache,
+    get_default_tictactoe_cache_handler,
+    get_default_tictactoe_config
+)
 from tic_tac_toe import description
+from utils.id_allocator import IdAllocator
 
 
 logger = logging.getLogger(__name__)
 
 
-TTT_MOVE_BLOCK_TIME = 1  # in seconds
-TTT_REQUEST_BLOCK_TIME = 1  # in seconds
 GAME_PERSISTENCE_TIME = 15 * 60  # 15 minutes - redis time
 REQUEST_LIFETIME = 60  # 1 minutes
 QUEUE_LIFETIME = 90  # 1.5 minutes
 GAME_PADDED_LIFETIME = GAME_PERSISTENCE_TIME - ttt.GAME_LIFETIME
 
-MAX_REQUEST_ID_ATTEMPTS = 10
+MAX_SAVE_ATTEMPTS = 3
+# Put in a stream's messages to wake it up when its call has ended
+CALL_ENDED = object()
 
+OUT_OF_TIME_MESSAGE = 'The game has run out of time.'
 
+
+def _make_game_record_key(game_id: str) -> str:
+    """Make the redis key for the game's players, state and versions."""
+    return 'ttt:{}.game'.format(game_id)
+
+
+def _make_event_log_key(game_id: str) -> str:
+    """Make the redis key for the log of changes to the game state."""
+    return 'ttt:{}.events'.format(game_id)
+
+
+# Games saved before the game record existed have these keys instead
 def _make_validation_key(game_id: str) -> str:
     """Make the redis key for game validation."""
     return 'ttt:{}:valid'.format(game_id)
@@ -38,79 +60,314 @@ def _make_state_key(game_id: str) -> str:
     return 'ttt:{}.state'.format(game_id)
 
 
-def _make_state_lock_key(game_id: str) -> str:
-    """Make the redis key for locking the game state."""
-    return 'ttt:{}.state_lock'.format(game_id)
+def _make_game_channel(game_id: str) -> str:
+    """Make the redis channel that gets the new version whenever the game changes."""
+    return 'ttt:{}.changed'.format(game_id)
+
+
+GAME_CHANNEL_PATTERN = _make_game_channel('*')
+
+
+def _make_game_keys(game_id: str) -> List[str]:
+    """Make the keys of a game, in the order the game store takes them."""
+    return [
+        _make_game_record_key(game_id),
+        _make_event_log_key(game_id),
+        _make_validation_key(game_id),
+        _make_state_key(game_id)
+    ]
 
 
 def _make_request_key(request_id: str, player_id: str) -> str:
-    """Make the redis key for a game request lock."""
+    """Make the redis key for a game request."""
     return 'ttt:{}:{}.request'.format(request_id, player_id)
 
 
-def _make_request_lock_key(request_id: str, player_id: str) -> str:
-    """Make the redis key for locking a game request lock."""
-    return 'ttt:{}:{}.request_lock'.format(request_id, player_id)
+def _make_request_channel(request_id: str, player_id: str) -> str:
+    """Make the redis channel that gets the game id when a request is matched."""
+    return 'ttt:{}:{}.matched'.format(request_id, player_id)
+
+
+REQUEST_CHANNEL_PATTERN = _make_request_channel('*', '*')
+
+
+REQUEST_QUEUE = request_queue.RequestQueue(
+    get_default_tictactoe_cache_handler(),
+    QUEUE_LIFETIME,
+    REQUEST_LIFETIME,
+    get_default_tictactoe_config().level_window,
+    get_default_tictactoe_config().level_window_growth
+)
+
+
+def get_request_queue() -> request_queue.RequestQueue:
+    """Get the queue of game requests waiting for a partner."""
+    return REQUEST_QUEUE
+
+
+ID_ALLOCATOR = IdAllocator()
+GAME_STORE = game_store.GameStore(get_default_tictactoe_cache_handler())
+
+
+def get_game_store() -> game_store.GameStore:
+    """Get the store that loads and saves games."""
+    return GAME_STORE
+
+
+class LogPosition(NamedTuple):
+    """Where a loaded game is in its event log, for deciding when to snapshot"""
+
+    num_unsaved_events: int
+    log_length: int
+
+
+def _load_state(
+    game_id: str,
+    player_id: Optional[str]
+) -> Tuple[bool, Optional[ttt.TicTacToeInternalState], LogPosition]:
+    """Load a game state for one of its players, in one round trip.
+
+    With event sourcing, the stored state is a snapshot and any events logged
+    after it are applied on top. The sweeper loads games with no player id.
+
+    Returns:
+        tuple of:
+            bool, whether the player is in the game
+            maybe(TicTacToeInternalState), the game state if it exists
+            LogPosition, the game's place in its event log
+    """
+    loaded_game = get_game_store().load(_make_game_keys(game_id), player_id)
+    if loaded_game is None:
+        return False, None, LogPosition(0, 0)
+    if loaded_game.state_data is None:
+        return True, None, LogPosition(0, 0)
+
+    internal_state = get_default_state_codec().decode(loaded_game.state_data)
+    if not get_default_tictactoe_config().event_sourcing:
+        return True, internal_state, LogPosition(0, loaded_game.log_length)
+    events = loaded_game.events
+    if loaded_game.snapshot_version is None:
+        events = events[internal_state.version:]
+    return (
+        True,
+        event_log.apply_events(internal_state, events),
+        LogPosition(len(events), loaded_game.log_length)
+    )
+
+
+def _next_deadline(internal_state: ttt.TicTacToeInternalState) -> float:
+    """Get the time at which the game runs out of time if nobody moves."""
+    return min(internal_state.turn_expiration_time, internal_state.game_expiration_time)
 
 
-REQUEST_QUEUE_KEY = 'ttt:requests'
-REQUEST_QUEUE_LOCK_KEY = 'ttt:requests_lock'
+def _get_state_lifetime(internal_state: ttt.TicTacToeInternalState) -> int:
+    """Get how many more seconds a game is kept for, which is not positive once it is past that."""
+    timestamp = arrow.utcnow().timestamp
+    return int(internal_state.game_expiration_time - timestamp + GAME_PADDED_LIFETIME)
 
 
-def _validate_game(
-    game_id: str, player_id: str, redis_handler: RedisCacheHandler
+def _save_state(
+    player_id: str,
+    old_state: ttt.TicTacToeInternalState,
+    new_state: ttt.TicTacToeInternalState,
+    log_position: LogPosition
 ) -> bool:
-    """Validate that the player has access to this game"""
-    key = _make_validation_key(game_id)
-    data = redis_handler.get(key)
-    if data is None:
+    """Save a changed game state, in one round trip, if nobody has changed it since it was loaded.
+
+    With event sourcing, only the changes are appended to the game's log, and
+    a full snapshot is written every few events and when the game ends.
+
+    Args:
+        player_id: str, the player making the change
+        old_state: TicTacToeInternalState, the game as it was loaded
+        new_state: TicTacToeInternalState, the game after the changes
+        log_position: LogPosition, the game's place in its event log when it was loaded
+
+    Returns:
+        bool, False if nothing was saved, because the game has changed since it was
+        loaded or is past the time it is kept for
+    """
+    state_lifetime = _get_state_lifetime(new_state)
+    if state_lifetime <= 0:
         return False
 
-    deserialized_data = json.loads(data)
-    if not isinstance(deserialized_data, list):
-        logger.error('Game {} has badly formed validation data.'.format(game_id))
-        raise AssertionError('Malformed tictactoe game metadata.')
-    if player_id in deserialized_data:
-        return True
-    else:
-        logger.error('User {} attempting to access Tic-Tac-Toe game {} '
-                     'without being a participant.'.format(player_id, game_id))
-    return False
+    config = get_default_tictactoe_config()
+    events = []
+    snapshot = None
+    if config.event_sourcing:
+        events = event_log.diff_events(old_state, new_state)
+    # Games started before event sourcing was turned on have a log that
+    # does not line up with their versions, so they always get a snapshot
+    if (
+        not config.event_sourcing or
+        log_position.log_length + len(events) != new_state.version or
+        log_position.num_unsaved_events + len(events) >= config.snapshot_interval or
+        new_state.mode != ttt.PLAY_MODE
+    ):
+        snapshot = get_default_state_codec().encode(new_state)
+
+    return get_game_store().save(
+        _make_game_keys(new_state.id),
+        _make_game_channel(new_state.id),
+        new_state.id,
+        _next_deadline(new_state) if new_state.mode == ttt.PLAY_MODE else None,
+        player_id,
+        old_state.version,
+        new_state.version,
+        state_lifetime,
+        events,
+        snapshot
+    )
 
 
-def _get_game_state(
-    game_id: str, player_id: str, redis_handler: RedisCacheHandler
-) -> Tuple[str, Optional[ttt.TicTacToeInternalState], bool]:
-    """Get the game state without locking anything."""
-    validated = _validate_game(game_id, player_id, redis_handler)
-    if validated is False:
-        message = 'Cannot find game of the given id for the given user'
-        return message, None, False
+class GameUpdate(NamedTuple):
+    """The outcome of a change to a game"""
 
-    state_key = _make_state_key(game_id)
-    state = redis_handler.get(state_key)
-    if state is None:
-        logger.error('Game {} validated but data not found.'.format(game_id))
-        message = 'Game data not found.'
-        return message, None, False
+    message: str
+    state: Optional[ttt.TicTacToeInternalState]
+    success: bool
 
-    internal_state = ttt.deserialize_state(state)
-    time_now = arrow.utcnow().float_timestamp
+
+def _update_game_state(
+    game_id: str,
+    player_id: str,
+    update: Callable[[ttt.TicTacToeInternalState], GameUpdate]
+) -> GameUpdate:
+    """Change a game without locking it.
+
+    The change is made to the state as it was loaded, and it is only saved if
+    the game has not changed in the meantime. Otherwise it is made again on
+    the new state, up to MAX_SAVE_ATTEMPTS times.
+
+    Args:
+        game_id: str, the game id
+        player_id: str, the player making the change
+        update: function, makes the change to a loaded state. Returns the same
+            state if there is nothing to save.
+
+    Returns:
+        GameUpdate, the outcome of the change, with no state if the game cannot
+        be loaded or the change could not be saved
+    """
+    for _ in range(MAX_SAVE_ATTEMPTS):
+        validated, internal_state, log_position = _load_state(game_id, player_id)
+        if validated is False:
+            return GameUpdate('Cannot find game of this id for this user.', None, False)
+
+        if internal_state is None:
+            logger.error('Game {} validated but data not found.'.format(game_id))
+            return GameUpdate('Game data not found.', None, False)
+
+        game_update = update(internal_state)
+        if game_update.state is internal_state:
+            return game_update
+        if _save_state(player_id, internal_state, game_update.state, log_position):
+            return game_update
+
+    logger.warning('Gave up on a change to game {} after {} attempts.'.format(
+        game_id, MAX_SAVE_ATTEMPTS))
+    return GameUpdate('The game is busy. Please try again.', None, False)
+
+
+def _check_expiration(
+    internal_state: ttt.TicTacToeInternalState,
+    time_now: float
+) -> ttt.TicTacToeInternalState:
+    """End the game if the turn or the whole game has run out of time."""
+    if internal_state.mode != ttt.PLAY_MODE:
+        return internal_state
     if (
         time_now > internal_state.turn_expiration_time and
         internal_state.turn_expiration_time <= internal_state.game_expiration_time
     ):
-        internal_state.mode = ttt.FINISHED_MODE
-        internal_state.winner = (internal_state.turn + 1) % 2
-        save_new_state = True
+        return ttt.finish_game(internal_state, (internal_state.turn + 1) % 2)
     elif time_now > internal_state.game_expiration_time:
-        internal_state.mode = ttt.FINISHED_MODE
-        internal_state.winner = -1
-        save_new_state = True
+        return ttt.finish_game(internal_state, -1)
+    return internal_state
+
+
+def _get_current_game_state(
+    game_id: str, player_id: str
+) -> Tuple[str, Optional[ttt.TicTacToeInternalState]]:
+    """Get the game state, ending the game if it has run out of time.
+
+    This is the read path, so it never waits or retries: the game is loaded
+    once and expired in memory. If it has just expired, that is saved with a
+    single conditional write. If the write loses to another change, that change
+    was made by someone who saw the same expiry, or a later read will apply it.
+    """
+    validated, stored_state, log_position = _load_state(game_id, player_id)
+    if validated is False:
+        return 'Cannot find game of this id for this user.', None
+
+    if stored_state is None:
+        logger.error('Game {} validated but data not found.'.format(game_id))
+        return 'Game data not found.', None
+
+    internal_state = _check_expiration(stored_state, arrow.utcnow().float_timestamp)
+    if internal_state is not stored_state:
+        _save_state(player_id, stored_state, internal_state, log_position)
+    return 'Success', internal_state
+
+
+def _finish_expired_game(game_id: str, time_now: float) -> bool:
+    """End a game from the deadline index if it has run out of time.
+
+    Games that are gone, over, or past the time they are kept for are dropped
+    from the index, and games that still have time left are put back at their
+    real deadline.
+
+    Returns:
+        bool, whether the game was ended
+    """
+    store = get_game_store()
+    _, stored_state, log_position = _load_state(game_id, None)
+    if (
+        stored_state is None or
+        stored_state.mode != ttt.PLAY_MODE or
+        _get_state_lifetime(stored_state) <= 0
+    ):
+        # Saving these would fail, and leave them at the head of the index
+        store.set_deadline(game_id, None)
+        return False
+
+    internal_state = _check_expiration(stored_state, time_now)
+    if internal_state is stored_state:
+        store.set_deadline(game_id, _next_deadline(stored_state))
+        return False
+    # Saved as the player whose turn it was
+    if _save_state(
+        stored_state.player_ids[stored_state.turn], stored_state, internal_state, log_position
+    ):
+        return True
+
+    # Another change was saved first, so the game is indexed as it is now
+    _, current_state, _ = _load_state(game_id, None)
+    if current_state is None or current_state.mode != ttt.PLAY_MODE:
+        store.set_deadline(game_id, None)
     else:
-        save_new_state = False
-    message = 'Success'
-    return message, internal_state, save_new_state
+        store.set_deadline(game_id, _next_deadline(current_state))
+    return False
+
+
+def sweep_expired_games(batch_size: int = 100) -> List[str]:
+    """End the games whose turn or whole game has run out of time.
+
+    Games are otherwise only ended when someone next looks at them. Every
+    save publishes the change, so watchers see the outcome straight away.
+
+    Args:
+        batch_size: int, the most games to look at
+
+    Returns:
+        list of str, the ids of the games that were ended
+    """
+    time_now = arrow.utcnow().float_timestamp
+    return [
+        game_id
+        for game_id in get_game_store().get_due(time_now, batch_size)
+        if _finish_expired_game(game_id, time_now)
+    ]
 
 
 def _make_game_piece(
@@ -147,16 +404,15 @@ def _make_game_board(
 ) -> game_structs_pb2.GameBoard:
     """Create the game board."""
     pieces = []
-    for idx in range(3):
-        for jdx in range(3):
-            state = board[idx, jdx]
-            if state == ttt.TURN_SCORES[0]:
-                piece = _make_game_piece('x', 'X', players[0].username, idx, jdx)
-            elif state == ttt.TURN_SCORES[1]:
-                piece = _make_game_piece('o', 'O', players[1].username, idx, jdx)
-            else:
-                continue
-            pieces.append(piece)
+    # Only visit the filled cells, which matters on large boards
+    for idx, jdx in zip(*np.nonzero(board)):
+        idx = int(idx)
+        jdx = int(jdx)
+        if board[idx, jdx] == ttt.TURN_SCORES[0]:
+            piece = _make_game_piece('x', 'X', players[0].username, idx, jdx)
+        else:
+            piece = _make_game_piece('o', 'O', players[1].username, idx, jdx)
+        pieces.append(piece)
 
     board = game_structs_pb2.GameBoard(
         id='0',
@@ -228,18 +484,13 @@ def _get_game_status(
     return game_status
 
 
-def _convert_to_status_response(
-    player_id: str,
-    success_message: str,
+def _make_status_info(
     internal_state: ttt.TicTacToeInternalState,
-    success: bool
-) -> game_structs_pb2.GameStatusResponse:
+    is_players_turn: bool
+) -> game_structs_pb2.GameStatusInfo:
+    """Build the status info of a game for a player."""
     board = _make_game_board(internal_state.board, internal_state.players)
-    current_player = internal_state.player_ids[internal_state.turn]
-    if (
-        internal_state.mode == ttt.PLAY_MODE and
-        current_player == player_id
-    ):
+    if is_players_turn:
         legal_moves = [description.PLACE_MARK_DESCRIPTION.name]
     else:
         legal_moves = []
@@ -259,6 +510,32 @@ def _convert_to_status_response(
         state=state,
         legal_moves=legal_moves
     )
+    return status_info
+
+
+def _convert_to_status_response(
+    player_id: str,
+    success_message: str,
+    internal_state: ttt.TicTacToeInternalState,
+    success: bool
+) -> game_structs_pb2.GameStatusResponse:
+    is_players_turn = (
+        internal_state.mode == ttt.PLAY_MODE and
+        internal_state.player_ids[internal_state.turn] == player_id
+    )
+    # Every change bumps the version, so one version of a game always has the
+    # same status. The turn, mode and winner tell apart the rare states that
+    # were built with a version that lost to another save, and so never stored.
+    status_key = (
+        internal_state.id,
+        internal_state.version,
+        internal_state.turn,
+        internal_state.mode,
+        internal_state.winner,
+        is_players_turn
+    )
+    status_info = get_default_status_cache().get(
+        status_key, lambda: _make_status_info(internal_state, is_players_turn))
 
     response = game_structs_pb2.GameStatusResponse(
         success=success,
@@ -268,35 +545,150 @@ def _convert_to_status_response(
     return response
 
 
-def _generate_request_id(
-    handler: RedisCacheHandler,
-    player_id: str,
-) -> Optional[str]:
+def _generate_request_id() -> str:
     """Generate a request id"""
-    request_id = None
-    for _ in range(MAX_REQUEST_ID_ATTEMPTS):
-        proposed_request_id = secrets.token_urlsafe(32)
-        request_key = _make_request_key(proposed_request_id, player_id)
-        existing_data = handler.get(request_key)
-        if existing_data is None:
-            request_id = proposed_request_id
+    return ID_ALLOCATOR.next_id()
+
+
+def _generate_game_id() -> str:
+    """Generate a game id"""
+    return ID_ALLOCATOR.next_id()
+
 
-    return request_id
+def _make_random_state(time_now: float) -> np.random.RandomState:
+    """Make a random state to pick the starting player."""
+    # Set a random number seed based on the fractional second part
+    # of the timestamp. This makes it more reliable on higher loads compared
+    # to the integer utc timestamp.
+    seed = int(time_now * 1e9) % 1000000000
+    return np.random.RandomState(seed)
+
+
+def _save_new_game(
+    batch: RedisBatch,
+    game_state: ttt.TicTacToeInternalState
+) -> None:
+    """Queue saving the record of a new game."""
+    codec = get_default_state_codec()
+    version = str(game_state.version)
+    batch.set_hash_fields(
+        _make_game_record_key(game_state.id),
+        {
+            game_store.PLAYERS_FIELD: json.dumps(game_state.player_ids),
+            game_store.STATE_FIELD: codec.encode(game_state),
+            game_store.VERSION_FIELD: version,
+            game_store.SNAPSHOT_FIELD: version
+        },
+        lifetime=GAME_PERSISTENCE_TIME
+    )
+    get_game_store().add_deadline(batch, game_state.id, _next_deadline(game_state))
+
+
+def _make_player_info(queued_request: dict) -> game_structs_pb2.PlayerInfo:
+    """Get the player info saved with a request in the queue."""
+    return game_structs_pb2.PlayerInfo(
+        username=queued_request['username'],
+        nickname=queued_request['nickname'],
+        team=queued_request['team'],
+        level=queued_request['level']
+    )
+
+
+def _make_matched_game(
+    game_id: str,
+    queued_requests: List[dict],
+    time_now: float,
+    random_state: np.random.RandomState
+) -> ttt.TicTacToeInternalState:
+    """Make the game between two requests taken out of the queue."""
+    # Randomized starting player
+    if random_state.randint(2) == 1:
+        queued_requests = queued_requests[::-1]
+
+    return ttt.TicTacToeInternalState(
+        game_id,
+        [queued_request['player_id'] for queued_request in queued_requests],
+        [_make_player_info(queued_request) for queued_request in queued_requests],
+        time_now + ttt.TURN_EXPIRATION_TIME,
+        time_now + ttt.GAME_LIFETIME,
+        rules=get_default_tictactoe_config().rules
+    )
+
+
+def _save_matched_game(
+    batch: RedisBatch,
+    game_state: ttt.TicTacToeInternalState,
+    queued_requests: List[dict],
+    time_now: float
+) -> None:
+    """Queue saving a new game and pointing its requests to it.
+
+    The game and its requests are saved together, so a request is never
+    assigned a game that does not exist yet.
+    """
+    _save_new_game(batch, game_state)
+
+    # Save the requests
+    queue = get_request_queue()
+    for queued_request in queued_requests:
+        serialized_request = json.dumps({
+            'player': queued_request['player_id'],
+            'game': game_state.id
+        })
+        request_key = _make_request_key(queued_request['id'], queued_request['player_id'])
+        batch.set(request_key, serialized_request, lifetime=REQUEST_LIFETIME)
+        queue.set_pending(
+            queued_request['player_id'],
+            queued_request['id'],
+            time_now + REQUEST_LIFETIME,
+            game_state.id,
+            store=batch
+        )
+        batch.publish(
+            _make_request_channel(queued_request['id'], queued_request['player_id']),
+            game_state.id
+        )
 
 
-def _generate_game_id(
+def _start_matched_game(
     handler: RedisCacheHandler,
-) -> Optional[str]:
-    """Generate a game id"""
-    game_id = None
-    for _ in range(MAX_REQUEST_ID_ATTEMPTS):
-        proposed_game_id = secrets.token_urlsafe(32)
-        game_key = _make_state_key(proposed_game_id)
-        existing_data = handler.get(game_key)
-        if existing_data is None:
-            game_id = proposed_game_id
+    game_id: str,
+    queued_requests: List[dict],
+    time_now: float,
+    random_state: np.random.RandomState
+) -> None:
+    """Start the game between two requests taken out of the queue, in one round trip."""
+    game_state = _make_matched_game(game_id, queued_requests, time_now, random_state)
+    with handler.batch() as batch:
+        _save_matched_game(batch, game_state, queued_requests, time_now)
+
+
+def match_queued_requests() -> List[str]:
+    """Pair up every request waiting in the queue and start their games.
+
+    This is one pass of the batch matchmaker. All the games are saved in a
+    single transaction.
+
+    Returns:
+        list of str, the ids of the new games
+    """
+    handler = get_default_tictactoe_cache_handler()
+    time_now = arrow.utcnow().float_timestamp
+    matched_pairs = get_request_queue().match_all(time_now)
+    if not matched_pairs:
+        return []
 
-    return game_id
+    random_state = _make_random_state(time_now)
+    game_ids = []
+    with handler.batch() as batch:
+        for matched_pair in matched_pairs:
+            game_id = _generate_game_id()
+            game_state = _make_matched_game(
+                game_id, list(matched_pair), time_now, random_state)
+            _save_matched_game(batch, game_state, list(matched_pair), time_now)
+            game_ids.append(game_id)
+
+    return game_ids
 
 
 def request_game(
@@ -305,181 +697,181 @@ def request_game(
     """Request a game."""
     handler = get_default_tictactoe_cache_handler()
 
-    # Set a random number seed based on the fractional second part
-    # of the timestamp. This makes it more reliable on higher loads compared
-    # to the integer utc timestamp.
     time_now = arrow.utcnow().float_timestamp
-    seed = int(time_now * 1e9) % 1000000000
-    random_state = np.random.RandomState(seed)
+    random_state = _make_random_state(time_now)
+    queue = get_request_queue()
 
-    # Lock the requests
-    with handler.lock(REQUEST_QUEUE_LOCK_KEY, TTT_REQUEST_BLOCK_TIME):
-        # Generate a request id
-        request_id = _generate_request_id(handler, request.player_id)
-        if request_id is None:
+    # Check if the player already has a request waiting in the queue
+    for pending_request in queue.get_pending(request.player_id, time_now):
+        if pending_request.game_id is None:
             return game_structs_pb2.GameRequestResponse(
                 success=False,
-                message='Unable to request a game.'
+                message='You already have a request in the queue.',
+                request_id=pending_request.request_id
             )
-        request_key = _make_request_key(request_id, request.player_id)
-
-        # Get the request queue
-        queue_data = handler.get(REQUEST_QUEUE_KEY)
-        if queue_data is not None and len(queue_data) > 0:
-            request_queue = json.loads(queue_data)
-            # Check expiration times
-            valid_requests = [
-                game_request
-                for game_request in request_queue
-                if game_request['expiration'] > time_now
-            ]
-        else:
-            valid_requests = []
-
-        if valid_requests:
-            # Check if the current user is in the queue (slow -- need better method to do this)
-            for game_request in valid_requests:
-                if game_request['player_id'] == request.player_id:
-                    return game_structs_pb2.GameRequestResponse(
-                        success=False,
-                        message='You already have a request in the queue.',
-                        request_id=game_request['id']
-                    )
-
-            # Generate game id
-            game_id = _generate_game_id(handler)
-
-            if game_id is None:
-                return game_structs_pb2.GameRequestResponse(
-                    success=False,
-                    message='Unable to request a game.'
-                )
 
-            # Grab the first element
-            matched_player_request = valid_requests[0]
-            remaining_requests = valid_requests[1:]
-            matched_player_info = game_structs_pb2.PlayerInfo(
-                username=matched_player_request['username'],
-                nickname=matched_player_request['nickname'],
-                team=matched_player_request['team'],
-                level=matched_player_request['level']
-            )
-            matched_player_id = matched_player_request['player_id']
-            matched_request_id = matched_player_request['id']
+    # Generate a request id
+    request_id = _generate_request_id()
+    # Generate a game id up front, in case the request is matched right away
+    game_id = _generate_game_id()
+
+    # Save the request first, so that it exists before anyone can be matched with it
+    request_key = _make_request_key(request_id, request.player_id)
+    serialized_request = json.dumps({
+        'player': request.player_id,
+        'time': time_now
+    })
+    handler.set(request_key, serialized_request, lifetime=REQUEST_LIFETIME)
+
+    queue_request = {
+        'id': request_id,
+        'player_id': request.player_id,
+        'username': request.player_info.username,
+        'nickname': request.player_info.nickname,
+        'level': request.player_info.level,
+        'team': request.player_info.team,
+        'time': time_now,
+        'expiration': time_now + REQUEST_LIFETIME
+    }
+    # With batch matchmaking the matchmaker process pairs up the queue
+    queue_result = queue.match_or_enqueue(
+        queue_request, time_now, match=not get_default_tictactoe_config().batch_matchmaking)
+
+    # The queue has the final say if two requests from the same player race
+    if queue_result.status == request_queue.QUEUED_STATUS:
+        handler.delete(request_key)
+        return game_structs_pb2.GameRequestResponse(
+            success=False,
+            message='You already have a request in the queue.',
+            request_id=queue_result.request['id']
+        )
 
-            # Randomized starting player
-            if random_state.randint(2) == 0:
-                player_ids = [request.player_id, matched_player_id]
-                player_info = [request.player_info, matched_player_info]
-            else:
-                player_ids = [matched_player_id, request.player_id]
-                player_info = [matched_player_info, request.player_info]
-
-            # initialize the state
-            game_state = ttt.TicTacToeInternalState(
-                game_id,
-                player_ids,
-                player_info,
-                time_now + ttt.TURN_EXPIRATION_TIME,
-                time_now + ttt.GAME_LIFETIME
-            )
-            serialized_state = ttt.serialize_state(game_state)
-
-            # Now we want to set:
-            # 1) the queue
-            # 2) the game
-            # 3) the validation data
-            # 4) the request
-            # The idea for this order is to prevent a request from
-            # generating multiple games (easier to have it just fail)
-            # and also to prevent a request from getting assigned
-            # a bad game.
-            # Unfortunately, redis does not allow for a multiset
-            # with different expirations
-
-            # Save the queue:
-            serialized_queue = json.dumps(remaining_requests)
-            handler.set(
-                REQUEST_QUEUE_KEY,
-                serialized_queue,
-                lifetime=QUEUE_LIFETIME
-            )
+    if queue_result.status == request_queue.ENQUEUED_STATUS:
+        return game_structs_pb2.GameRequestResponse(
+            success=True,
+            message='Added request to queue',
+            request_id=request_id
+        )
 
-            # Save the game:
-            game_key = _make_state_key(game_id)
-            handler.set(game_key, serialized_state, lifetime=GAME_PERSISTENCE_TIME)
-
-            # Save the validation data
-            validation_key = _make_validation_key(game_id)
-            validation_data = json.dumps(player_ids)
-            handler.set(validation_key, validation_data, lifetime=GAME_PERSISTENCE_TIME)
-
-            # Save the request
-            serialized_request = json.dumps({
-                'player': request.player_id,
-                'game': game_id
-            })
-            handler.set(request_key, serialized_request, lifetime=REQUEST_LIFETIME)
-            matched_request_key = _make_request_key(
-                matched_request_id, matched_player_id)
-            serialized_matched_request = json.dumps({
-                'player': matched_player_id,
-                'game': game_id
-            })
-            handler.set(
-                matched_request_key,
-                serialized_matched_request,
-                lifetime=REQUEST_LIFETIME
-            )
+    _start_matched_game(
+        handler, game_id, [queue_request, queue_result.request], time_now, random_state)
 
-            response = game_structs_pb2.GameRequestResponse(
-                success=True,
-                message='Found game',
-                request_id=request_id,
-                game_id=game_id
-            )
+    return game_structs_pb2.GameRequestResponse(
+        success=True,
+        message='Found game',
+        request_id=request_id,
+        game_id=game_id
+    )
 
-        else:  # The queue is empty
-            queue_request = {
-                'id': request_id,
-                'player_id': request.player_id,
-                'username': request.player_info.username,
-                'nickname': request.player_info.nickname,
-                'level': request.player_info.level,
-                'team': request.player_info.team,
-                'expiration': time_now + REQUEST_LIFETIME
-            }
-            request_dict = {
-                'player': request.player_id
-            }
-            serialized_request = json.dumps(request_dict)
-            serialized_queue = json.dumps([queue_request])
-            # Save the request first then the queue
-            handler.set(
-                request_key,
-                serialized_request,
-                lifetime=REQUEST_LIFETIME
-            )
 
-            handler.set(
-                REQUEST_QUEUE_KEY,
-                serialized_queue,
-                lifetime=QUEUE_LIFETIME
-            )
+def _get_bot_match_time(request_data: dict) -> Optional[float]:
+    """Get the time at which the bot joins a request, or None if it never does."""
+    config = get_default_tictactoe_config()
+    # The bot only knows how to play on the standard board
+    if config.bot_wait_time is None or config.rules != ttt.DEFAULT_RULES:
+        return None
+    if 'time' not in request_data:
+        return None
+    return request_data['time'] + config.bot_wait_time
+
+
+def _match_with_bot(
+    handler: RedisCacheHandler,
+    request_id: str,
+    player_id: str,
+    time_now: float
+) -> Optional[str]:
+    """Start a game against the bot for a request waiting in the queue.
+
+    Returns:
+        maybe(str), the game id, or None if the request is no longer in the queue
+    """
+    game_id = _generate_game_id()
+    queue = get_request_queue()
+    queued_request = queue.remove(player_id, request_id, time_now)
+    if queued_request is None:
+        # Already matched with another player or expired
+        return None
+
+    player_info = _make_player_info(queued_request)
+    if _make_random_state(time_now).randint(2) == 0:
+        player_ids = [player_id, bot.BOT_PLAYER_ID]
+        player_info = [player_info, bot.BOT_PLAYER_INFO]
+    else:
+        player_ids = [bot.BOT_PLAYER_ID, player_id]
+        player_info = [bot.BOT_PLAYER_INFO, player_info]
+
+    game_state = ttt.TicTacToeInternalState(
+        game_id,
+        player_ids,
+        player_info,
+        time_now + ttt.TURN_EXPIRATION_TIME,
+        time_now + ttt.GAME_LIFETIME
+    )
 
-            response = game_structs_pb2.GameRequestResponse(
-                success=True,
-                message='Added request to queue',
-                request_id=request_id
+    bot_state = bot.play_bot_turn(game_state, get_default_solver_table())
+    serialized_request = json.dumps({
+        'player': player_id,
+        'game': game_id
+    })
+    request_key = _make_request_key(request_id, player_id)
+    # Everything about the new game is written in one round trip
+    with handler.batch() as batch:
+        _save_new_game(batch, bot_state)
+        if bot_state is not game_state and get_default_tictactoe_config().event_sourcing:
+            # The bot's opening move is logged like any other, so the log
+            # lines up with the version of the saved state
+            batch.append(
+                _make_event_log_key(game_id),
+                event_log.diff_events(game_state, bot_state),
+                lifetime=GAME_PERSISTENCE_TIME
             )
+        batch.set(request_key, serialized_request, lifetime=REQUEST_LIFETIME)
+        queue.set_pending(
+            player_id, request_id, time_now + REQUEST_LIFETIME, game_id, store=batch)
+        batch.publish(_make_request_channel(request_id, player_id), game_id)
 
-    return response
+    logger.info('Started game {} against the bot.'.format(game_id))
+    return game_id
 
 
-def check_game_request(
+def _match_waiting_request(
+    handler: RedisCacheHandler,
+    request_id: str,
+    player_id: str,
+    time_now: float
+) -> Tuple[Optional[str], Optional[float]]:
+    """Start a game for a request waiting in the queue if its wider window
+    now takes in another request.
+
+    Returns:
+        tuple of:
+            maybe(str), the game id, or None if there is no match
+            maybe(float), if there is no match, the time at which the request
+            could be matched with a request already in the queue
+    """
+    waiting_match = get_request_queue().match_waiting(player_id, request_id, time_now)
+    if waiting_match.requests is None:
+        return None, waiting_match.next_match_time
+    game_id = _generate_game_id()
+    _start_matched_game(
+        handler, game_id, list(waiting_match.requests), time_now, _make_random_state(time_now))
+    return game_id, None
+
+
+def _check_game_request(
     request: game_server_pb2.GameRequestStatusRequest
-) -> game_structs_pb2.GameRequestStatusResponse:
-    """Check if the request has been completed."""
+) -> Tuple[game_structs_pb2.GameRequestStatusResponse, float]:
+    """Check if the request has been completed.
+
+    Returns:
+        tuple of:
+            GameRequestStatusResponse, the status of the request
+            float, the time at which checking again could find a game, when the
+            bot joins or the level window has grown enough, or infinity if only
+            a match announced through redis can
+    """
+    next_check_time = float('inf')
     # Check if the request --> game mapping has been found
     redis_handler = get_default_tictactoe_cache_handler()
     key = _make_request_key(request.request_id, request.player_id)
@@ -499,6 +891,21 @@ def check_game_request(
         else:
             game_id = data.get('game')
             success = True
+            time_now = arrow.utcnow().float_timestamp
+            batch_matchmaking = get_default_tictactoe_config().batch_matchmaking
+            if game_id is None and not batch_matchmaking:
+                # The request's level window has grown while it waited
+                game_id, next_match_time = _match_waiting_request(
+                    redis_handler, request.request_id, request.player_id, time_now)
+                if next_match_time is not None:
+                    next_check_time = next_match_time
+            bot_match_time = _get_bot_match_time(data)
+            if game_id is None and bot_match_time is not None:
+                if time_now >= bot_match_time:
+                    game_id = _match_with_bot(
+                        redis_handler, request.request_id, request.player_id, time_now)
+                else:
+                    next_check_time = min(next_check_time, bot_match_time)
             if game_id is not None:
                 message = 'Game found.'
             else:
@@ -518,83 +925,135 @@ def check_game_request(
             game_id=game_id
         )
 
+    return response, next_check_time
+
+
+def check_game_request(
+    request: game_server_pb2.GameRequestStatusRequest
+) -> game_structs_pb2.GameRequestStatusResponse:
+    """Check if the request has been completed."""
+    response, _ = _check_game_request(request)
     return response
 
 
-def describe_game() -> game_structs_pb2.GameDescription:
-    """Describe this game."""
-    game_description = game_structs_pb2.GameDescription(
-        name=description.TIC_TAC_TOE_NAME,
-        description=description.TIC_TAC_TOE_DESCRIPTION
-    )
-    return game_description
+def wait_for_game(
+    request: game_server_pb2.GameRequestStatusRequest,
+    context: grpc.ServicerContext
+) -> Iterator[game_structs_pb2.GameRequestStatusResponse]:
+    """Wait for a request to be matched with a game.
+
+    Sends the status of the request right away, and again once the request
+    has a game, is gone, or has waited for longer than a request lasts. The
+    match is pushed through redis. In between, nothing is checked until the
+    bot is due to join or the level window has grown enough to take in a
+    request already in the queue, so that these happen as they do for
+    CheckGameRequest. The wait ends as soon as the call does.
+
+    Args:
+        request: GameRequestStatusRequest, the request to wait for
+        context: grpc.ServicerContext, the context of the streaming call
+    """
+    subscriber = get_default_tictactoe_cache_handler().subscriber(REQUEST_CHANNEL_PATTERN)
+    channel = _make_request_channel(request.request_id, request.player_id)
+    # Listen before the first check, so that a match in between is not missed
+    with subscriber.listen(channel) as messages:
+        if not context.add_callback(lambda: messages.put(CALL_ENDED)):
+            return
+        response, next_check_time = _check_game_request(request)
+        yield response
+        if response.game_found or not response.success:
+            return
+
+        wait_until = arrow.utcnow().float_timestamp + REQUEST_LIFETIME
+        while True:
+            time_left = min(next_check_time, wait_until) - arrow.utcnow().float_timestamp
+            if time_left > 0:
+                try:
+                    if messages.get(timeout=time_left) is CALL_ENDED:
+                        return
+                except Empty:
+                    pass
+            response, next_check_time = _check_game_request(request)
+            if (
+                response.game_found or
+                not response.success or
+                arrow.utcnow().float_timestamp >= wait_until
+            ):
+                break
+        yield response
 
 
-def describe_moves() -> game_structs_pb2.GameMovesResponse:
-    """Describe the game moves"""
-    game_moves = game_structs_pb2.GameMovesResponse(
-        moves=description.TIC_TAC_TOE_MOVES
+def list_pending_requests(
+    request: game_server_pb2.PlayerRequest
+) -> game_structs_pb2.PendingRequestsResponse:
+    """List the player's game requests that have not expired."""
+    time_now = arrow.utcnow().float_timestamp
+    pending_requests = get_request_queue().get_pending(request.player_id, time_now)
+    return game_structs_pb2.PendingRequestsResponse(
+        success=True,
+        message='Success',
+        requests=[
+            game_structs_pb2.PendingRequest(
+                request_id=pending_request.request_id,
+                game_found=pending_request.game_id is not None,
+                game_id=pending_request.game_id or '',
+                expiration_time=pending_request.expiration_time
+            )
+            for pending_request in pending_requests
+        ]
     )
-    return game_moves
+
+
+# The descriptions never change, so they are serialized once and sent as they are
+GAME_DESCRIPTION = game_structs_pb2.GameDescription(
+    name=description.TIC_TAC_TOE_NAME,
+    description=description.TIC_TAC_TOE_DESCRIPTION
+).SerializeToString()
+GAME_MOVES = game_structs_pb2.GameMovesResponse(
+    moves=description.TIC_TAC_TOE_MOVES
+).SerializeToString()
+
+
+def describe_game() -> bytes:
+    """Describe this game, as a serialized GameDescription."""
+    return GAME_DESCRIPTION
+
+
+def describe_moves() -> bytes:
+    """Describe the game moves, as a serialized GameMovesResponse."""
+    return GAME_MOVES
 
 
 def make_move(
     request: game_server_pb2.MoveRequest
 ) -> game_structs_pb2.GameStatusResponse:
     """Make a move."""
-    handler = get_default_tictactoe_cache_handler()
-    validated = _validate_game(
-        request.game_info.game_id,
-        request.game_info.player_id,
-        handler
-    )
-
-    if validated is False:
-        response = game_structs_pb2.GameStatusResponse(
-            success=False,
-            message='Cannot find game of this id for this user.'
-        )
-        return response
-
-    # Lock the state so that we can make a move
-    lock_key = _make_state_lock_key(request.game_info.game_id)
-    with handler.lock(lock_key, blocking_timeout=TTT_MOVE_BLOCK_TIME):
-        # Now grab the state from redis
-        state_key = _make_state_key(request.game_info.game_id)
-        state = handler.get(state_key)
-        if state is None:
-            logger.error(
-                'Game {} validated but data not found.'
-                .format(request.game_info.game_id)
-            )
-            not_found_response = game_structs_pb2.GameStatusResponse(
-                success=False,
-                message='Game data not found.'
-            )
-            return not_found_response
-
-        internal_state = ttt.deserialize_state(state)
-
-        # Make the move
+    def move(internal_state: ttt.TicTacToeInternalState) -> GameUpdate:
+        # A game that has run out of time is ended exactly as a read would end it
+        current_state = _check_expiration(internal_state, arrow.utcnow().float_timestamp)
+        if current_state is not internal_state:
+            return GameUpdate(OUT_OF_TIME_MESSAGE, current_state, False)
         message, new_state = ttt.make_move(
             internal_state, request.move, request.game_info.player_id
         )
-
-        # If the move was successful, write back into redis and release lock
-        if new_state is not None:
-            serialized_state = ttt.serialize_state(new_state)
-            timestamp = arrow.utcnow().timestamp
-            state_lifetime = int(
-                internal_state.game_expiration_time - timestamp + GAME_PADDED_LIFETIME)
-            handler.set(state_key, serialized_state, lifetime=state_lifetime)
-            success = True
-        else:
-            new_state = internal_state
-            success = False
+        if new_state is None:
+            return GameUpdate(message, internal_state, False)
+        # The bot replies right away, without waiting for another request
+        if bot.has_bot(new_state):
+            new_state = bot.play_bot_turn(new_state, get_default_solver_table())
+        return GameUpdate(message, new_state, True)
+
+    game_update = _update_game_state(
+        request.game_info.game_id, request.game_info.player_id, move)
+    if game_update.state is None:
+        return game_structs_pb2.GameStatusResponse(
+            success=False,
+            message=game_update.message
+        )
 
     # craft and return the correct response
     response = _convert_to_status_response(
-        request.game_info.player_id, message, new_state, success)
+        request.game_info.player_id, game_update.message, game_update.state, game_update.success)
     return response
 
 
@@ -602,22 +1061,10 @@ def get_game_status(
     request: game_server_pb2.UserGameInfo
 ) -> game_structs_pb2.GameStatusResponse:
     """Get the current status of the game."""
-    handler = get_default_tictactoe_cache_handler()
-    lock_key = _make_state_lock_key(request.game_id)
-    with handler.lock(lock_key, TTT_MOVE_BLOCK_TIME):
-        message, internal_state, save_new_state = _get_game_state(
-            request.game_id,
-            request.player_id,
-            handler
-        )
-        if save_new_state:
-            serialized_state = ttt.serialize_state(internal_state)
-            state_key = _make_state_key(request.game_id)
-            timestamp = arrow.utcnow().timestamp
-            state_lifetime = int(
-                internal_state.game_expiration_time - timestamp + GAME_PADDED_LIFETIME)
-            if state_lifetime > 0:
-                handler.set(state_key, serialized_state, lifetime=state_lifetime)
+    message, internal_state = _get_current_game_state(
+        request.game_id,
+        request.player_id
+    )
 
     if internal_state is None:
         return game_structs_pb2.GameStatusResponse(
@@ -635,25 +1082,67 @@ def get_game_status(
     return response
 
 
+def watch_game(
+    request: game_server_pb2.UserGameInfo,
+    context: grpc.ServicerContext
+) -> Iterator[game_structs_pb2.GameStatusResponse]:
+    """Watch a game, getting its status now and again each time it changes.
+
+    Every save publishes the new version through redis, so the game is only
+    loaded again when a newer version is announced, when messages may have
+    been missed, or when the turn or the game runs out of time. The stream
+    ends once the game is over or can no longer be found, and as soon as the
+    call does.
+
+    Args:
+        request: UserGameInfo, the game to watch
+        context: grpc.ServicerContext, the context of the streaming call
+    """
+    subscriber = get_default_tictactoe_cache_handler().subscriber(GAME_CHANNEL_PATTERN)
+    # Listen before the first load, so that a change in between is not missed
+    with subscriber.listen(_make_game_channel(request.game_id)) as messages:
+        if not context.add_callback(lambda: messages.put(CALL_ENDED)):
+            return
+        message, internal_state = _get_current_game_state(request.game_id, request.player_id)
+        if internal_state is None:
+            yield game_structs_pb2.GameStatusResponse(success=False, message=message)
+            return
+        yield _convert_to_status_response(request.player_id, 'Success', internal_state, True)
+
+        while internal_state.mode == ttt.PLAY_MODE:
+            deadline = _next_deadline(internal_state)
+            changed = False
+            time_left = deadline - arrow.utcnow().float_timestamp
+            while not changed and time_left >= 0:
+                try:
+                    announced_version = messages.get(timeout=time_left + 0.01)
+                except Empty:
+                    break
+                if announced_version is CALL_ENDED:
+                    return
+                changed = (
+                    announced_version is MESSAGES_MISSED or
+                    int(announced_version) > internal_state.version
+                )
+                time_left = deadline - arrow.utcnow().float_timestamp
+
+            message, new_state = _get_current_game_state(request.game_id, request.player_id)
+            if new_state is None:
+                yield game_structs_pb2.GameStatusResponse(success=False, message=message)
+                return
+            if new_state.version != internal_state.version:
+                yield _convert_to_status_response(request.player_id, 'Success', new_state, True)
+            internal_state = new_state
+
+
 def get_legal_moves(
     request: game_server_pb2.UserGameInfo
 ) -> game_structs_pb2.LegalMovesResponse:
     """Get all the possible moves the player can make at the current time."""
-    handler = get_default_tictactoe_cache_handler()
-    lock_key = _make_state_lock_key(request.game_id)
-    with handler.lock(lock_key, TTT_MOVE_BLOCK_TIME):
-        message, internal_state, save_new_state = _get_game_state(
-            request.game_id,
-            request.player_id,
-            handler
-        )
-        if save_new_state:
-            serialized_state = ttt.serialize_state(internal_state)
-            state_key = _make_state_key(request.game_id)
-            timestamp = arrow.utcnow().timestamp
-            state_lifetime = int(
-                internal_state.game_expiration_time - timestamp + GAME_PADDED_LIFETIME)
-            handler.set(state_key, serialized_state, lifetime=state_lifetime)
+    message, internal_state = _get_current_game_state(
+        request.game_id,
+        request.player_id
+    )
 
     if internal_state is None:
         return game_structs_pb2.LegalMovesResponse(
@@ -688,44 +1177,11 @@ def forfeit_game(
     request: game_server_pb2.UserGameInfo
 ) -> game_structs_pb2.GameStatusResponse:
     """Forfeit the game."""
-    handler = get_default_tictactoe_cache_handler()
-    validated = _validate_game(
-        request.game_id,
-        request.player_id,
-        handler
-    )
-
-    if validated is False:
-        response = game_structs_pb2.GameStatusResponse(
-            success=False,
-            message='Cannot find game of this id for this user.'
-        )
-        return response
-
-    # Lock the state so that we can make a move
-    lock_key = _make_state_lock_key(request.game_id)
-    with handler.lock(lock_key, blocking_timeout=TTT_MOVE_BLOCK_TIME):
-        # Now grab the state from redis
-        state_key = _make_state_key(request.game_id)
-        state = handler.get(state_key)
-        if state is None:
-            logger.error('Game {} validated but data not found'.format(request.game_id))
-            not_found_response = game_structs_pb2.GameStatusResponse(
-                success=False,
-                message='Game data not found.'
-            )
-            return not_found_response
-
-        internal_state = ttt.deserialize_state(state)
+    def forfeit(loaded_state: ttt.TicTacToeInternalState) -> GameUpdate:
+        internal_state = _check_expiration(loaded_state, arrow.utcnow().float_timestamp)
         # If the game is over, we don't want to do anything
         if internal_state.mode != ttt.PLAY_MODE:
-            return _convert_to_status_response(
-                request.player_id,
-                'Game already over. Cannot forfeit.',
-                internal_state,
-                False
-            )
-        internal_state.mode = ttt.FINISHED_MODE
+            return GameUpdate('Game already over. Cannot forfeit.', internal_state, False)
         winner_idx = None
         for idx, player_id in enumerate(internal_state.player_ids):
             if player_id != request.player_id:
@@ -735,20 +1191,23 @@ def forfeit_game(
         if winner_idx is None:
             raise AssertionError('Could not find the winning player.')
 
-        internal_state.winner = winner_idx
-        serialized_state = ttt.serialize_state(internal_state)
-        timestamp = arrow.utcnow().timestamp
-        state_lifetime = int(
-            internal_state.game_expiration_time - timestamp + GAME_PADDED_LIFETIME)
-        handler.set(state_key, serialized_state, lifetime=state_lifetime)
-        success_message = 'Success. You have forfeited the game.'
-        response = _convert_to_status_response(
-            request.player_id,
-            success_message,
-            internal_state,
-            True
+        new_state = ttt.finish_game(internal_state, winner_idx)
+        return GameUpdate('Success. You have forfeited the game.', new_state, True)
+
+    game_update = _update_game_state(request.game_id, request.player_id, forfeit)
+    if game_update.state is None:
+        return game_structs_pb2.GameStatusResponse(
+            success=False,
+            message=game_update.message
         )
-        return response
+
+    response = _convert_to_status_response(
+        request.player_id,
+        game_update.message,
+        game_update.state,
+        game_update.success
+    )
+    return response
 
 
 def make_tic_tac_toe_implementation() -> GameImplementation:
@@ -761,6 +1220,9 @@ def make_tic_tac_toe_implementation() -> GameImplementation:
         make_move_function=make_move,
         get_game_status_function=get_game_status,
         get_legal_moves_function=get_legal_moves,
-        forfeit_game_function=forfeit_game
+        forfeit_game_function=forfeit_game,
+        list_pending_requests_function=list_pending_requests,
+        wait_for_game_function=wait_for_game,
+        watch_game_function=watch_game
     )
     return implementation
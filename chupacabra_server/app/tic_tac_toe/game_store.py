@@ -0,0 +1,244 @@
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+from dbs.redis_cache import RedisBatch, RedisCacheHandler
+
+
+# Each game is one hash with the player ids, the stored state, the version of
+# the game and the version of the stored state, next to the list of events
+# logged since the game started. A game is loaded in one call and saved in one
+# call, and a save only goes through if the version is still the one that was
+# loaded, so a change made in the meantime is never overwritten.
+#
+# Games that are still being played are also kept in a sorted set by the time
+# they next run out of time, so that they can be ended even if nobody looks at
+# them again.
+#
+# Games saved before the hash existed keep their player ids and state in
+# separate keys, and have no version. They are read from there until their
+# next save, which moves them into the hash.
+PLAYERS_FIELD = 'players'
+STATE_FIELD = 'state'
+VERSION_FIELD = 'version'
+SNAPSHOT_FIELD = 'snapshot'
+DEADLINES_KEY = 'ttt:game_deadlines'
+
+# Shared by the scripts.
+# KEYS: game record, event log, old validation, old state
+# Reads a field of the game record, or the same data from the old keys, which
+# only have the players and the state.
+_READ_GAME_LUA = """
+local is_migrated = redis.call('EXISTS', KEYS[1]) == 1
+
+local function read_field(field)
+    if is_migrated then
+        return redis.call('HGET', KEYS[1], field)
+    elseif field == '""" + PLAYERS_FIELD + """' then
+        return redis.call('GET', KEYS[3])
+    elseif field == '""" + STATE_FIELD + """' then
+        return redis.call('GET', KEYS[4])
+    end
+    return false
+end
+
+local function is_player(player_id)
+    local player_ids = read_field('""" + PLAYERS_FIELD + """')
+    if not player_ids then
+        return false
+    end
+    for _, game_player_id in ipairs(cjson.decode(player_ids)) do
+        if game_player_id == player_id then
+            return true
+        end
+    end
+    return false
+end
+"""
+
+# KEYS: game record, event log, old validation, old state
+# ARGV: player id, or nothing to load the game for any of its players
+# Returns false if the player is not in the game, an empty array if the state
+# is missing, or else the state, the version of the snapshot (-1 if unknown),
+# the length of the event log and the events after the snapshot (all of them
+# if its version is unknown).
+LOAD_GAME_SCRIPT = _READ_GAME_LUA + """
+if #ARGV > 0 and not is_player(ARGV[1]) then
+    return false
+end
+local state = read_field('""" + STATE_FIELD + """')
+if not state then
+    return {}
+end
+local snapshot_version = read_field('""" + SNAPSHOT_FIELD + """') or -1
+local events = redis.call('LRANGE', KEYS[2], math.max(0, snapshot_version), -1)
+return {state, snapshot_version, redis.call('LLEN', KEYS[2]), events}
+"""
+
+# KEYS: game record, event log, old validation, old state, deadlines
+# ARGV: player id, expected version, new version, lifetime,
+#     snapshot or '' to only log the events, channel to announce the change on,
+#     game id, next deadline or '' if the game is over, then the events
+# Returns 1 if the game was saved, or 0 if the player is not in the game or the
+# game has changed since it was loaded. Games saved without a version are
+# taken to be unchanged. A saved change is published with the new version.
+SAVE_GAME_SCRIPT = _READ_GAME_LUA + """
+if not is_player(ARGV[1]) then
+    return 0
+end
+local version = read_field('""" + VERSION_FIELD + """')
+if version and tonumber(version) ~= tonumber(ARGV[2]) then
+    return 0
+end
+if not is_migrated then
+    local fields = {'""" + PLAYERS_FIELD + """', read_field('""" + PLAYERS_FIELD + """')}
+    local state = read_field('""" + STATE_FIELD + """')
+    if state then
+        table.insert(fields, '""" + STATE_FIELD + """')
+        table.insert(fields, state)
+    end
+    redis.call('HSET', KEYS[1], unpack(fields))
+    redis.call('DEL', KEYS[3], KEYS[4])
+end
+if #ARGV > 8 then
+    redis.call('RPUSH', KEYS[2], unpack(ARGV, 9))
+    redis.call('EXPIRE', KEYS[2], ARGV[4])
+end
+if ARGV[5] ~= '' then
+    redis.call(
+        'HSET', KEYS[1],
+        '""" + STATE_FIELD + """', ARGV[5],
+        '""" + SNAPSHOT_FIELD + """', ARGV[3]
+    )
+end
+redis.call('HSET', KEYS[1], '""" + VERSION_FIELD + """', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+if ARGV[8] == '' then
+    redis.call('ZREM', KEYS[5], ARGV[7])
+else
+    redis.call('ZADD', KEYS[5], ARGV[8], ARGV[7])
+end
+redis.call('PUBLISH', ARGV[6], ARGV[3])
+return 1
+"""
+
+# KEYS: deadlines
+# ARGV: time now, most games to return
+# Returns the ids of the games whose deadline has passed, earliest first.
+DUE_GAMES_SCRIPT = """
+return redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[1], 'LIMIT', 0, ARGV[2])
+"""
+
+# KEYS: deadlines
+# ARGV: game id, next deadline or '' to stop tracking the game
+SET_DEADLINE_SCRIPT = """
+if ARGV[2] == '' then
+    return redis.call('ZREM', KEYS[1], ARGV[1])
+end
+return redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+"""
+
+
+class LoadedGame(NamedTuple):
+    """The stored data of a game, as read in one call"""
+
+    state_data: Optional[bytes]
+    snapshot_version: Optional[int]
+    log_length: int
+    events: List[str]
+
+
+class GameStore:
+    def __init__(self, handler: RedisCacheHandler, deadlines_key: str = DEADLINES_KEY) -> None:
+        """Loads and saves games in one round trip each, with a version check on save.
+
+        Every method takes the game's keys in the order game record, event log, and
+        then the old validation and state keys. Saved changes are announced
+        on the game's channel, and the game's next deadline is kept up to date.
+
+        Args:
+            handler: RedisCacheHandler, the redis connection
+            deadlines_key: str, the sorted set of games by their next deadline
+        """
+        self._deadlines_key = deadlines_key
+        # Binary states cannot be decoded as text
+        self._load_game = handler.register_script(LOAD_GAME_SCRIPT, binary=True)
+        self._save_game = handler.register_script(SAVE_GAME_SCRIPT)
+        self._get_due_games = handler.register_script(DUE_GAMES_SCRIPT)
+        self._set_deadline = handler.register_script(SET_DEADLINE_SCRIPT)
+
+    def load(self, keys: Sequence[str], player_id: Optional[str]) -> Optional[LoadedGame]:
+        """Load a game for one of its players.
+
+        Args:
+            keys: list of str, the game's keys
+            player_id: maybe(str), the player loading the game, or None to load it
+                without checking the player, for maintenance
+
+        Returns:
+            maybe(LoadedGame), the game data, with no state data if the state is
+            missing, or None if the player is not in the game
+        """
+        game_data = self._load_game(keys, [] if player_id is None else [player_id])
+        if game_data is None:
+            return None
+        if not game_data:
+            return LoadedGame(state_data=None, snapshot_version=None, log_length=0, events=[])
+
+        state_data, snapshot_version, log_length, events = game_data
+        snapshot_version = int(snapshot_version)
+        return LoadedGame(
+            state_data=state_data,
+            snapshot_version=snapshot_version if snapshot_version >= 0 else None,
+            log_length=int(log_length),
+            events=[event.decode('utf-8') for event in events]
+        )
+
+    def save(
+        self,
+        keys: Sequence[str],
+        channel: str,
+        game_id: str,
+        deadline: Optional[float],
+        player_id: str,
+        expected_version: int,
+        new_version: int,
+        lifetime: int,
+        events: Sequence[str],
+        snapshot: Optional[Union[str, bytes]]
+    ) -> bool:
+        """Save a change to a game if it is still at the version it was loaded at.
+
+        Args:
+            keys: list of str, the game's keys
+            channel: str, the channel to publish the new version on
+            game_id: str, the id of the game
+            deadline: maybe(float), when the game next runs out of time, or None if it is over
+            player_id: str, the player making the change
+            expected_version: int, the version of the game as it was loaded
+            new_version: int, the version after the change
+            lifetime: int, seconds to keep the game
+            events: list of str, the events to append to the game's log
+            snapshot: maybe(str or bytes), the serialized state to store, or None to only log
+
+        Returns:
+            bool, True if the change was saved, False if the game has changed
+        """
+        saved = self._save_game(
+            list(keys) + [self._deadlines_key],
+            [
+                player_id, expected_version, new_version, lifetime, snapshot or '', channel,
+                game_id, '' if deadline is None else deadline
+            ] + list(events)
+        )
+        return bool(saved)
+
+    def add_deadline(self, batch: RedisBatch, game_id: str, deadline: float) -> None:
+        """Queue tracking when a new game next runs out of time."""
+        batch.set_score(self._deadlines_key, game_id, deadline)
+
+    def set_deadline(self, game_id: str, deadline: Optional[float]) -> None:
+        """Set when a game next runs out of time, or stop tracking it if deadline is None."""
+        self._set_deadline([self._deadlines_key], [game_id, '' if deadline is None else deadline])
+
+    def get_due(self, time_now: float, limit: int) -> List[str]:
+        """Get the ids of the games whose deadline has passed, earliest first."""
+        return self._get_due_games([self._deadlines_key], [time_now, limit])
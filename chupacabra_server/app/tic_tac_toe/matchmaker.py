@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+import logging
+import sys
+import time
+
+import click
+
+from tic_tac_toe.game_implementation import get_request_queue, match_queued_requests
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+handler = logging.StreamHandler(sys.stdout)
+logger.addHandler(handler)
+
+
+def _log_stats() -> None:
+    """Log the quality and wait times of the matches made so far."""
+    stats = get_request_queue().metrics.stats()
+    logger.info(
+        'Made {} matches: level gap mean {:.1f} max {:.1f}, '
+        'wait time mean {:.1f}s max {:.1f}s'.format(
+            stats.num_matches,
+            stats.mean_level_gap,
+            stats.max_level_gap,
+            stats.mean_wait_time,
+            stats.max_wait_time
+        )
+    )
+
+
+@click.command()
+@click.option('--interval', default=0.25, help='Seconds between passes over the queue.')
+@click.option('--stats_interval', default=60.0, help='Seconds between logs of the match stats.')
+def run(interval: float, stats_interval: float) -> None:
+    """Run the Tic Tac Toe batch matchmaker.
+
+    Pairs up the whole request queue on every pass, for servers with
+    TICTACTOE_BATCH_MATCHMAKING set.
+    """
+    logger.info('Starting Tic Tac Toe matchmaker')
+    last_stats_time = time.monotonic()
+    while True:
+        start_time = time.monotonic()
+        try:
+            game_ids = match_queued_requests()
+        except Exception:
+            # Keep matching once redis is reachable again
+            logger.exception('Matchmaking pass failed')
+        else:
+            if game_ids:
+                logger.info('Started {} games'.format(len(game_ids)))
+        if time.monotonic() - last_stats_time >= stats_interval:
+            _log_stats()
+            last_stats_time = time.monotonic()
+        time.sleep(max(0.0, interval - (time.monotonic() - start_time)))
+
+
+if __name__ == '__main__':
+    run()
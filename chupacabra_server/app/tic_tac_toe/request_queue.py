@@ -0,0 +1,594 @@
+import json
+import logging
+import threading
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from dbs.redis_cache import RedisBatch, RedisCacheHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+# The queue is a sorted set of the waiting players, scored by the expiration
+# time of their requests, with the request data in a hash keyed by player id.
+# A second sorted set holds the same players scored by level, so the nearest
+# level opponent is found with two O(log N) range lookups. Each player has at
+# most one request in the queue. All changes are made in Lua scripts, so they
+# are atomic without any lock.
+#
+# Two requests can be matched if their levels are within the window of either
+# one. A request's window starts at a base width and grows by a fixed amount
+# per second of waiting, so players are matched closely at first and with
+# anyone nearby if they have waited long.
+#
+# Each player also has an index of their pending requests, both waiting and
+# matched, in a hash from request id to expiration time and game id. It is
+# what the duplicate check and ListPendingRequests read, so neither has to
+# touch the queue.
+REQUEST_QUEUE_KEY = 'ttt:request_queue'
+REQUEST_QUEUE_DATA_KEY = 'ttt:request_queue_data'
+REQUEST_LEVELS_KEY = 'ttt:request_levels'
+EXPIRATION_FIELD = 'expiration'
+GAME_FIELD = 'game'
+
+QUEUED_STATUS = 'queued'
+MATCHED_STATUS = 'matched'
+ENQUEUED_STATUS = 'enqueued'
+
+# Players without a numeric level are treated as beginners
+DEFAULT_LEVEL = 0.0
+
+# Most waiting requests read by one script call, so that a long queue does not
+# hold up redis. Also well under the number of values Lua can unpack at once.
+WAITING_PAGE_SIZE = 1000
+
+
+def make_pending_requests_key(player_id: str) -> str:
+    """Make the redis key for the index of a player's pending requests."""
+    return 'ttt:{}.pending_requests'.format(player_id)
+
+
+def parse_level(level: str) -> float:
+    """Get the numeric level of a player from PlayerInfo.level."""
+    try:
+        return float(level)
+    except ValueError:
+        return DEFAULT_LEVEL
+
+
+# Shared by the scripts.
+# KEYS: queue, queue data, levels
+# ARGV: time now, base level window, level window growth per second
+# Drops the requests that have expired and defines find_partner, which takes
+# the nearest level request that either player's window allows out of the queue.
+# If there is none, find_partner also gives the time at which the window of the
+# seeker or of one of its nearest neighbours will have grown enough to match
+# them, if it ever will.
+_FIND_PARTNER_LUA = """
+local now = tonumber(ARGV[1])
+local base_window = tonumber(ARGV[2])
+local window_growth = tonumber(ARGV[3])
+
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now)
+for _, player_id in ipairs(expired) do
+    redis.call('HDEL', KEYS[2], player_id)
+    redis.call('ZREM', KEYS[3], player_id)
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+
+local function window(request)
+    return base_window + window_growth * math.max(0, now - (request['time'] or now))
+end
+
+local function find_partner(level, seeker)
+    local seeker_window = window(seeker)
+    local best_gap = nil
+    local best_player_id = nil
+    local best_request = nil
+    local next_match_time = nil
+    local nearest = {
+        redis.call('ZRANGEBYSCORE', KEYS[3], level, '+inf', 'WITHSCORES', 'LIMIT', 0, 1),
+        redis.call('ZREVRANGEBYSCORE', KEYS[3], level, '-inf', 'WITHSCORES', 'LIMIT', 0, 1)
+    }
+    for _, found in ipairs(nearest) do
+        if #found > 0 then
+            local gap = math.abs(tonumber(found[2]) - level)
+            local request = redis.call('HGET', KEYS[2], found[1])
+            local decoded_request = cjson.decode(request)
+            if gap <= math.max(seeker_window, window(decoded_request)) then
+                if best_gap == nil or gap < best_gap then
+                    best_gap = gap
+                    best_player_id = found[1]
+                    best_request = request
+                end
+            elseif window_growth > 0 then
+                -- The window of the request that has waited longest is the first to fit
+                local oldest_time = math.min(
+                    seeker['time'] or now, decoded_request['time'] or now)
+                local match_time = oldest_time + (gap - base_window) / window_growth
+                if next_match_time == nil or match_time < next_match_time then
+                    next_match_time = match_time
+                end
+            end
+        end
+    end
+    if best_player_id then
+        redis.call('ZREM', KEYS[1], best_player_id)
+        redis.call('ZREM', KEYS[3], best_player_id)
+        redis.call('HDEL', KEYS[2], best_player_id)
+    end
+    return best_request, next_match_time
+end
+"""
+
+# KEYS: queue, queue data, levels, the player's pending requests
+# ARGV: time now, base level window, level window growth per second,
+#     player id, request json, request expiration, level, queue lifetime,
+#     request id, pending request json, pending requests lifetime,
+#     '1' to look for a partner or '0' to leave that to the batch matcher
+# Returns the status and the request json: the player's request already in the
+# queue, the partner's request taken from the queue, or the new request.
+MATCH_OR_ENQUEUE_SCRIPT = _FIND_PARTNER_LUA + """
+local existing = redis.call('HGET', KEYS[2], ARGV[4])
+if existing then
+    return {'""" + QUEUED_STATUS + """', existing}
+end
+if ARGV[12] == '1' then
+    local partner_request = find_partner(tonumber(ARGV[7]), {})
+    if partner_request then
+        return {'""" + MATCHED_STATUS + """', partner_request}
+    end
+end
+redis.call('ZADD', KEYS[1], ARGV[6], ARGV[4])
+redis.call('ZADD', KEYS[3], ARGV[7], ARGV[4])
+redis.call('HSET', KEYS[2], ARGV[4], ARGV[5])
+for idx = 1, 3 do
+    redis.call('EXPIRE', KEYS[idx], ARGV[8])
+end
+redis.call('HSET', KEYS[4], ARGV[9], ARGV[10])
+redis.call('EXPIRE', KEYS[4], ARGV[11])
+return {'""" + ENQUEUED_STATUS + """', ARGV[5]}
+"""
+
+# KEYS: queue, queue data, levels
+# ARGV: time now, base level window, level window growth per second,
+#     player id, request id
+# Tries to match a request that is already waiting, with its widened window.
+# Returns the request json and the partner's request json if they were matched,
+# and takes both out of the queue. Otherwise returns the time at which the
+# request could be matched with the queue as it is, if there is one. Numbers
+# are returned as strings, as redis would round them to integers.
+MATCH_WAITING_SCRIPT = _FIND_PARTNER_LUA + """
+local request = redis.call('HGET', KEYS[2], ARGV[4])
+if not request or cjson.decode(request)['id'] ~= ARGV[5] then
+    return {}
+end
+local level = tonumber(redis.call('ZSCORE', KEYS[3], ARGV[4]))
+redis.call('ZREM', KEYS[3], ARGV[4])
+local partner_request, next_match_time = find_partner(level, cjson.decode(request))
+if not partner_request then
+    redis.call('ZADD', KEYS[3], level, ARGV[4])
+    if next_match_time then
+        return {tostring(next_match_time)}
+    end
+    return {}
+end
+redis.call('ZREM', KEYS[1], ARGV[4])
+redis.call('HDEL', KEYS[2], ARGV[4])
+return {request, partner_request}
+"""
+
+# KEYS: queue, queue data, levels
+# ARGV: time now, base level window, level window growth per second,
+#     player id, request id
+# Returns the request json if the request was still waiting, and removes it.
+REMOVE_REQUEST_SCRIPT = _FIND_PARTNER_LUA + """
+local request = redis.call('HGET', KEYS[2], ARGV[4])
+if not request or cjson.decode(request)['id'] ~= ARGV[5] then
+    return false
+end
+redis.call('ZREM', KEYS[1], ARGV[4])
+redis.call('ZREM', KEYS[3], ARGV[4])
+redis.call('HDEL', KEYS[2], ARGV[4])
+return request
+"""
+
+
+# KEYS: queue, queue data, levels
+# ARGV: time now, base level window, level window growth per second,
+#     first rank, last rank
+# Returns the json of the waiting requests between two ranks in order of level,
+# with nil for any request that has no data.
+WAITING_REQUESTS_SCRIPT = _FIND_PARTNER_LUA + """
+local player_ids = redis.call('ZRANGE', KEYS[3], ARGV[4], ARGV[5])
+if #player_ids == 0 then
+    return {}
+end
+return redis.call('HMGET', KEYS[2], unpack(player_ids))
+"""
+
+# KEYS: queue, queue data, levels
+# ARGV: time now, base level window, level window growth per second,
+#     then the player id and request id of both requests of each pair
+# Takes each pair out of the queue if both of its requests are still waiting.
+# Returns 1 for each pair that was taken and 0 for each that was not.
+CLAIM_PAIRS_SCRIPT = _FIND_PARTNER_LUA + """
+local function is_waiting(player_id, request_id)
+    local request = redis.call('HGET', KEYS[2], player_id)
+    return request and cjson.decode(request)['id'] == request_id
+end
+
+local claimed = {}
+for idx = 4, #ARGV, 4 do
+    if is_waiting(ARGV[idx], ARGV[idx + 1]) and is_waiting(ARGV[idx + 2], ARGV[idx + 3]) then
+        for _, player_id in ipairs({ARGV[idx], ARGV[idx + 2]}) do
+            redis.call('ZREM', KEYS[1], player_id)
+            redis.call('ZREM', KEYS[3], player_id)
+            redis.call('HDEL', KEYS[2], player_id)
+        end
+        table.insert(claimed, 1)
+    else
+        table.insert(claimed, 0)
+    end
+end
+return claimed
+"""
+
+
+def pair_requests(
+    requests: List[dict],
+    time_now: float,
+    level_window: float,
+    level_window_growth: float
+) -> List[Tuple[dict, dict]]:
+    """Pair up waiting requests in one pass, with the same rule as the queue.
+
+    Neighbours in level order are paired if their level gap is within the window of
+    either one, so each request is paired with the nearest level partner it can get.
+
+    Args:
+        requests: list of dict, the waiting requests in order of level
+        time_now: float, the current time
+        level_window: float, the level difference any new request accepts
+        level_window_growth: float, how much wider the window gets per second of waiting
+
+    Returns:
+        list of tuple of dict, dict, the pairs of requests to start games for
+    """
+    def window(request: dict) -> float:
+        return level_window + level_window_growth * max(
+            0.0, time_now - request.get('time', time_now))
+
+    pairs = []
+    idx = 0
+    while idx < len(requests) - 1:
+        request, next_request = requests[idx], requests[idx + 1]
+        level_gap = parse_level(next_request['level']) - parse_level(request['level'])
+        if level_gap <= max(window(request), window(next_request)):
+            pairs.append((request, next_request))
+            idx += 2
+        else:
+            idx += 1
+    return pairs
+
+
+class PendingRequest(NamedTuple):
+    """A request that has not expired, with its game if it has been matched"""
+
+    request_id: str
+    expiration_time: float
+    game_id: Optional[str]
+
+
+class QueueResult(NamedTuple):
+    """The outcome of adding a request to the queue"""
+
+    status: str
+    request: dict
+
+
+class WaitingMatch(NamedTuple):
+    """The outcome of trying again to match a waiting request"""
+
+    requests: Optional[Tuple[dict, dict]]
+    next_match_time: Optional[float]
+
+
+class MatchmakingStats(NamedTuple):
+    """Quality and wait times of the matches made by this process"""
+
+    num_matches: int
+    mean_level_gap: float
+    max_level_gap: float
+    mean_wait_time: float
+    max_wait_time: float
+
+
+class MatchmakingMetrics:
+    def __init__(self) -> None:
+        """Thread safe running totals of the level gap and wait time of each match."""
+        self._lock = threading.Lock()
+        self._num_matches = 0
+        self._total_level_gap = 0.0
+        self._max_level_gap = 0.0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def record_match(self, requests: List[dict], time_now: float) -> None:
+        """Record a match between two requests.
+
+        The wait time is that of the request that waited the longest.
+        """
+        levels = [parse_level(request['level']) for request in requests]
+        level_gap = max(levels) - min(levels)
+        wait_time = max(0.0, time_now - min(request.get('time', time_now) for request in requests))
+        with self._lock:
+            self._num_matches += 1
+            self._total_level_gap += level_gap
+            self._max_level_gap = max(self._max_level_gap, level_gap)
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+        logger.info('Matched requests {} with level gap {} after {:.1f} seconds.'.format(
+            [request['id'] for request in requests], level_gap, wait_time))
+
+    def stats(self) -> MatchmakingStats:
+        """Get the match quality and wait times so far."""
+        with self._lock:
+            num_matches = max(self._num_matches, 1)
+            return MatchmakingStats(
+                num_matches=self._num_matches,
+                mean_level_gap=self._total_level_gap / num_matches,
+                max_level_gap=self._max_level_gap,
+                mean_wait_time=self._total_wait_time / num_matches,
+                max_wait_time=self._max_wait_time
+            )
+
+
+class RequestQueue:
+    def __init__(
+        self,
+        handler: RedisCacheHandler,
+        queue_lifetime: int,
+        request_lifetime: int,
+        level_window: float,
+        level_window_growth: float,
+        queue_key: str = REQUEST_QUEUE_KEY,
+        queue_data_key: str = REQUEST_QUEUE_DATA_KEY,
+        levels_key: str = REQUEST_LEVELS_KEY,
+        page_size: int = WAITING_PAGE_SIZE
+    ) -> None:
+        """A level-ordered queue of game requests kept in redis, with an index of
+        each player's requests.
+
+        Args:
+            handler: RedisCacheHandler, the redis connection
+            queue_lifetime: int, seconds the queue is kept after its last new request
+            request_lifetime: int, seconds a player's index is kept after its last change
+            level_window: float, the level difference any new request accepts
+            level_window_growth: float, how much wider the window gets per second of waiting
+            queue_key: str, the key of the sorted set of waiting players by expiration
+            queue_data_key: str, the key of the hash of request data
+            levels_key: str, the key of the sorted set of waiting players by level
+            page_size: int, the most waiting requests to read in one script call
+        """
+        if page_size < 2 or page_size > WAITING_PAGE_SIZE:
+            raise AssertionError('Illegal page size {}.'.format(page_size))
+        self._handler = handler
+        self._queue_lifetime = queue_lifetime
+        self._request_lifetime = request_lifetime
+        self._level_window = level_window
+        self._level_window_growth = level_window_growth
+        self._page_size = page_size
+        self._keys = [queue_key, queue_data_key, levels_key]
+        self._match_or_enqueue = handler.register_script(MATCH_OR_ENQUEUE_SCRIPT)
+        self._match_waiting = handler.register_script(MATCH_WAITING_SCRIPT)
+        self._remove_request = handler.register_script(REMOVE_REQUEST_SCRIPT)
+        self._waiting_requests = handler.register_script(WAITING_REQUESTS_SCRIPT)
+        self._claim_pairs = handler.register_script(CLAIM_PAIRS_SCRIPT)
+        self.metrics = MatchmakingMetrics()
+
+    def _make_args(self, time_now: float, *args) -> list:
+        """Make the arguments of a script, which all start the same way."""
+        return [time_now, self._level_window, self._level_window_growth] + list(args)
+
+    def match_or_enqueue(
+        self,
+        request: dict,
+        time_now: float,
+        match: bool = True
+    ) -> QueueResult:
+        """Take the nearest level request that is close enough, or add this one to the queue.
+
+        Args:
+            request: dict, the request, with at least 'id', 'player_id', 'level',
+                'time' and 'expiration'
+            time_now: float, the current time
+            match: bool, False to only add the request, for the batch matcher to pair
+
+        Returns:
+            QueueResult, one of:
+                the player's request that was already waiting, with status QUEUED_STATUS
+                the request of the partner to start a game with, with status MATCHED_STATUS
+                the new request, with status ENQUEUED_STATUS
+        """
+        status, request_data = self._match_or_enqueue(
+            self._keys + [make_pending_requests_key(request['player_id'])],
+            self._make_args(
+                time_now,
+                request['player_id'],
+                json.dumps(request),
+                request['expiration'],
+                parse_level(request['level']),
+                self._queue_lifetime,
+                request['id'],
+                json.dumps({EXPIRATION_FIELD: request['expiration']}),
+                self._request_lifetime,
+                '1' if match else '0'
+            )
+        )
+        result = QueueResult(status=status, request=json.loads(request_data))
+        if status == MATCHED_STATUS:
+            self.metrics.record_match([request, result.request], time_now)
+        return result
+
+    def match_waiting(
+        self,
+        player_id: str,
+        request_id: str,
+        time_now: float
+    ) -> WaitingMatch:
+        """Try again to match a request that is waiting, now that its window is wider.
+
+        Returns:
+            WaitingMatch, with either:
+                the request and its partner's request, both taken out of the queue
+                no requests, and the time at which the windows will have grown
+                enough to match the request with a request already in the queue,
+                or None if that will not happen or the request is not waiting.
+                New requests may still match it before then.
+        """
+        script_result = self._match_waiting(
+            self._keys, self._make_args(time_now, player_id, request_id))
+        if len(script_result) < 2:
+            next_match_time = float(script_result[0]) if script_result else None
+            return WaitingMatch(requests=None, next_match_time=next_match_time)
+        request, partner_request = (json.loads(data) for data in script_result)
+        self.metrics.record_match([request, partner_request], time_now)
+        return WaitingMatch(requests=(request, partner_request), next_match_time=None)
+
+    def _get_waiting_page(self, time_now: float, start: int) -> Tuple[int, List[dict]]:
+        """Read up to a page of waiting requests, in order of level, from a rank.
+
+        Returns:
+            tuple of int (the number of players read), and list of dict (their
+            requests)
+        """
+        requests_data = self._waiting_requests(
+            self._keys, self._make_args(time_now, start, start + self._page_size - 1))
+        requests = [
+            json.loads(request_data)
+            for request_data in requests_data
+            if request_data is not None
+        ]
+        return len(requests_data), requests
+
+    def get_waiting(self, time_now: float) -> List[dict]:
+        """Get every request waiting in the queue, in order of level.
+
+        The queue is read a page at a time, so it may change in between.
+        """
+        requests = []
+        start = 0
+        while True:
+            num_read, page = self._get_waiting_page(time_now, start)
+            requests.extend(page)
+            if num_read < self._page_size:
+                return requests
+            start += num_read
+
+    def match_all(self, time_now: float) -> List[Tuple[dict, dict]]:
+        """Pair up the whole queue and take the pairs out of it.
+
+        The queue is read and claimed a page at a time, so each script call is
+        short. Pairs where either request has left the queue in the meantime,
+        e.g. to play the bot, are skipped and the other request stays in the queue.
+
+        Returns:
+            list of tuple of dict, dict, the pairs of requests to start games for
+        """
+        claimed_pairs = []
+        start = 0
+        while True:
+            num_read, requests = self._get_waiting_page(time_now, start)
+            page_pairs = self._claim(
+                pair_requests(
+                    requests, time_now, self._level_window, self._level_window_growth),
+                time_now
+            )
+            claimed_pairs.extend(page_pairs)
+            if num_read < self._page_size:
+                return claimed_pairs
+            # The claimed requests have left the queue, so the ranks after the
+            # page moved down. The last request is read again, to be paired
+            # with the next page.
+            start = max(0, start + num_read - 2 * len(page_pairs) - 1)
+
+    def _claim(
+        self,
+        pairs: List[Tuple[dict, dict]],
+        time_now: float
+    ) -> List[Tuple[dict, dict]]:
+        """Take pairs of requests out of the queue if both are still waiting.
+
+        Returns:
+            list of tuple of dict, dict, the pairs that were taken
+        """
+        if not pairs:
+            return []
+
+        pair_args = []
+        for pair in pairs:
+            for request in pair:
+                pair_args.extend([request['player_id'], request['id']])
+        claimed = self._claim_pairs(self._keys, self._make_args(time_now, *pair_args))
+
+        claimed_pairs = [pair for pair, is_claimed in zip(pairs, claimed) if is_claimed]
+        for pair in claimed_pairs:
+            self.metrics.record_match(list(pair), time_now)
+        return claimed_pairs
+
+    def remove(self, player_id: str, request_id: str, time_now: float) -> Optional[dict]:
+        """Take a request out of the queue if it is still waiting.
+
+        Returns:
+            maybe(dict), the request, or None if it was matched or has expired
+        """
+        request_data = self._remove_request(
+            self._keys, self._make_args(time_now, player_id, request_id))
+        if request_data is None:
+            return None
+        return json.loads(request_data)
+
+    def set_pending(
+        self,
+        player_id: str,
+        request_id: str,
+        expiration_time: float,
+        game_id: Optional[str] = None,
+        store: Optional[Union[RedisCacheHandler, RedisBatch]] = None
+    ) -> None:
+        """Add or update a request in a player's index, e.g. when it is matched with a game.
+
+        The write goes through the given store, e.g. a batch, or else the queue's handler.
+        """
+        pending_request = {EXPIRATION_FIELD: expiration_time}
+        if game_id is not None:
+            pending_request[GAME_FIELD] = game_id
+        (store or self._handler).set_hash_fields(
+            make_pending_requests_key(player_id),
+            {request_id: json.dumps(pending_request)},
+            lifetime=self._request_lifetime
+        )
+
+    def get_pending(self, player_id: str, time_now: float) -> List[PendingRequest]:
+        """Get a player's requests that have not expired, oldest first.
+
+        Expired requests are removed from the index along the way.
+        """
+        key = make_pending_requests_key(player_id)
+        pending_requests = []
+        expired_request_ids = []
+        for request_id, request_data in self._handler.get_hash(key).items():
+            pending_request = json.loads(request_data)
+            if pending_request[EXPIRATION_FIELD] <= time_now:
+                expired_request_ids.append(request_id)
+                continue
+            pending_requests.append(PendingRequest(
+                request_id=request_id,
+                expiration_time=pending_request[EXPIRATION_FIELD],
+                game_id=pending_request.get(GAME_FIELD)
+            ))
+
+        if expired_request_ids:
+            self._handler.delete_hash_fields(key, expired_request_ids)
+        return sorted(pending_requests, key=lambda request: request.expiration_time)
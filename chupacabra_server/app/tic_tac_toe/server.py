@@ -7,9 +7,9 @@ import time
 import click
 import grpc
 
-from game_server.game_servicer import BasicGameServicer
-from protos import game_server_pb2_grpc
+from game_server.game_servicer import BasicGameServicer, add_game_servicer_to_server
 from tic_tac_toe.game_implementation import make_tic_tac_toe_implementation
+from utils.stream_limit import DEFAULT_MAX_STREAMS, StreamLimit
 
 
 logger = logging.getLogger(__name__)
@@ -24,16 +24,19 @@ ONE_DAY = 24 * 60 * 60  # in seconds
 @click.option('--host', default='127.0.0.1', help='Host address')
 @click.option('--port', default=7654, help='Port number to expose')
 @click.option('--max_workers', default=10, help='Maximum number of worker threads.')
-def serve(host: str, port: int, max_workers: int) -> None:
+@click.option('--max_streams', default=DEFAULT_MAX_STREAMS,
+              help='Maximum number of streaming calls open at once.')
+def serve(host: str, port: int, max_workers: int, max_streams: int) -> None:
     """Create and run a Tic Tac Toe server"""
     logger.info('Starting Tic Tac Toe server')
-    executor = ThreadPoolExecutor(max_workers=max_workers)
+    # Each open stream holds a thread, so streams get threads of their own
+    executor = ThreadPoolExecutor(max_workers=max_workers + max_streams)
     server = grpc.server(executor)
 
     implementation = make_tic_tac_toe_implementation()
-    servicer = BasicGameServicer(implementation)
+    servicer = BasicGameServicer(implementation, StreamLimit(max_streams))
 
-    game_server_pb2_grpc.add_GameServerServicer_to_server(servicer, server)
+    add_game_servicer_to_server(servicer, server)
     server.add_insecure_port('{}:{}'.format(host, port))
     server.start()
     logger.info('Server now running at {}:{}'.format(host, port))
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+import fcntl
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import click
+import numpy as np
+
+from tic_tac_toe import bitboard
+
+
+logger = logging.getLogger(__name__)
+
+
+# The table has one byte for every board, indexed by the board read as a base 3
+# number (0 = empty, 1 = X, 2 = O). The low 4 bits hold the best move for the
+# player whose turn it is and the next 2 bits hold the outcome under perfect play.
+TABLE_MAGIC = b'TTTS'
+TABLE_VERSION = 1
+TABLE_HEADER = TABLE_MAGIC + bytes([TABLE_VERSION, 0, 0, 0])
+NUM_POSITIONS = 3 ** bitboard.NUM_CELLS
+
+NO_MOVE = 0x0f
+OUTCOME_SHIFT = 4
+OUTCOME_UNREACHABLE = 0
+OUTCOME_X_WINS = 1
+OUTCOME_DRAW = 2
+OUTCOME_O_WINS = 3
+
+# Winner index (as in the game state) for every outcome
+OUTCOME_WINNERS = {
+    OUTCOME_X_WINS: 0,
+    OUTCOME_DRAW: -1,
+    OUTCOME_O_WINS: 1
+}
+
+DEFAULT_TABLE_PATH = os.path.join(tempfile.gettempdir(), 'tic_tac_toe_solver.bin')
+
+
+def _make_base3_table() -> Tuple[int, ...]:
+    """Get the base 3 value of every 9-bit set of marks with 1 in each set bit."""
+    return tuple(
+        sum(3 ** idx for idx in range(bitboard.NUM_CELLS) if bits >> idx & 1)
+        for bits in range(bitboard.FULL_BOARD + 1)
+    )
+
+
+BASE3 = _make_base3_table()
+
+
+def position_index(x_bits: int, o_bits: int) -> int:
+    """Get the index of a position in the table."""
+    return BASE3[x_bits] + 2 * BASE3[o_bits]
+
+
+class SolverEntry(NamedTuple):
+    """The solution for a single position."""
+
+    winner: int  # index of the winning player under perfect play, -1 for a draw
+    best_move: Optional[Tuple[int, int]]  # (x, y) for the player to move, if any
+
+
+class _Solver:
+    def __init__(self) -> None:
+        """Minimax search with a transposition table keyed by canonical board.
+
+        Scores are from the first player's point of view. A win is worth more
+        the sooner it happens, so the best moves win quickly and lose slowly.
+        """
+        self._scores: Dict[Tuple[int, int], int] = {}
+
+    def score(self, x_bits: int, o_bits: int) -> int:
+        """Get the score of a position with perfect play from here on."""
+        canonical_x, canonical_o, _ = bitboard.canonicalize(x_bits, o_bits)
+        key = (canonical_x, canonical_o)
+        score = self._scores.get(key)
+        if score is None:
+            score = self._search(canonical_x, canonical_o)
+            self._scores[key] = score
+        return score
+
+    def _search(self, x_bits: int, o_bits: int) -> int:
+        """Score a position by trying every move."""
+        num_empty = bitboard.NUM_CELLS - bin(x_bits | o_bits).count('1')
+        if bitboard.has_win(x_bits):
+            return num_empty + 1
+        if bitboard.has_win(o_bits):
+            return -(num_empty + 1)
+        if num_empty == 0:
+            return 0
+
+        child_scores = [
+            self.child_score(x_bits, o_bits, cell)
+            for cell in range(bitboard.NUM_CELLS)
+            if not (x_bits | o_bits) >> cell & 1
+        ]
+        if _is_x_turn(x_bits, o_bits):
+            return max(child_scores)
+        return min(child_scores)
+
+    def child_score(self, x_bits: int, o_bits: int, cell: int) -> int:
+        """Score the position after the player to move marks a cell."""
+        if _is_x_turn(x_bits, o_bits):
+            return self.score(x_bits | 1 << cell, o_bits)
+        return self.score(x_bits, o_bits | 1 << cell)
+
+    def best_move(self, x_bits: int, o_bits: int) -> int:
+        """Get the best cell to mark, or NO_MOVE if the game is over."""
+        game_over, _ = bitboard.check_for_game_over(x_bits, o_bits)
+        if game_over:
+            return NO_MOVE
+        sign = 1 if _is_x_turn(x_bits, o_bits) else -1
+        empty_cells = [
+            cell for cell in range(bitboard.NUM_CELLS)
+            if not (x_bits | o_bits) >> cell & 1
+        ]
+        return max(
+            empty_cells,
+            key=lambda cell: sign * self.child_score(x_bits, o_bits, cell)
+        )
+
+
+def _is_x_turn(x_bits: int, o_bits: int) -> bool:
+    """X always moves first, so it is X's turn when both have the same number of marks."""
+    return bin(x_bits).count('1') == bin(o_bits).count('1')
+
+
+def _outcome(score: int) -> int:
+    """Convert a score into an outcome code."""
+    if score > 0:
+        return OUTCOME_X_WINS
+    if score < 0:
+        return OUTCOME_O_WINS
+    return OUTCOME_DRAW
+
+
+def build_table() -> bytes:
+    """Solve every position reachable from the empty board.
+
+    Returns:
+        bytes, one entry per position, zero for unreachable positions
+    """
+    solver = _Solver()
+    table = np.zeros(NUM_POSITIONS, dtype=np.uint8)
+    stack = [(0, 0)]
+    seen = set()
+    while stack:
+        x_bits, o_bits = stack.pop()
+        if (x_bits, o_bits) in seen:
+            continue
+        seen.add((x_bits, o_bits))
+
+        best_move = solver.best_move(x_bits, o_bits)
+        outcome = _outcome(solver.score(x_bits, o_bits))
+        table[position_index(x_bits, o_bits)] = outcome << OUTCOME_SHIFT | best_move
+
+        if best_move == NO_MOVE:
+            continue
+        is_x_turn = _is_x_turn(x_bits, o_bits)
+        for cell in range(bitboard.NUM_CELLS):
+            if (x_bits | o_bits) >> cell & 1:
+                continue
+            if is_x_turn:
+                stack.append((x_bits | 1 << cell, o_bits))
+            else:
+                stack.append((x_bits, o_bits | 1 << cell))
+
+    logger.info('Solved {} reachable positions.'.format(len(seen)))
+    return table.tobytes()
+
+
+def write_table(path: str) -> None:
+    """Solve the game and write the table to disk.
+
+    The table is written to a temporary file that is then moved into place, so
+    other processes never see a partially written table. Temporary files are
+    only readable by their owner, so the table is made readable by everyone
+    first, like any other file in the directory.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(file_descriptor, 'wb') as table_file:
+            table_file.write(TABLE_HEADER)
+            table_file.write(build_table())
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+class SolverTable:
+    def __init__(self, path: str) -> None:
+        """A read-only, memory mapped table of perfect play for every position.
+
+        The operating system shares the mapped pages between every process that
+        opens the same table, so it is only held in memory once per host.
+
+        Args:
+            path: str, the path to a table made by write_table
+        """
+        with open(path, 'rb') as table_file:
+            self._table = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._table) != len(TABLE_HEADER) + NUM_POSITIONS:
+            raise AssertionError('Solver table {} has the wrong size.'.format(path))
+        if self._table[:len(TABLE_HEADER)] != TABLE_HEADER:
+            raise AssertionError('Solver table {} has an unknown format.'.format(path))
+
+    def lookup(self, x_bits: int, o_bits: int) -> Optional[SolverEntry]:
+        """Look up a position given both players' marks.
+
+        Returns:
+            maybe(SolverEntry), None if the position cannot come up in a game
+        """
+        entry = self._table[len(TABLE_HEADER) + position_index(x_bits, o_bits)]
+        outcome = entry >> OUTCOME_SHIFT
+        if outcome == OUTCOME_UNREACHABLE:
+            return None
+
+        cell = entry & NO_MOVE
+        if cell == NO_MOVE:
+            best_move = None
+        else:
+            best_move = divmod(cell, bitboard.BOARD_SIZE)
+        return SolverEntry(winner=OUTCOME_WINNERS[outcome], best_move=best_move)
+
+    def lookup_board(self, board: np.ndarray) -> Optional[SolverEntry]:
+        """Look up a position given a 3x3 numpy board."""
+        x_bits, o_bits = bitboard.from_board(board)
+        return self.lookup(x_bits, o_bits)
+
+
+_TABLES: Dict[str, SolverTable] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def _write_missing_table(path: str) -> None:
+    """Write the table unless another process has written it while waiting for the lock."""
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            if not os.path.exists(path):
+                logger.info('Writing solver table to {}'.format(path))
+                write_table(path)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def get_solver_table(path: str = DEFAULT_TABLE_PATH) -> SolverTable:
+    """Get the solver table at a path, solving the game first if it is missing.
+
+    Each process maps a table once. Processes on a host that ask for a missing
+    table at the same time take turns with a lock file next to it, so only the
+    first of them solves the game and the others wait for its table.
+    """
+    with _TABLES_LOCK:
+        table = _TABLES.get(path)
+        if table is None:
+            if not os.path.exists(path):
+                _write_missing_table(path)
+            table = SolverTable(path)
+            _TABLES[path] = table
+    return table
+
+
+@click.command()
+@click.option('--path', default=DEFAULT_TABLE_PATH, help='Where to write the table')
+def solve(path: str) -> None:
+    """Solve Tic Tac Toe and write the table of perfect play to disk."""
+    write_table(path)
+    print('Wrote solver table to {}'.format(path))
+
+
+if __name__ == '__main__':
+    solve()
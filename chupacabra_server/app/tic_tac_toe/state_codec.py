@@ -0,0 +1,308 @@
+import abc
+import base64
+from functools import lru_cache
+import itertools
+import struct
+import timeit
+from typing import Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from chupacabra_client.protos.game_structs_pb2 import PlayerInfo
+import numpy as np
+
+from tic_tac_toe import bitboard
+from tic_tac_toe import tic_tac_toe_game as ttt
+
+
+class StateCodec(abc.ABC):
+    """Converts game states to and from the strings stored in the cache."""
+
+    name = ''
+
+    @abc.abstractmethod
+    def encode(self, state: ttt.TicTacToeInternalState) -> Union[str, bytes]:
+        """Encode a game state."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def decode(self, data: Union[str, bytes]) -> ttt.TicTacToeInternalState:
+        """Decode a game state."""
+        raise NotImplementedError()
+
+
+class JsonStateCodec(StateCodec):
+    """The original codec: the full state as a JSON dictionary."""
+
+    name = 'json'
+
+    def encode(self, state: ttt.TicTacToeInternalState) -> str:
+        """Encode a game state as JSON."""
+        return ttt.serialize_state(state)
+
+    def decode(self, data: Union[str, bytes]) -> ttt.TicTacToeInternalState:
+        """Decode a JSON game state."""
+        return ttt.deserialize_state(data)
+
+
+# Binary layout, all little-endian:
+#   header: magic, format version, mode, turn, winner, board rows, board columns,
+#       win length, state version, turn expiration time, game expiration time
+#   board: 2 bits per cell (0 = empty, 1 = X, 2 = O) in row major order, 4 cells per byte
+#   game id: uint16 length + utf-8 bytes
+#   player block:
+#       string table: uint8 count, then (uint16 length + utf-8 bytes) per string
+#       references: uint8 index into the table for each player id, then for
+#           each player the username, nickname, level, and team
+# Repeated strings (empty teams, nicknames equal to usernames...) are stored once.
+# The format version is checked on decode, so that the layout can change later.
+# States are stored as raw bytes. Earlier ones were base64 encoded, and can
+# still be read.
+BINARY_MAGIC = b'TT'
+BINARY_FORMAT_VERSION = 1
+PREFIX_STRUCT = struct.Struct('<2sB')
+HEADER_STRUCT = struct.Struct('<2sBBbbBBBIdd')
+LENGTH_STRUCT = struct.Struct('<H')
+COUNT_STRUCT = struct.Struct('<B')
+
+NUM_PLAYERS = 2
+PLAYER_FIELDS = ('username', 'nickname', 'level', 'team')
+NUM_REFERENCES = NUM_PLAYERS + NUM_PLAYERS * len(PLAYER_FIELDS)
+REFERENCES_STRUCT = struct.Struct('<{}B'.format(NUM_REFERENCES))
+MAX_STRING_LENGTH = 2 ** 16 - 1
+MAX_BOARD_SIZE = 2 ** 8 - 1
+
+CELLS_PER_BYTE = 4
+# Each group of 4 cells, as the bytes of the int8 board, and its packed byte.
+# Looking the groups up is much cheaper than packing them with numpy on
+# boards of the usual size.
+CELL_CODES = {0: 0, bitboard.X_VALUE: 1, bitboard.O_VALUE: 2}
+PACKED_CELLS = {
+    np.array(values, dtype=np.int8).tobytes(): sum(
+        CELL_CODES[value] << (2 * idx) for idx, value in enumerate(values))
+    for values in itertools.product(CELL_CODES, repeat=CELLS_PER_BYTE)
+}
+UNPACKED_CELLS = [b'\x00' * CELLS_PER_BYTE] * 256
+for cells, packed_byte in PACKED_CELLS.items():
+    UNPACKED_CELLS[packed_byte] = cells
+
+MODE_CODES = {
+    ttt.PLAY_MODE: 0,
+    ttt.FINISHED_MODE: 1
+}
+CODE_MODES = {code: mode for mode, code in MODE_CODES.items()}
+
+# Number of distinct player blocks to keep decoded in memory
+PLAYER_BLOCK_CACHE_SIZE = 4096
+
+
+def _pack_string(value: str) -> bytes:
+    """Pack a length prefixed string."""
+    encoded_value = value.encode('utf-8')
+    if len(encoded_value) > MAX_STRING_LENGTH:
+        raise AssertionError('String too long to encode: {}'.format(len(encoded_value)))
+    return LENGTH_STRUCT.pack(len(encoded_value)) + encoded_value
+
+
+def _unpack_string(data: bytes, offset: int) -> Tuple[str, int]:
+    """Unpack a length prefixed string, returning it and the new offset."""
+    (length,) = LENGTH_STRUCT.unpack_from(data, offset)
+    offset += LENGTH_STRUCT.size
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+
+def _pack_player_block(player_ids: Sequence[str], players: Sequence[PlayerInfo]) -> bytes:
+    """Pack the player ids and info into an interned string table."""
+    values = list(player_ids)
+    for player in players:
+        values.extend(getattr(player, field) for field in PLAYER_FIELDS)
+    return _pack_player_values(tuple(values))
+
+
+@lru_cache(maxsize=PLAYER_BLOCK_CACHE_SIZE)
+def _pack_player_values(values: Tuple[str, ...]) -> bytes:
+    """Pack the player ids, then each field of each player, into an interned string table.
+
+    The players of a game never change, so their block is packed once.
+    """
+    table: Dict[str, int] = {}
+    for value in values:
+        table.setdefault(value, len(table))
+
+    packed_table = b''.join(_pack_string(value) for value in table)
+    references = REFERENCES_STRUCT.pack(*[table[value] for value in values])
+    return COUNT_STRUCT.pack(len(table)) + packed_table + references
+
+
+@lru_cache(maxsize=PLAYER_BLOCK_CACHE_SIZE)
+def _unpack_player_block(block: bytes) -> Tuple[List[str], List[PlayerInfo]]:
+    """Unpack a player block. Decoded blocks are shared, so must not be modified."""
+    (count,) = COUNT_STRUCT.unpack_from(block, 0)
+    offset = COUNT_STRUCT.size
+    table = []
+    for _ in range(count):
+        value, offset = _unpack_string(block, offset)
+        table.append(value)
+
+    values = [table[idx] for idx in REFERENCES_STRUCT.unpack_from(block, offset)]
+    player_ids = values[:NUM_PLAYERS]
+    num_fields = len(PLAYER_FIELDS)
+    players = [
+        PlayerInfo(**dict(zip(PLAYER_FIELDS, values[start:start + num_fields])))
+        for start in range(NUM_PLAYERS, len(values), num_fields)
+    ]
+    return player_ids, players
+
+
+def _pack_board(board: np.ndarray) -> bytes:
+    """Pack a board of any size into 2 bits per cell."""
+    cells = board.tobytes()
+    cells += bytes(-len(cells) % CELLS_PER_BYTE)
+    return bytes([
+        PACKED_CELLS[cells[start:start + CELLS_PER_BYTE]]
+        for start in range(0, len(cells), CELLS_PER_BYTE)
+    ])
+
+
+def _unpack_board(data: bytes, offset: int, rows: int, columns: int) -> Tuple[np.ndarray, int]:
+    """Unpack a board, returning it and the new offset."""
+    num_cells = rows * columns
+    num_bytes = -(-num_cells // CELLS_PER_BYTE)
+    cells = bytearray().join(
+        [UNPACKED_CELLS[packed_byte] for packed_byte in data[offset:offset + num_bytes]])
+    board = np.frombuffer(cells, dtype=np.int8, count=num_cells).reshape([rows, columns])
+    return board, offset + num_bytes
+
+
+class BinaryStateCodec(StateCodec):
+    """A compact, versioned binary codec that can also read legacy JSON states.
+
+    States are encoded as raw bytes, so they have to be read from redis
+    without decoding. Legacy JSON states start with '{', and base64 encoded
+    states from before states were stored as bytes never start with the magic.
+    """
+
+    name = 'binary'
+
+    def encode(self, state: ttt.TicTacToeInternalState) -> bytes:
+        """Encode a game state with the current binary format."""
+        return self.encode_bytes(state)
+
+    def decode(self, data: Union[str, bytes]) -> ttt.TicTacToeInternalState:
+        """Decode a game state from either the binary format, base64 or JSON."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if data.startswith(BINARY_MAGIC):
+            return self.decode_bytes(data)
+        if data.startswith(b'{'):
+            return ttt.deserialize_state(data)
+        return self.decode_bytes(base64.b64decode(data))
+
+    def encode_bytes(self, state: ttt.TicTacToeInternalState) -> bytes:
+        """Encode a game state into raw bytes."""
+        rows, columns = state.board.shape
+        if rows > MAX_BOARD_SIZE or columns > MAX_BOARD_SIZE:
+            raise AssertionError('Board too large to encode: {}x{}'.format(rows, columns))
+        header = HEADER_STRUCT.pack(
+            BINARY_MAGIC,
+            BINARY_FORMAT_VERSION,
+            MODE_CODES[state.mode],
+            state.turn,
+            state.winner,
+            rows,
+            columns,
+            state.win_length,
+            state.version,
+            state.turn_expiration_time,
+            state.game_expiration_time
+        )
+        return (
+            header +
+            _pack_board(state.board) +
+            _pack_string(state.id) +
+            _pack_player_block(state.player_ids, state.players)
+        )
+
+    def decode_bytes(self, data: bytes) -> ttt.TicTacToeInternalState:
+        """Decode a game state from raw bytes."""
+        magic, format_version = PREFIX_STRUCT.unpack_from(data, 0)
+        if magic != BINARY_MAGIC:
+            raise AssertionError('Not a binary game state.')
+        if format_version != BINARY_FORMAT_VERSION:
+            raise AssertionError('Unknown game state format version {}.'.format(format_version))
+
+        (
+            _, _, mode_code, turn, winner, rows, columns, win_length, version,
+            turn_ex_time, game_ex_time
+        ) = HEADER_STRUCT.unpack_from(data, 0)
+        board, offset = _unpack_board(data, HEADER_STRUCT.size, rows, columns)
+        game_id, offset = _unpack_string(data, offset)
+        player_ids, players = _unpack_player_block(data[offset:])
+        return ttt.TicTacToeInternalState(
+            game_id,
+            player_ids,
+            players,
+            turn_ex_time,
+            game_ex_time,
+            board=board,
+            mode=CODE_MODES[mode_code],
+            turn=turn,
+            winner=winner,
+            rules=ttt.BoardRules(rows=rows, columns=columns, win_length=win_length),
+            version=version
+        )
+
+
+STATE_CODECS = {
+    JsonStateCodec.name: JsonStateCodec(),
+    BinaryStateCodec.name: BinaryStateCodec()
+}
+
+
+def get_state_codec(name: str) -> StateCodec:
+    """Get a state codec by name."""
+    codec = STATE_CODECS.get(name)
+    if codec is None:
+        raise AssertionError('Unknown state codec {}.'.format(name))
+    return codec
+
+
+class CodecReport(NamedTuple):
+    """Size and speed of a codec"""
+
+    name: str
+    bytes_per_game: float
+    encode_microseconds: float
+    decode_microseconds: float
+
+
+def measure_codec(
+    codec: StateCodec,
+    states: Sequence[ttt.TicTacToeInternalState],
+    number: int = 1000
+) -> CodecReport:
+    """Measure the average encoded size and encode/decode times of a codec.
+
+    Args:
+        codec: StateCodec, the codec to measure
+        states: the game states to encode
+        number: int, the number of times to encode and decode every state
+
+    Returns:
+        CodecReport, averages per game state
+    """
+    encoded_states = [codec.encode(state) for state in states]
+    bytes_per_game = sum(
+        len(encoded if isinstance(encoded, bytes) else encoded.encode('utf-8'))
+        for encoded in encoded_states
+    ) / len(states)
+
+    encode_seconds = timeit.timeit(
+        lambda: [codec.encode(state) for state in states], number=number)
+    decode_seconds = timeit.timeit(
+        lambda: [codec.decode(encoded) for encoded in encoded_states], number=number)
+    num_calls = number * len(states)
+    return CodecReport(
+        name=codec.name,
+        bytes_per_game=bytes_per_game,
+        encode_microseconds=1e6 * encode_seconds / num_calls,
+        decode_microseconds=1e6 * decode_seconds / num_calls
+    )
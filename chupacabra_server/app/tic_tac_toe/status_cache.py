@@ -0,0 +1,97 @@
+from collections import OrderedDict
+import threading
+from typing import Callable, Hashable, NamedTuple
+
+from chupacabra_client.protos import game_structs_pb2
+
+
+# Each entry is a few hundred bytes, so this stays within a few megabytes
+DEFAULT_MAX_SIZE = 10000
+
+
+class StatusCacheStats(NamedTuple):
+    """Usage of a status cache"""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups answered from the cache."""
+        num_lookups = self.hits + self.misses
+        return self.hits / num_lookups if num_lookups else 0.0
+
+
+class StatusCache:
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """A thread safe LRU cache of the status info sent back for a game.
+
+        The key has to change whenever the status info would, for example by
+        including the version of the game. Entries are never changed, so a
+        finished game stays cached for as long as it is looked at.
+
+        Args:
+            max_size: int, the most entries to keep
+        """
+        if max_size < 1:
+            raise AssertionError('Illegal cache size {}.'.format(max_size))
+        self._max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        key: Hashable,
+        build: Callable[[], game_structs_pb2.GameStatusInfo]
+    ) -> game_structs_pb2.GameStatusInfo:
+        """Get the status info for a key, building it if it is not cached.
+
+        The cached message is shared, so it must not be changed. Setting it as a
+        field of another message makes a copy.
+
+        Args:
+            key: the key for this status info
+            build: function, makes the status info
+
+        Returns:
+            GameStatusInfo, the status info
+        """
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+
+        # Built without the lock, so two threads may both build a new entry
+        status_info = build()
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = status_info
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return status_info
+
+    def stats(self) -> StatusCacheStats:
+        """Get the hit rate and evictions of the cache."""
+        with self._lock:
+            return StatusCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
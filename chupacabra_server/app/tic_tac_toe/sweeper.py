@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+import logging
+import sys
+import time
+
+import click
+
+from tic_tac_toe.game_implementation import sweep_expired_games
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+handler = logging.StreamHandler(sys.stdout)
+logger.addHandler(handler)
+
+
+@click.command()
+@click.option('--interval', default=0.5, help='Seconds between passes over the deadlines.')
+@click.option('--batch_size', default=100, help='Most games to end in one pass.')
+def run(interval: float, batch_size: int) -> None:
+    """Run the Tic Tac Toe sweeper.
+
+    Ends the games that have run out of time, so that their results are
+    saved and published without waiting for a player to come back.
+    """
+    logger.info('Starting Tic Tac Toe sweeper')
+    while True:
+        start_time = time.monotonic()
+        try:
+            game_ids = sweep_expired_games(batch_size)
+        except Exception:
+            # Keep sweeping once redis is reachable again
+            logger.exception('Sweeping pass failed')
+            game_ids = []
+        if game_ids:
+            logger.info('Ended {} games'.format(len(game_ids)))
+        # Go again straight away while there is a backlog
+        if len(game_ids) < batch_size:
+            time.sleep(max(0.0, interval - (time.monotonic() - start_time)))
+
+
+if __name__ == '__main__':
+    run()
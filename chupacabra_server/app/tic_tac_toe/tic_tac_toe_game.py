@@ -1,12 +1,13 @@
-import copy
 import json
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import arrow
 from chupacabra_client.protos.game_structs_pb2 import PlayerInfo, Move
 import numpy as np
 
+from tic_tac_toe import bitboard
+
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +30,48 @@ TURN_KEY = 'turn'
 WINNER_KEY = 'winner'
 TURN_EX_TIME_KEY = 'turn_ex'
 GAME_EX_TIME_KEY = 'game_ex'
+WIN_LENGTH_KEY = 'win_length'
+VERSION_KEY = 'version'
 
 GAME_LIFETIME = 11 * 60  # 11 minutes
 TURN_EXPIRATION_TIME = 60  # 1 minute, expiration for a single turn
 
 
+class BoardRules(NamedTuple):
+    """The size of the board and the number in a row needed to win (an m,n,k-game)"""
+
+    rows: int
+    columns: int
+    win_length: int
+
+
+# Regular Tic Tac Toe. 15x15 with 5 in a row would be Gomoku.
+DEFAULT_RULES = BoardRules(rows=3, columns=3, win_length=3)
+
+
+def validate_rules(rules: BoardRules) -> None:
+    """Check that the rules describe a playable game."""
+    if rules.rows < 1 or rules.columns < 1:
+        raise AssertionError('Illegal board size {}x{}.'.format(rules.rows, rules.columns))
+    if rules.win_length < 1 or rules.win_length > max(rules.rows, rules.columns):
+        raise AssertionError('Illegal win length {}.'.format(rules.win_length))
+
+
 class TicTacToeInternalState:
+    __slots__ = (
+        'id',
+        'player_ids',
+        'players',
+        'game_expiration_time',
+        'turn_expiration_time',
+        'board',
+        'mode',
+        'turn',
+        'winner',
+        'win_length',
+        'version',
+    )
+
     def __init__(
         self,
         game_id: str,
@@ -46,6 +83,8 @@ class TicTacToeInternalState:
         mode: str = None,
         turn: int = None,
         winner: int = None,
+        rules: BoardRules = None,
+        version: int = None,
     ):
         """Represents an internal state of a tic tac toe game
 
@@ -55,10 +94,14 @@ class TicTacToeInternalState:
             players: list of PlayerInfo, the players
             turn_expiration_time: int, the time at which the current turn expires
             game_expiration_time: int, the time at which the game expires
-            board: Maybe(numpy.ndarray), the 3x3 game board
+            board: Maybe(numpy.ndarray), the game board, 3x3 unless other rules are given
             mode: Maybe(str), the current game mode
             turn: Maybe(int), the index of the player whose turn it is (if applicable)
             winner: Maybe(int), the index of the winning player if applicable
+            rules: Maybe(BoardRules), the board size and win length, standard if not given
+            version: Maybe(int), the number of changes made to the game since it started.
+                While the game is in play this is the number of marks on the board,
+                which is what it defaults to.
         """
         if not game_id:
             raise AssertionError('Please supply a game ID.')
@@ -73,15 +116,22 @@ class TicTacToeInternalState:
         self.game_expiration_time = game_expiration_time
         self.turn_expiration_time = turn_expiration_time
 
+        if rules is None:
+            rules = DEFAULT_RULES
+        validate_rules(rules)
+        self.win_length = rules.win_length
+
+        board_shape = (rules.rows, rules.columns)
         if board is None:
-            self.board = np.zeros([3, 3], np.int8)
+            self.board = np.zeros(board_shape, np.int8)
         else:
             if not isinstance(board, np.ndarray):
                 raise AssertionError('Board must be a numpy array. Got {}'.format(type(board)))
             if board.dtype != np.int8:
                 raise AssertionError('Board must have type numpy.int8. Got {}'.format(board.dtype))
-            if board.shape != (3, 3):
-                raise AssertionError('Board shape must be (3, 3). Got {}'.format(board.shape))
+            if board.shape != board_shape:
+                raise AssertionError(
+                    'Board shape must be {}. Got {}'.format(board_shape, board.shape))
             self.board = board
 
         if mode is None:
@@ -101,6 +151,39 @@ class TicTacToeInternalState:
             self.winner = -1
         else:
             self.winner = winner
+        if version is None:
+            self.version = int(np.count_nonzero(self.board))
+        else:
+            self.version = version
+
+    def evolve(self, **changes) -> 'TicTacToeInternalState':
+        """Make a copy of this state with some of its fields replaced.
+
+        Nothing is deep copied: the new state shares the player ids, the player info,
+        and the board with this one. These are treated as immutable, so to change
+        the board, pass in a modified copy of it.
+
+        Args:
+            changes: the new values of any fields to replace
+
+        Returns:
+            TicTacToeInternalState, the new state
+        """
+        new_state = TicTacToeInternalState.__new__(TicTacToeInternalState)
+        for name in self.__slots__:
+            if name in changes:
+                setattr(new_state, name, changes.pop(name))
+            else:
+                setattr(new_state, name, getattr(self, name))
+        if changes:
+            raise AssertionError('Unknown state fields {}.'.format(sorted(changes)))
+        return new_state
+
+    @property
+    def rules(self) -> BoardRules:
+        """The board size and win length of this game."""
+        rows, columns = self.board.shape
+        return BoardRules(rows=rows, columns=columns, win_length=self.win_length)
 
 
 def serialize_state(state: TicTacToeInternalState) -> str:
@@ -123,7 +206,9 @@ def serialize_state(state: TicTacToeInternalState) -> str:
         TURN_KEY: state.turn,
         WINNER_KEY: state.winner,
         TURN_EX_TIME_KEY: state.turn_expiration_time,
-        GAME_EX_TIME_KEY: state.game_expiration_time
+        GAME_EX_TIME_KEY: state.game_expiration_time,
+        WIN_LENGTH_KEY: state.win_length,
+        VERSION_KEY: state.version
     }
     serialized_game = json.dumps(game_dict)
     return serialized_game
@@ -131,7 +216,7 @@ def serialize_state(state: TicTacToeInternalState) -> str:
 
 def deserialize_state(serialized_game: str) -> 'TicTacToeInternalState':
     """Deserialized a stringified internal state."""
-    game_data = json.loads(serialized_game, encoding='utf-8')
+    game_data = json.loads(serialized_game)
     game_id = game_data[ID_KEY]
     player_ids = game_data[PLAYER_IDS_KEY]
     players_list = game_data[PLAYER_KEY]
@@ -141,6 +226,11 @@ def deserialize_state(serialized_game: str) -> 'TicTacToeInternalState':
     winner = game_data[WINNER_KEY]
     game_ex_time = game_data[GAME_EX_TIME_KEY]
     turn_ex_time = game_data[TURN_EX_TIME_KEY]
+    # States saved before other board sizes were supported have no win length
+    win_length = game_data.get(WIN_LENGTH_KEY, DEFAULT_RULES.win_length)
+    # States saved before versions were added get one from their board
+    version = game_data.get(VERSION_KEY)
+    rows, columns = board.shape
     players = [
         PlayerInfo(
             username=player['username'],
@@ -159,7 +249,9 @@ def deserialize_state(serialized_game: str) -> 'TicTacToeInternalState':
         board=board,
         mode=mode,
         turn=turn,
-        winner=winner
+        winner=winner,
+        rules=BoardRules(rows=rows, columns=columns, win_length=win_length),
+        version=version
     )
 
 
@@ -205,12 +297,14 @@ ILLEGAL_MOVE_MESSAGE = 'Illegal move.'
 
 
 def _validate_and_extract_coordinates(
-    move: Move
+    move: Move,
+    rules: BoardRules = DEFAULT_RULES
 ) -> Tuple[Dict[str, int], str]:
     """Validate that the move is legal and return the coordinates to fill.
 
     Args:
         move: the move to be validated
+        rules: BoardRules, the rules giving the size of the board
 
     Returns:
         tuple of:
@@ -237,9 +331,10 @@ def _validate_and_extract_coordinates(
     ):
         return {}, ILLEGAL_MOVE_MESSAGE
 
-    for value in coordinates.values():
-        if value < 0 or value > 3:
-            return {}, ILLEGAL_MOVE_MESSAGE
+    if not 0 <= coordinates[X_COORD] < rules.rows:
+        return {}, ILLEGAL_MOVE_MESSAGE
+    if not 0 <= coordinates[Y_COORD] < rules.columns:
+        return {}, ILLEGAL_MOVE_MESSAGE
 
     return coordinates, ''
 
@@ -275,22 +370,212 @@ def _check_for_game_over(board: np.ndarray) -> Tuple[bool, int]:
     return game_over, winner
 
 
+def _make_line_indices() -> np.ndarray:
+    """Get the flattened cell indices of every line on the standard board.
+
+    The lines are in the same order as the sums in _check_for_game_over:
+    columns, rows, the diagonal, and the anti-diagonal.
+    """
+    size = DEFAULT_RULES.rows
+    cells = np.arange(size * size).reshape([size, size])
+    lines = (
+        [cells[:, column] for column in range(size)] +
+        [cells[row, :] for row in range(size)] +
+        [np.diag(cells), np.diag(np.flip(cells, axis=0))]
+    )
+    return np.array(lines)
+
+
+LINE_INDICES = _make_line_indices()
+
+
+def evaluate_boards(boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Check if the game is over for many standard boards at once.
+
+    Gives the same results as _check_for_game_over on every board, but in a
+    handful of numpy operations for the whole batch instead of a python loop.
+
+    Args:
+        boards: numpy.ndarray, N boards, either of shape (N, 3, 3) or (N, 9)
+
+    Returns:
+        tuple of:
+            numpy.ndarray of bool, shape (N,), True if the game is over
+            numpy.ndarray of int8, shape (N,), index of the winner or -1 for no winner
+    """
+    boards = np.asarray(boards)
+    num_cells = DEFAULT_RULES.rows * DEFAULT_RULES.columns
+    if boards.shape[1:] not in ((DEFAULT_RULES.rows, DEFAULT_RULES.columns), (num_cells,)):
+        raise AssertionError('Boards must have shape (N, 3, 3) or (N, 9). Got {}'.format(
+            boards.shape))
+    cells = boards.reshape([-1, num_cells]).astype(np.int8, copy=False)
+
+    # Sums of every line of every board, shape (N, 8)
+    line_sums = cells[:, LINE_INDICES].sum(axis=2, dtype=np.int8)
+    is_full_line = np.abs(line_sums) == DEFAULT_RULES.win_length
+    has_full_line = is_full_line.any(axis=1)
+    # Like the scalar check, the first full line decides the winner
+    first_full_line = np.argmax(is_full_line, axis=1)
+    first_line_sums = np.take_along_axis(line_sums, first_full_line[:, np.newaxis], axis=1)[:, 0]
+
+    winners = np.full(len(cells), -1, dtype=np.int8)
+    winners[has_full_line & (first_line_sums > 0)] = 0
+    winners[has_full_line & (first_line_sums < 0)] = 1
+    game_over = has_full_line | np.all(cells != 0, axis=1)
+    return game_over, winners
+
+
+# Directions of the lines through a cell: row, column, diagonal, anti-diagonal
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def _check_for_game_over_after_move(
+    board: np.ndarray,
+    move_x: int,
+    move_y: int,
+    win_length: int,
+    num_marks: int
+) -> Tuple[bool, int]:
+    """Check if the last move ended the game on a board of any size.
+
+    Only the four lines through the last move can have a new winner, so this
+    looks at most win_length - 1 cells in each direction along each of them.
+    The board is full once there are as many marks as cells, so a draw is
+    found without looking at the rest of the board either.
+
+    Args:
+        board: numpy.ndarray, the game board after the move
+        move_x: int, the x coordinate of the last move
+        move_y: int, the y coordinate of the last move
+        win_length: int, the number in a row needed to win
+        num_marks: int, the number of marks on the board after the move
+
+    Returns:
+        tuple of bool (True=game over), and int (index of winner or -1 for no winner)
+    """
+    rows, columns = board.shape
+    value = board[move_x, move_y]
+    for step_x, step_y in LINE_DIRECTIONS:
+        line_length = 1
+        for sign in (1, -1):
+            x_coord = move_x + sign * step_x
+            y_coord = move_y + sign * step_y
+            while (
+                line_length < win_length and
+                0 <= x_coord < rows and
+                0 <= y_coord < columns and
+                board[x_coord, y_coord] == value
+            ):
+                line_length += 1
+                x_coord += sign * step_x
+                y_coord += sign * step_y
+        if line_length >= win_length:
+            return True, 0 if value == TURN_SCORES[0] else 1
+
+    if num_marks >= board.size:
+        return True, -1
+    return False, -1
+
+
+# Engines available to check for the end of the game. The full board checks
+# only know the standard 3x3 board, so other boards always use the incremental check.
+NUMPY_ENGINE = 'numpy'
+BITBOARD_ENGINE = 'bitboard'
+INCREMENTAL_ENGINE = 'incremental'
+GAME_OVER_CHECKS = {
+    NUMPY_ENGINE: _check_for_game_over,
+    BITBOARD_ENGINE: bitboard.check_board_for_game_over
+}
+ENGINES = frozenset(GAME_OVER_CHECKS) | {INCREMENTAL_ENGINE}
+DEFAULT_ENGINE = BITBOARD_ENGINE
+
+
+def finish_game(
+    internal_state: TicTacToeInternalState,
+    winner: int
+) -> TicTacToeInternalState:
+    """End the game, for example when a turn runs out or a player forfeits.
+
+    Args:
+        internal_state: the current internal state
+        winner: int, the index of the winning player or -1 for no winner
+
+    Returns:
+        TicTacToeInternalState, the finished game
+    """
+    return internal_state.evolve(
+        mode=FINISHED_MODE,
+        winner=winner,
+        version=internal_state.version + 1
+    )
+
+
+def place_mark(
+    internal_state: TicTacToeInternalState,
+    move_x: int,
+    move_y: int,
+    turn_expiration_time: int,
+    engine: str = DEFAULT_ENGINE,
+    copy_board: bool = True
+) -> TicTacToeInternalState:
+    """Place the current player's mark on an empty cell, without any validation.
+
+    Args:
+        internal_state: the current internal state
+        move_x: int, the x coordinate of the cell
+        move_y: int, the y coordinate of the cell
+        turn_expiration_time: int, the time at which the next turn expires
+        engine: str, the engine used to check if the game is over
+        copy_board: bool, False to place the mark on the board of the current
+            state, which then must not be used again
+
+    Returns:
+        TicTacToeInternalState, the state after the move
+    """
+    # Only the board is copied so as not to modify the original state
+    new_board = internal_state.board.copy() if copy_board else internal_state.board
+    new_board[move_x, move_y] = TURN_SCORES[internal_state.turn]
+
+    rules = internal_state.rules
+    if engine == INCREMENTAL_ENGINE or rules != DEFAULT_RULES:
+        # In play, every change to the game so far has placed a mark
+        is_game_over, game_winner = _check_for_game_over_after_move(
+            new_board, move_x, move_y, rules.win_length, internal_state.version + 1)
+    else:
+        check_for_game_over = GAME_OVER_CHECKS[engine]
+        is_game_over, game_winner = check_for_game_over(new_board)
+    return internal_state.evolve(
+        board=new_board,
+        turn=(internal_state.turn + 1) % 2,
+        turn_expiration_time=turn_expiration_time,
+        mode=FINISHED_MODE if is_game_over else internal_state.mode,
+        winner=game_winner if is_game_over else internal_state.winner,
+        version=internal_state.version + 1
+    )
+
+
 def make_move(
     internal_state: TicTacToeInternalState,
     move: Move,
-    player_id: str
+    player_id: str,
+    engine: str = DEFAULT_ENGINE
 ) -> Tuple[str, Optional[TicTacToeInternalState]]:
     """Attempt to make a move.
 
     Args:
         internal_state: the current internal state
         move: the move to attempt
+        player_id: str, the player attempting the move
+        engine: str, the engine used to check if the game is over
 
     Returns:
         Tuple of:
             str, a return message
             maybe(internal state), the new internal state if the move was a success
     """
+    if engine not in ENGINES:
+        raise AssertionError('Unknown game engine {}.'.format(engine))
+
     # First validate the move
     is_validated, message = _validate_game_state(internal_state, player_id)
     if not is_validated:
@@ -300,19 +585,14 @@ def make_move(
     current_time = arrow.utcnow().float_timestamp
     if current_time > internal_state.turn_expiration_time:
         # Turn has expired
-        new_internal_state = copy.deepcopy(internal_state)
-        new_internal_state.mode = FINISHED_MODE
-        new_internal_state.winner = (new_internal_state.turn + 1) % 2
+        new_internal_state = finish_game(internal_state, (internal_state.turn + 1) % 2)
     elif current_time > internal_state.game_expiration_time:
         # Game has expired
         logger.info('Game {} has expired'.format(internal_state.id))
-        new_internal_state = copy.deepcopy(internal_state)
-        new_internal_state.mode = FINISHED_MODE
-        new_internal_state.winner = -1
+        new_internal_state = finish_game(internal_state, -1)
     else:
-        score = TURN_SCORES[internal_state.turn]
-
-        coordinates, message = _validate_and_extract_coordinates(move)
+        rules = internal_state.rules
+        coordinates, message = _validate_and_extract_coordinates(move, rules)
         if not coordinates:
             return message, None
 
@@ -323,16 +603,13 @@ def make_move(
             return 'Position already filled.', None
 
         # Make the move
-        # We first want to copy the state so as not to modify the original state
-        new_internal_state = copy.deepcopy(internal_state)
-        new_internal_state.board[move_x, move_y] = score
-        new_internal_state.turn = (new_internal_state.turn + 1) % 2
-        new_internal_state.turn_expiration_time = int(current_time + TURN_EXPIRATION_TIME)
-
-        is_game_over, game_winner = _check_for_game_over(new_internal_state.board)
-        if is_game_over:
-            new_internal_state.mode = FINISHED_MODE
-            new_internal_state.winner = game_winner
+        new_internal_state = place_mark(
+            internal_state,
+            move_x,
+            move_y,
+            int(current_time + TURN_EXPIRATION_TIME),
+            engine=engine
+        )
 
         message = 'Success.'
 
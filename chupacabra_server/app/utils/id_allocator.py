@@ -0,0 +1,45 @@
+import base64
+import secrets
+import threading
+from typing import List
+
+
+# 128 random bits make a collision so unlikely that ids never need to be
+# checked against the ones already in use, so making one costs no round trip.
+ID_BYTES = 16
+DEFAULT_BATCH_SIZE = 256
+
+
+class IdAllocator:
+    def __init__(self, id_bytes: int = ID_BYTES, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """Hands out random url-safe ids, drawing the randomness for many ids at once.
+
+        Thread safe.
+
+        Args:
+            id_bytes: int, the number of random bytes in an id
+            batch_size: int, the number of ids to prefetch at a time
+        """
+        if id_bytes < ID_BYTES or batch_size < 1:
+            raise AssertionError('Illegal id size {} or batch size {}.'.format(
+                id_bytes, batch_size))
+        self._id_bytes = id_bytes
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+
+    def _make_batch(self) -> List[str]:
+        """Make a batch of ids from one draw of random bytes."""
+        random_bytes = secrets.token_bytes(self._id_bytes * self._batch_size)
+        return [
+            base64.urlsafe_b64encode(
+                random_bytes[start:start + self._id_bytes]).rstrip(b'=').decode('ascii')
+            for start in range(0, len(random_bytes), self._id_bytes)
+        ]
+
+    def next_id(self) -> str:
+        """Get an id that has never been handed out."""
+        with self._lock:
+            if not self._ids:
+                self._ids = self._make_batch()
+            return self._ids.pop()
@@ -0,0 +1,48 @@
+import threading
+from typing import Any, Iterator
+
+import grpc
+
+
+# On a synchronous grpc server, each open stream holds one worker thread for
+# as long as it is open. So a server runs with max_workers threads for its
+# unary calls plus one for each stream it allows, and streams over the limit
+# are turned away instead of taking the threads the unary calls need.
+DEFAULT_MAX_STREAMS = 100
+TOO_MANY_STREAMS_MESSAGE = 'Too many open streams. Please try again later, or poll instead.'
+
+
+class StreamLimit:
+    def __init__(self, max_streams: int = DEFAULT_MAX_STREAMS) -> None:
+        """Caps the number of streaming calls a server has open at once.
+
+        Thread safe.
+
+        Args:
+            max_streams: int, the most streams open at once
+        """
+        if max_streams < 1:
+            raise AssertionError('Illegal stream limit {}.'.format(max_streams))
+        self._max_streams = max_streams
+        self._semaphore = threading.BoundedSemaphore(max_streams)
+
+    @property
+    def max_streams(self) -> int:
+        """The most streams open at once."""
+        return self._max_streams
+
+    def stream(self, responses: Iterator[Any], context: grpc.ServicerContext) -> Iterator[Any]:
+        """Send the responses of a streaming call if there is room for another stream.
+
+        Otherwise the call is aborted with RESOURCE_EXHAUSTED.
+
+        Args:
+            responses: iterator, the responses of the call, not started yet
+            context: grpc.ServicerContext, the context of the call
+        """
+        if not self._semaphore.acquire(blocking=False):
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, TOO_MANY_STREAMS_MESSAGE)
+        try:
+            yield from responses
+        finally:
+            self._semaphore.release()
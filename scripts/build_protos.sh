@@ -1,13 +1,15 @@
 #!/bin/bash
 
+CWD=$PWD
+cd chupacabra_client
 python -m grpc_tools.protoc -I. --python_out=. \
        --grpc_python_out=. chupacabra_client/protos/game_structs.proto
 
 python -m grpc_tools.protoc -I. --python_out=. \
        --grpc_python_out=. chupacabra_client/protos/chupacabra.proto
+cd $CWD
 
-CWD=$PWD
-cd chupacabra_server
-python -m grpc_tools.protoc -I. -I.. --python_out=. \
+cd chupacabra_server/app
+python -m grpc_tools.protoc -I. -I../../chupacabra_client --python_out=. \
        --grpc_python_out=. protos/game_server.proto
 cd $CWD